@@ -7,7 +7,8 @@ from src.core.constants import (
     NATIVE_WIDTH, NATIVE_HEIGHT,
     WINDOW_WIDTH, WINDOW_HEIGHT,
     SCALE_FACTOR, FPS, GAME_TITLE,
-    COLOR_BLACK, COLOR_GRAY, COLOR_YELLOW, COLOR_WHITE, COLOR_RED
+    COLOR_BLACK, COLOR_GRAY, COLOR_YELLOW, COLOR_WHITE, COLOR_RED,
+    COLOR_GREEN, COLOR_BLUE
 )
 from src.core.state_machine import StateMachine, GameState
 from src.entities.player import Player
@@ -17,12 +18,14 @@ from src.entities.interactable import (
     ToxicBasin, BlessedSpring, SleeplessStatue, Chasm,
     InteractableType
 )
-from src.entities.enemy import create_enemy, EnemyType
+from src.entities.enemy import create_enemy, EnemyType, EnemyManager
 from src.entities.npc import create_npc, NPCType, Cat
+from src.entities.pool import InteractablePool, ItemPool, NPCPool
+from src.entities.sprites import solid_sprite
 from src.world.world import World
 from src.world.camera import Camera
 from src.world.screen import Direction, ScreenID
-from src.ui.hud import HUD
+from src.ui.hud import HUD, get_font
 from src.ui.crt_effect import CRTEffectScaled
 from src.ui.particles import ParticleSystem
 from src.audio import SoundManager, SoundType, AmbientManager, AmbienceType
@@ -72,6 +75,14 @@ class Game:
         # NPC tracking
         self.cat = None  # The cat companion
 
+        # Enemy AI driver
+        self.enemy_manager = EnemyManager()
+
+        # Proximity pools for the current screen
+        self.interactable_pool = InteractablePool()
+        self.item_pool = ItemPool()
+        self.npc_pool = NPCPool()
+
         # World and camera
         self.world = World()
         self.camera = Camera()
@@ -121,40 +132,40 @@ class Game:
         # Hub - spawn some keys and crystals
         hub = self.world.get_screen(ScreenID.TOWER_HUB)
         # Commented out test items from hub - player should find these in the world
-        # hub.entities.append(create_item(ItemType.GOLD_KEY, 40, 40))
-        # hub.entities.append(create_item(ItemType.SWORD, 120, 40))
+        # hub.add_entity(create_item(ItemType.GOLD_KEY, 40, 40))
+        # hub.add_entity(create_item(ItemType.SWORD, 120, 40))
 
         # Gardens - spawn acorn and green crystal
         gardens_2 = self.world.get_screen(ScreenID.GARDENS_2)
-        gardens_2.entities.append(create_item(ItemType.ACORN, 60, 60))
+        gardens_2.add_entity(create_item(ItemType.ACORN, 60, 60))
 
         gardens_4 = self.world.get_screen(ScreenID.GARDENS_4)
-        gardens_4.entities.append(create_item(ItemType.GREEN_CRYSTAL, 80, 96))
+        gardens_4.add_entity(create_item(ItemType.GREEN_CRYSTAL, 80, 96))
 
         # Catacombs - spawn bomb and red crystal
         catacombs_2 = self.world.get_screen(ScreenID.CATACOMBS_2)
-        catacombs_2.entities.append(create_item(ItemType.BOMB, 50, 80))
+        catacombs_2.add_entity(create_item(ItemType.BOMB, 50, 80))
 
         catacombs_4 = self.world.get_screen(ScreenID.CATACOMBS_4)
-        catacombs_4.entities.append(create_item(ItemType.RED_CRYSTAL, 80, 96))
+        catacombs_4.add_entity(create_item(ItemType.RED_CRYSTAL, 80, 96))
 
         # Ruins - spawn chalice and blue crystal
         ruins_2 = self.world.get_screen(ScreenID.RUINS_2)
-        ruins_2.entities.append(create_item(ItemType.CHALICE, 70, 70))
+        ruins_2.add_entity(create_item(ItemType.CHALICE, 70, 70))
 
         ruins_3 = self.world.get_screen(ScreenID.RUINS_3)
-        ruins_3.entities.append(create_item(ItemType.BLUE_CRYSTAL, 80, 96))
+        ruins_3.add_entity(create_item(ItemType.BLUE_CRYSTAL, 80, 96))
 
         # Cliffs - spawn flute and yellow crystal
         cliffs_2 = self.world.get_screen(ScreenID.CLIFFS_2)
-        cliffs_2.entities.append(create_item(ItemType.FLUTE, 65, 75))
+        cliffs_2.add_entity(create_item(ItemType.FLUTE, 65, 75))
 
         cliffs_4 = self.world.get_screen(ScreenID.CLIFFS_4)
-        cliffs_4.entities.append(create_item(ItemType.YELLOW_CRYSTAL, 80, 96))
+        cliffs_4.add_entity(create_item(ItemType.YELLOW_CRYSTAL, 80, 96))
 
         # Add silver key to catacombs
         catacombs_3 = self.world.get_screen(ScreenID.CATACOMBS_3)
-        catacombs_3.entities.append(create_item(ItemType.SILVER_KEY, 80, 60))
+        catacombs_3.add_entity(create_item(ItemType.SILVER_KEY, 80, 60))
 
         print("Test items spawned in world")
 
@@ -164,26 +175,26 @@ class Game:
         hub = self.world.get_screen(ScreenID.TOWER_HUB)
 
         # Four corner pedestals with colored outlines
-        from src.core.constants import COLOR_GREEN, COLOR_RED, COLOR_BLUE, COLOR_YELLOW
         pedestal_green = Pedestal(24, 24, ItemType.GREEN_CRYSTAL, COLOR_GREEN)
         pedestal_red = Pedestal(120, 24, ItemType.RED_CRYSTAL, COLOR_RED)
         pedestal_blue = Pedestal(24, 152, ItemType.BLUE_CRYSTAL, COLOR_BLUE)
         pedestal_yellow = Pedestal(120, 152, ItemType.YELLOW_CRYSTAL, COLOR_YELLOW)
 
-        hub.entities.extend([pedestal_green, pedestal_red, pedestal_blue, pedestal_yellow])
+        for pedestal in (pedestal_green, pedestal_red, pedestal_blue, pedestal_yellow):
+            hub.add_entity(pedestal)
 
         # Add fountain in hub for watering can refills
         fountain = Fountain(80, 96)
-        hub.entities.append(fountain)
+        hub.add_entity(fountain)
 
         # Gardens - Tree Bridge puzzle
         gardens_3 = self.world.get_screen(ScreenID.GARDENS_3)
         soft_dirt = SoftDirt(48, 80)
-        gardens_3.entities.append(soft_dirt)
+        gardens_3.add_entity(soft_dirt)
 
         gardens_4 = self.world.get_screen(ScreenID.GARDENS_4)
         chasm = Chasm(64, 48, 32, 16)  # Horizontal chasm
-        gardens_4.entities.append(chasm)
+        gardens_4.add_entity(chasm)
         # Store reference for puzzle
         self.tree_chasm = chasm
         self.tree_dirt = soft_dirt
@@ -191,29 +202,29 @@ class Game:
         # Catacombs - Gold Gate and Cracked Wall
         catacombs_1 = self.world.get_screen(ScreenID.CATACOMBS_1)
         gold_gate = Gate(72, 48, 16, 32, InteractableType.GOLD_GATE, ItemType.GOLD_KEY, COLOR_YELLOW)
-        catacombs_1.entities.append(gold_gate)
+        catacombs_1.add_entity(gold_gate)
 
         catacombs_4 = self.world.get_screen(ScreenID.CATACOMBS_4)
         cracked_wall = CrackedWall(80, 64)
-        catacombs_4.entities.append(cracked_wall)
+        catacombs_4.add_entity(cracked_wall)
 
         # Ruins - Toxic Basin and Blessed Spring
         ruins_3 = self.world.get_screen(ScreenID.RUINS_3)
         toxic_basin = ToxicBasin(60, 80, 24, 24)
-        ruins_3.entities.append(toxic_basin)
+        ruins_3.add_entity(toxic_basin)
 
         ruins_4 = self.world.get_screen(ScreenID.RUINS_4)
         blessed_spring = BlessedSpring(80, 80)
-        ruins_4.entities.append(blessed_spring)
+        ruins_4.add_entity(blessed_spring)
 
         # Cliffs - Sleepless Statue
         cliffs_4 = self.world.get_screen(ScreenID.CLIFFS_4)
         statue = SleeplessStatue(80, 80)
-        cliffs_4.entities.append(statue)
+        cliffs_4.add_entity(statue)
 
         # Hub - Silver Gate (blocks path to final chamber)
         silver_gate = Gate(80, 20, 16, 16, InteractableType.SILVER_GATE, ItemType.SILVER_KEY, COLOR_GRAY)
-        hub.entities.append(silver_gate)
+        hub.add_entity(silver_gate)
         # Store reference for crystal activation
         self.silver_gate = silver_gate
 
@@ -223,33 +234,33 @@ class Game:
         """Spawn enemies in various screens"""
         # Gardens - Crawlers (Tier 1)
         gardens_2 = self.world.get_screen(ScreenID.GARDENS_2)
-        gardens_2.entities.append(create_enemy(EnemyType.CRAWLER, 40, 60))
-        gardens_2.entities.append(create_enemy(EnemyType.CRAWLER, 100, 80))
+        gardens_2.add_entity(create_enemy(EnemyType.CRAWLER, 40, 60))
+        gardens_2.add_entity(create_enemy(EnemyType.CRAWLER, 100, 80))
 
         gardens_3 = self.world.get_screen(ScreenID.GARDENS_3)
-        gardens_3.entities.append(create_enemy(EnemyType.CRAWLER, 80, 40))
+        gardens_3.add_entity(create_enemy(EnemyType.CRAWLER, 80, 40))
 
         # Catacombs - Chasers (Tier 2)
         catacombs_2 = self.world.get_screen(ScreenID.CATACOMBS_2)
-        catacombs_2.entities.append(create_enemy(EnemyType.CHASER, 100, 100))
+        catacombs_2.add_entity(create_enemy(EnemyType.CHASER, 100, 100))
 
         catacombs_3 = self.world.get_screen(ScreenID.CATACOMBS_3)
-        catacombs_3.entities.append(create_enemy(EnemyType.CHASER, 60, 80))
-        catacombs_3.entities.append(create_enemy(EnemyType.CHASER, 90, 60))
+        catacombs_3.add_entity(create_enemy(EnemyType.CHASER, 60, 80))
+        catacombs_3.add_entity(create_enemy(EnemyType.CHASER, 90, 60))
 
         # Ruins - Mix of Crawlers and Chasers
         ruins_2 = self.world.get_screen(ScreenID.RUINS_2)
-        ruins_2.entities.append(create_enemy(EnemyType.CRAWLER, 50, 100))
-        ruins_2.entities.append(create_enemy(EnemyType.CHASER, 110, 90))
+        ruins_2.add_entity(create_enemy(EnemyType.CRAWLER, 50, 100))
+        ruins_2.add_entity(create_enemy(EnemyType.CHASER, 110, 90))
 
         # Cliffs - Sentinels (Tier 3) with patrol routes
         cliffs_2 = self.world.get_screen(ScreenID.CLIFFS_2)
         waypoints_1 = [(40, 40), (120, 40), (120, 140), (40, 140)]
-        cliffs_2.entities.append(create_enemy(EnemyType.SENTINEL, 40, 40, waypoints_1))
+        cliffs_2.add_entity(create_enemy(EnemyType.SENTINEL, 40, 40, waypoints_1))
 
         cliffs_3 = self.world.get_screen(ScreenID.CLIFFS_3)
         waypoints_2 = [(60, 60), (100, 60), (80, 120)]
-        cliffs_3.entities.append(create_enemy(EnemyType.SENTINEL, 60, 60, waypoints_2))
+        cliffs_3.add_entity(create_enemy(EnemyType.SENTINEL, 60, 60, waypoints_2))
 
         print("Enemies spawned in world")
 
@@ -258,16 +269,16 @@ class Game:
         # The Owl - in Gardens (North Biome)
         gardens_2 = self.world.get_screen(ScreenID.GARDENS_2)
         owl = create_npc(NPCType.OWL, 100, 40)
-        gardens_2.entities.append(owl)
+        gardens_2.add_entity(owl)
 
         # The Cat - in Tower Hub
         hub = self.world.get_screen(ScreenID.TOWER_HUB)
         self.cat = create_npc(NPCType.CAT, 120, 120)
-        hub.entities.append(self.cat)
+        hub.add_entity(self.cat)
 
         # Add Fish item to a screen for Cat interaction
         gardens_3 = self.world.get_screen(ScreenID.GARDENS_3)
-        gardens_3.entities.append(create_item(ItemType.FISH, 30, 40))
+        gardens_3.add_entity(create_item(ItemType.FISH, 30, 40))
 
         print("NPCs spawned in world")
 
@@ -277,7 +288,7 @@ class Game:
 
         # Spawn The Void boss in the center
         self.boss = create_enemy(EnemyType.VOID, 80, 96)
-        final_chamber.entities.append(self.boss)
+        final_chamber.add_entity(self.boss)
 
         print("Final chamber prepared with The Void")
 
@@ -356,6 +367,8 @@ class Game:
             return
 
         current_screen = self.world.get_current_screen()
+        player_cx = self.player.x + self.player.width / 2
+        player_cy = self.player.y + self.player.height / 2
 
         # If player is holding an item
         if self.player.has_item():
@@ -363,94 +376,90 @@ class Game:
             interacted = False
 
             # First, try to use item on nearby interactables
-            for entity in current_screen.entities:
-                if hasattr(entity, 'interactable_type'):
-                    if entity.is_near_player(
-                        self.player.x, self.player.y,
-                        self.player.width, self.player.height
-                    ):
-                        result = entity.interact(held_item)
-                        if result:
-                            print(f"Used {held_item.get_name()} on {entity.get_name()}")
-                            interacted = True
-
-                            # Handle different interaction results
-                            if result == "filled":
-                                # Item was transformed (watering can/chalice filled)
-                                print(f"-> {held_item.get_name()}")
-                                break
-                            elif result == "planted":
-                                # Acorn planted in dirt
-                                self.player.drop_item()
-                                print("Acorn planted in soft dirt")
-                                break
-                            elif result == "grow_tree":
-                                # Water planted acorn to grow tree bridge
-                                if hasattr(self, 'tree_chasm'):
-                                    self.tree_chasm.grow_bridge()
-                                    print("A tree grows across the chasm!")
-                                # Empty the watering can
-                                held_item.item_type = ItemType.WATERING_CAN
-                                held_item.color = COLOR_GRAY
-                                held_item.sprite.fill(COLOR_GRAY)
-                                break
-                            elif result == "bomb_placed":
-                                # Bomb placed at wall - drop it and it will explode
-                                dropped = self.player.drop_item()
-                                dropped.x = entity.x
-                                dropped.y = entity.y
-                                dropped.active = True
-                                current_screen.entities.append(dropped)
-                                # Mark wall for destruction
-                                entity.is_activated = True
-                                entity.solid = False
-                                entity.active = False
-                                self.sound_manager.play_sound(SoundType.BOMB_TIMER)
-                                # Add explosion particle effect
-                                self.particles.add_explosion(entity.x + entity.width // 2,
-                                                            entity.y + entity.height // 2,
-                                                            color=(255, 150, 0), count=20)
-                                print("Bomb placed! The wall crumbles!")
-                                # Respawn bomb at original location
-                                catacombs_2 = self.world.get_screen(ScreenID.CATACOMBS_2)
-                                catacombs_2.entities.append(create_item(ItemType.BOMB, 50, 80))
-                                break
-                            elif result == "cleansed":
-                                # Toxic basin cleansed
-                                print("The toxic slime recedes!")
-                                # Empty the chalice
-                                self.player.drop_item()
-                                break
-                            elif result == "sleeping":
-                                # Statue put to sleep
-                                self.sound_manager.play_sound(SoundType.FLUTE_MELODY)
-                                print("The statue's eyes close... it sleeps.")
-                                break
-                            elif result is True:
-                                # Generic success (like pedestal)
-                                # Check if it's a crystal being placed
-                                if hasattr(entity, 'interactable_type') and 'PEDESTAL' in str(entity.interactable_type):
-                                    crystal_type = held_item.item_type
-                                    if crystal_type in self.crystals_placed:
-                                        self.crystals_placed[crystal_type] = True
-                                        self.sound_manager.play_sound(SoundType.CRYSTAL_PLACE)
-                                        # Add sparkle effect at pedestal
-                                        self.particles.add_sparkle(entity.x + entity.width // 2,
-                                                                   entity.y + entity.height // 2,
-                                                                   held_item.color)
-                                        print(f"Crystal placed: {held_item.get_name()}")
-                                        # Check if all crystals are now placed
-                                        self._check_crystal_activation()
-                                # Check for gate opening
-                                elif hasattr(entity, 'interactable_type') and 'GATE' in str(entity.interactable_type):
-                                    self.sound_manager.play_sound(SoundType.GATE_OPEN)
-                                    # Add dust puff when gate opens
-                                    self.particles.add_dust(entity.x + entity.width // 2,
-                                                           entity.y + entity.height)
-                                # Consume the item
-                                self.player.drop_item()
-                                print(f"{entity.get_name()} activated!")
-                                break
+            self.interactable_pool.sync(current_screen)
+            for entity in self.interactable_pool.near(player_cx, player_cy):
+                result = entity.interact(held_item)
+                if result:
+                    print(f"Used {held_item.get_name()} on {entity.get_name()}")
+                    interacted = True
+
+                    # Handle different interaction results
+                    if result == "filled":
+                        # Item was transformed (watering can/chalice filled)
+                        print(f"-> {held_item.get_name()}")
+                        break
+                    elif result == "planted":
+                        # Acorn planted in dirt
+                        self.player.drop_item()
+                        print("Acorn planted in soft dirt")
+                        break
+                    elif result == "grow_tree":
+                        # Water planted acorn to grow tree bridge
+                        if hasattr(self, 'tree_chasm'):
+                            self.tree_chasm.grow_bridge()
+                            print("A tree grows across the chasm!")
+                        # Empty the watering can
+                        held_item.item_type = ItemType.WATERING_CAN
+                        held_item.color = COLOR_GRAY
+                        held_item.sprite = solid_sprite(held_item.size, held_item.size, COLOR_GRAY)
+                        break
+                    elif result == "bomb_placed":
+                        # Bomb placed at wall - drop it and it will explode
+                        dropped = self.player.drop_item()
+                        dropped.x = entity.x
+                        dropped.y = entity.y
+                        dropped.active = True
+                        current_screen.add_entity(dropped)
+                        # Mark wall for destruction
+                        entity.is_activated = True
+                        entity.solid = False
+                        entity.active = False
+                        self.sound_manager.play_sound(SoundType.BOMB_TIMER)
+                        # Add explosion particle effect
+                        self.particles.add_explosion(entity.x + entity.width // 2,
+                                                    entity.y + entity.height // 2,
+                                                    color=(255, 150, 0), count=20)
+                        print("Bomb placed! The wall crumbles!")
+                        # Respawn bomb at original location
+                        catacombs_2 = self.world.get_screen(ScreenID.CATACOMBS_2)
+                        catacombs_2.add_entity(create_item(ItemType.BOMB, 50, 80))
+                        break
+                    elif result == "cleansed":
+                        # Toxic basin cleansed
+                        print("The toxic slime recedes!")
+                        # Empty the chalice
+                        self.player.drop_item()
+                        break
+                    elif result == "sleeping":
+                        # Statue put to sleep
+                        self.sound_manager.play_sound(SoundType.FLUTE_MELODY)
+                        print("The statue's eyes close... it sleeps.")
+                        break
+                    elif result is True:
+                        # Generic success (like pedestal)
+                        # Check if it's a crystal being placed
+                        if hasattr(entity, 'interactable_type') and 'PEDESTAL' in entity.interactable_type.name:
+                            crystal_type = held_item.item_type
+                            if crystal_type in self.crystals_placed:
+                                self.crystals_placed[crystal_type] = True
+                                self.sound_manager.play_sound(SoundType.CRYSTAL_PLACE)
+                                # Add sparkle effect at pedestal
+                                self.particles.add_sparkle(entity.x + entity.width // 2,
+                                                           entity.y + entity.height // 2,
+                                                           held_item.color)
+                                print(f"Crystal placed: {held_item.get_name()}")
+                                # Check if all crystals are now placed
+                                self._check_crystal_activation()
+                        # Check for gate opening
+                        elif hasattr(entity, 'interactable_type') and 'GATE' in entity.interactable_type.name:
+                            self.sound_manager.play_sound(SoundType.GATE_OPEN)
+                            # Add dust puff when gate opens
+                            self.particles.add_dust(entity.x + entity.width // 2,
+                                                   entity.y + entity.height)
+                        # Consume the item
+                        self.player.drop_item()
+                        print(f"{entity.get_name()} activated!")
+                        break
 
             # If didn't interact with anything, drop the item
             if not interacted:
@@ -460,47 +469,41 @@ class Game:
                     dropped_item.x = self.player.x + self.player.width // 2 - dropped_item.size // 2
                     dropped_item.y = self.player.y + self.player.height // 2 - dropped_item.size // 2
                     dropped_item.active = True
-                    current_screen.entities.append(dropped_item)
+                    current_screen.add_entity(dropped_item)
                     self.sound_manager.play_sound(SoundType.DROP)
                     print(f"Dropped: {dropped_item.get_name()}")
 
                     # Check if Fish was dropped near Cat
-                    if dropped_item.item_type == ItemType.FISH and self.cat:
-                        for entity in current_screen.entities:
-                            if hasattr(entity, 'npc_type') and entity.npc_type == NPCType.CAT:
-                                # Check if fish is near cat
-                                if entity.is_near_player(dropped_item.x, dropped_item.y,
-                                                        dropped_item.size, dropped_item.size,
-                                                        distance=30):
-                                    entity.activate_following()
-                                    # Remove the fish
-                                    current_screen.entities.remove(dropped_item)
-                                    break
+                    if dropped_item.item_type is ItemType.FISH and self.cat:
+                        self.npc_pool.sync(current_screen)
+                        fish_cx = dropped_item.x + dropped_item.size // 2
+                        fish_cy = dropped_item.y + dropped_item.size // 2
+                        for entity in self.npc_pool.near(fish_cx, fish_cy, distance=30):
+                            if entity.npc_type == NPCType.CAT:
+                                entity.activate_following()
+                                # Remove the fish
+                                current_screen.remove_entity(dropped_item)
+                                break
         else:
             # Try to pick up an item
-            for entity in current_screen.entities:
-                # Check if it's an item (has item_type attribute)
-                if hasattr(entity, 'item_type'):
-                    if entity.is_near_player(
-                        self.player.x, self.player.y,
-                        self.player.width, self.player.height
-                    ):
-                        # Check if it's the Ring of Eternity
-                        if entity.item_type == ItemType.RING_OF_ETERNITY:
-                            print("\n" + "=" * 50)
-                            print("YOU HAVE CLAIMED THE RING OF ETERNITY!")
-                            print("=" * 50 + "\n")
-                            self.sound_manager.play_sound(SoundType.VICTORY)
-                            entity.active = False
-                            current_screen.entities.remove(entity)
-                            self.state_machine.change_state(GameState.WIN)
-                            break
-                        elif self.player.pick_up_item(entity):
-                            entity.active = False
-                            current_screen.entities.remove(entity)
-                            self.sound_manager.play_sound(SoundType.PICKUP)
-                            print(f"Picked up: {entity.get_name()}")
-                            break
+            self.item_pool.sync(current_screen)
+            for entity in self.item_pool.near(player_cx, player_cy):
+                # Check if it's the Ring of Eternity
+                if entity.item_type is ItemType.RING_OF_ETERNITY:
+                    print("\n" + "=" * 50)
+                    print("YOU HAVE CLAIMED THE RING OF ETERNITY!")
+                    print("=" * 50 + "\n")
+                    self.sound_manager.play_sound(SoundType.VICTORY)
+                    entity.active = False
+                    current_screen.remove_entity(entity)
+                    self.state_machine.change_state(GameState.WIN)
+                    break
+                elif self.player.pick_up_item(entity):
+                    entity.active = False
+                    current_screen.remove_entity(entity)
+                    self.sound_manager.play_sound(SoundType.PICKUP)
+                    print(f"Picked up: {entity.get_name()}")
+                    break
 
     def update(self):
         """Update game logic"""
@@ -540,9 +543,8 @@ class Game:
                 self.sound_manager.play_walk_sound()
 
             # Update enemies
-            for entity in current_screen.entities:
-                if hasattr(entity, 'enemy_type'):
-                    entity.update(self.player.x, self.player.y, current_screen)
+            self.enemy_manager.update(current_screen.enemies, self.player.x, self.player.y,
+                                      current_screen)
 
             # Update NPCs
             for entity in current_screen.entities:
@@ -577,19 +579,14 @@ class Game:
                     # Move cat to new screen if following
                     if self.cat and self.cat.following:
                         # Remove cat from old screen
-                        for screen_id in [ScreenID.TOWER_HUB, ScreenID.GARDENS_1, ScreenID.GARDENS_2,
-                                        ScreenID.GARDENS_3, ScreenID.GARDENS_4, ScreenID.CATACOMBS_1,
-                                        ScreenID.CATACOMBS_2, ScreenID.CATACOMBS_3, ScreenID.CATACOMBS_4,
-                                        ScreenID.RUINS_1, ScreenID.RUINS_2, ScreenID.RUINS_3, ScreenID.RUINS_4,
-                                        ScreenID.CLIFFS_1, ScreenID.CLIFFS_2, ScreenID.CLIFFS_3, ScreenID.CLIFFS_4]:
-                            screen = self.world.get_screen(screen_id)
-                            screen.entities = [e for e in screen.entities
-                                             if not (hasattr(e, 'npc_type') and e.npc_type == NPCType.CAT)]
+                        for screen in self.world.screens:
+                            if self.cat in screen.entities:
+                                screen.remove_entity(self.cat)
 
                         # Add cat to new screen at player position
                         new_screen = self.world.get_current_screen()
                         self.cat.set_position(new_x, new_y + 20)  # Slightly behind player
-                        new_screen.entities.append(self.cat)
+                        new_screen.add_entity(self.cat)
 
         elif self.state_machine.is_state(GameState.CLIMAX):
             # Boss fight state
@@ -609,7 +606,7 @@ class Game:
                 # Check if player hit boss with sword
                 player_has_sword = (self.player.held_item and
                                    hasattr(self.player.held_item, 'item_type') and
-                                   self.player.held_item.item_type == ItemType.SWORD)
+                                   self.player.held_item.item_type is ItemType.SWORD)
 
                 if player_has_sword and self.boss.is_colliding_with_player(
                     self.player.x, self.player.y,
@@ -622,7 +619,7 @@ class Game:
                         self.boss_defeated = True
                         # Spawn Ring of Eternity
                         ring = create_item(ItemType.RING_OF_ETERNITY, NATIVE_WIDTH // 2 - 6, NATIVE_HEIGHT // 2 - 6)
-                        current_screen.entities.append(ring)
+                        current_screen.add_entity(ring)
                         print("\n" + "=" * 50)
                         print("THE VOID HAS BEEN DEFEATED!")
                         print("The Ring of Eternity appears...")
@@ -662,10 +659,10 @@ class Game:
         """
         player_has_sword = (self.player.held_item and
                            hasattr(self.player.held_item, 'item_type') and
-                           self.player.held_item.item_type == ItemType.SWORD)
+                           self.player.held_item.item_type is ItemType.SWORD)
 
-        for entity in current_screen.entities:
-            if hasattr(entity, 'enemy_type') and entity.alive:
+        for entity in current_screen.enemies[:]:
+            if entity.alive:
                 # Check collision with player
                 if entity.is_colliding_with_player(
                     self.player.x, self.player.y,
@@ -677,7 +674,7 @@ class Game:
                     if player_has_sword and not is_immune:
                         # Player kills enemy
                         entity.alive = False
-                        current_screen.entities.remove(entity)
+                        current_screen.remove_entity(entity)
                         self.sound_manager.play_sound(SoundType.SWORD_HIT)
                         self.sound_manager.play_sound(SoundType.ENEMY_DEATH)
                         # Add small explosion effect at enemy position
@@ -715,7 +712,7 @@ class Game:
                 dropped_item.x = self.player.x
                 dropped_item.y = self.player.y
                 dropped_item.active = True
-                current_screen.entities.append(dropped_item)
+                current_screen.add_entity(dropped_item)
                 print(f"Dropped {dropped_item.get_name()} at death location")
 
         # Respawn player at hub
@@ -810,35 +807,33 @@ class Game:
         Args:
             current_screen: Current screen
         """
-        for entity in current_screen.entities:
-            # Check if it's an interactable or item
-            is_interactable = hasattr(entity, 'interactable_type')
-            is_item = hasattr(entity, 'item_type')
-
-            if (is_interactable or is_item) and entity.active:
-                # Check if player is near
-                if entity.is_near_player(
-                    self.player.x, self.player.y,
-                    self.player.width, self.player.height
-                ):
-                    # Draw white outline
-                    outline_rect = pygame.Rect(
-                        int(entity.x - 1),
-                        int(entity.y - 1),
-                        entity.width + 2 if hasattr(entity, 'width') else entity.size + 2,
-                        entity.height + 2 if hasattr(entity, 'height') else entity.size + 2
-                    )
-                    pygame.draw.rect(self.native_surface, COLOR_WHITE, outline_rect, 1)
+        player_cx = self.player.x + self.player.width / 2
+        player_cy = self.player.y + self.player.height / 2
+
+        # One vectorized proximity pass per pool
+        self.interactable_pool.sync(current_screen)
+        self.item_pool.sync(current_screen)
+        nearby = (self.interactable_pool.near(player_cx, player_cy) +
+                  self.item_pool.near(player_cx, player_cy))
+
+        for entity in nearby:
+            if entity.active:
+                # Draw white outline
+                outline_rect = pygame.Rect(
+                    int(entity.x - 1),
+                    int(entity.y - 1),
+                    entity.width + 2 if hasattr(entity, 'width') else entity.size + 2,
+                    entity.height + 2 if hasattr(entity, 'height') else entity.size + 2
+                )
+                pygame.draw.rect(self.native_surface, COLOR_WHITE, outline_rect, 1)
 
     def _render_victory_screen(self):
         """Render the victory screen"""
         # Fill with dark background
         self.native_surface.fill((10, 10, 20))
 
-        # Initialize font
-        pygame.font.init()
-        font_large = pygame.font.Font(None, 24)
-        font_small = pygame.font.Font(None, 16)
+        font_large = get_font(24)
+        font_small = get_font(16)
 
         # Main victory text
         text1 = font_large.render("A NEW CYCLE", True, COLOR_YELLOW)
@@ -865,10 +860,8 @@ class Game:
         # Fill with dark background
         self.native_surface.fill((20, 10, 10))
 
-        # Initialize font
-        pygame.font.init()
-        font_large = pygame.font.Font(None, 24)
-        font_small = pygame.font.Font(None, 16)
+        font_large = get_font(24)
+        font_small = get_font(16)
 
         # Game over text
         text = font_large.render("GAME OVER", True, COLOR_RED)
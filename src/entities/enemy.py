@@ -13,6 +13,18 @@ from src.core.constants import (
 )
 
 
+# Module-level bindings for functions called from per-frame AI code
+_sqrt = math.sqrt
+_hypot = math.hypot
+_randint = random.randint
+_choice = random.choice
+_uniform = random.uniform
+
+# Enemies further than this from the player are updated at a reduced rate
+LOD_FAR_DISTANCE = 120  # Pixels
+LOD_STRIDE = 4  # Far enemies update once every LOD_STRIDE frames (power of two)
+
+
 class EnemyType(Enum):
     """Types of enemies"""
     CRAWLER = auto()  # Tier 1: Random movement
@@ -26,6 +38,12 @@ class Enemy:
     Base class for all enemies
     """
 
+    __slots__ = ('enemy_type', 'x', 'y', 'spawn_x', 'spawn_y', 'size', 'color',
+                 'speed', 'active', 'alive', '_tick', 'sprite')
+
+    # Whether far-away instances may be updated at a reduced rate
+    lod_enabled = False
+
     def __init__(self, enemy_type: EnemyType, x: float, y: float,
                  size: int = 16, color: tuple = COLOR_GREEN, speed: float = 1.0):
         """
@@ -49,6 +67,7 @@ class Enemy:
         self.speed = speed
         self.active = True
         self.alive = True
+        self._tick = 0  # Frames seen by the EnemyManager
 
         # Create simple sprite
         self.sprite = pygame.Surface((size, size))
@@ -82,7 +101,7 @@ class Enemy:
         self.y = self.spawn_y
         self.alive = True
 
-    def update(self, player_x: float, player_y: float, current_screen=None):
+    def update(self, player_x: float, player_y: float, current_screen=None, steps: int = 1):
         """
         Update enemy logic - override in subclasses
 
@@ -90,9 +109,21 @@ class Enemy:
             player_x: Player X position
             player_y: Player Y position
             current_screen: Current screen for collision detection
+            steps: Number of frames this update covers (only passed to
+                subclasses with lod_enabled)
         """
         pass
 
+    def add_blits(self, blits: list):
+        """
+        Append this enemy's (sprite, position) pairs to a blit batch
+
+        Args:
+            blits: Batch passed to Surface.blits
+        """
+        if self.active and self.alive:
+            blits.append((self.sprite, (int(self.x), int(self.y))))
+
     def render(self, surface: pygame.Surface):
         """
         Render the enemy
@@ -109,6 +140,10 @@ class Crawler(Enemy):
     Tier 1 Enemy: Green blob with random Brownian motion
     """
 
+    __slots__ = ('direction_x', 'direction_y', 'move_timer', 'pause_timer', 'is_paused')
+
+    lod_enabled = True
+
     def __init__(self, x: float, y: float):
         super().__init__(EnemyType.CRAWLER, x, y, 16, COLOR_GREEN, 0.5)
 
@@ -119,19 +154,19 @@ class Crawler(Enemy):
         self.pause_timer = 0
         self.is_paused = False
 
-    def update(self, player_x: float, player_y: float, current_screen=None):
+    def update(self, player_x: float, player_y: float, current_screen=None, steps: int = 1):
         """Update Crawler AI - random movement with pauses"""
         if not self.alive:
             return
 
         # Handle pause state
         if self.is_paused:
-            self.pause_timer -= 1
+            self.pause_timer -= steps
             if self.pause_timer <= 0:
                 self.is_paused = False
-                self.move_timer = random.randint(60, 120)  # Move for 1-2 seconds
+                self.move_timer = _randint(60, 120)  # Move for 1-2 seconds
                 # Choose new random direction (cardinal only)
-                direction = random.choice(['north', 'south', 'east', 'west'])
+                direction = _choice(['north', 'south', 'east', 'west'])
                 self.direction_x = 0
                 self.direction_y = 0
                 if direction == 'north':
@@ -145,10 +180,10 @@ class Crawler(Enemy):
             return
 
         # Handle movement state
-        self.move_timer -= 1
+        self.move_timer -= steps
         if self.move_timer <= 0:
             self.is_paused = True
-            self.pause_timer = random.randint(30, 60)  # Pause for 0.5-1 seconds
+            self.pause_timer = _randint(30, 60)  # Pause for 0.5-1 seconds
             return
 
         # Store old position for collision recovery
@@ -156,8 +191,9 @@ class Crawler(Enemy):
         old_y = self.y
 
         # Move in current direction
-        self.x += self.direction_x * self.speed
-        self.y += self.direction_y * self.speed
+        step = self.speed * steps
+        self.x += self.direction_x * step
+        self.y += self.direction_y * step
 
         # Check wall collisions - bounce off walls
         if current_screen:
@@ -196,6 +232,8 @@ class Chaser(Enemy):
     Tier 2 Enemy: Red chevron/triangle that chases player using line-of-sight
     """
 
+    __slots__ = ('aggro_range', '_aggro_sq', 'is_chasing', 'return_timer')
+
     def __init__(self, x: float, y: float):
         super().__init__(EnemyType.CHASER, x, y, 16, COLOR_RED, 1.5)
 
@@ -206,6 +244,7 @@ class Chaser(Enemy):
 
         # AI state
         self.aggro_range = 150  # Pixels
+        self._aggro_sq = self.aggro_range * self.aggro_range
         self.is_chasing = False
         self.return_timer = 0
 
@@ -221,16 +260,31 @@ class Chaser(Enemy):
         Returns:
             True if line of sight is clear
         """
-        # Calculate distance to player
+        # Calculate squared distance to player
         dx = player_x - self.x
         dy = player_y - self.y
-        distance = math.sqrt(dx * dx + dy * dy)
 
-        if distance > self.aggro_range:
+        return self._raycast(dx, dy, dx * dx + dy * dy, current_screen)
+
+    def _raycast(self, dx: float, dy: float, dist_sq: float, current_screen) -> bool:
+        """
+        Line-of-sight test using an already computed offset to the player
+
+        Args:
+            dx: Player X minus enemy X
+            dy: Player Y minus enemy Y
+            dist_sq: Squared length of (dx, dy)
+            current_screen: Current screen for raycasting
+
+        Returns:
+            True if line of sight is clear
+        """
+        # Out of range is decided without taking a square root
+        if dist_sq > self._aggro_sq:
             return False
 
         # Simple raycasting - check a few points along the line
-        steps = int(distance / 8)  # Check every 8 pixels
+        steps = int(_sqrt(dist_sq) / 8)  # Check every 8 pixels
         if steps == 0:
             return True
 
@@ -248,8 +302,13 @@ class Chaser(Enemy):
         if not self.alive:
             return
 
+        # Offset to the player is shared by the LOS test and the chase step
+        dx = player_x - self.x
+        dy = player_y - self.y
+        dist_sq = dx * dx + dy * dy
+
         # Check line of sight
-        if current_screen and self.has_line_of_sight(player_x, player_y, current_screen):
+        if current_screen and self._raycast(dx, dy, dist_sq, current_screen):
             self.is_chasing = True
             self.return_timer = 180  # 3 seconds to return if player lost
         else:
@@ -260,11 +319,9 @@ class Chaser(Enemy):
 
         if self.is_chasing:
             # Chase player at 75% of player speed (roughly)
-            dx = player_x - self.x
-            dy = player_y - self.y
-            distance = math.sqrt(dx * dx + dy * dy)
+            if dist_sq > 0:
+                distance = _sqrt(dist_sq)
 
-            if distance > 0:
                 # Normalize and apply speed
                 move_x = (dx / distance) * self.speed
                 move_y = (dy / distance) * self.speed
@@ -295,7 +352,7 @@ class Chaser(Enemy):
             # Return to spawn point
             dx = self.spawn_x - self.x
             dy = self.spawn_y - self.y
-            distance = math.sqrt(dx * dx + dy * dy)
+            distance = _hypot(dx, dy)
 
             if distance > 2:  # If not at spawn yet
                 move_x = (dx / distance) * self.speed * 0.5
@@ -310,6 +367,10 @@ class Sentinel(Enemy):
     Immune to sword - must be avoided or distracted
     """
 
+    __slots__ = ('waypoints', 'current_waypoint', 'immune_to_sword')
+
+    lod_enabled = True
+
     def __init__(self, x: float, y: float, waypoints: List[Tuple[float, float]]):
         super().__init__(EnemyType.SENTINEL, x, y, 16, COLOR_YELLOW, 2.0)
 
@@ -323,7 +384,7 @@ class Sentinel(Enemy):
         self.current_waypoint = 0
         self.immune_to_sword = True
 
-    def update(self, player_x: float, player_y: float, current_screen=None):
+    def update(self, player_x: float, player_y: float, current_screen=None, steps: int = 1):
         """Update Sentinel AI - patrol fixed route"""
         if not self.alive:
             return
@@ -337,7 +398,7 @@ class Sentinel(Enemy):
         # Calculate direction to waypoint
         dx = target_x - self.x
         dy = target_y - self.y
-        distance = math.sqrt(dx * dx + dy * dy)
+        distance = _hypot(dx, dy)
 
         # If reached waypoint, move to next
         if distance < 5:
@@ -346,8 +407,8 @@ class Sentinel(Enemy):
 
         # Move towards waypoint
         if distance > 0:
-            move_x = (dx / distance) * self.speed
-            move_y = (dy / distance) * self.speed
+            move_x = (dx / distance) * self.speed * steps
+            move_y = (dy / distance) * self.speed * steps
             self.x += move_x
             self.y += move_y
 
@@ -357,6 +418,11 @@ class Projectile:
     Projectile fired by The Void boss
     """
 
+    __slots__ = ('x_fp', 'y_fp', 'vx_fp', 'vy_fp', 'size', 'speed', 'active', 'color')
+
+    # Every projectile looks the same, so one sprite is shared by all of them
+    _SPRITE: Optional[pygame.Surface] = None
+
     def __init__(self, x: float, y: float, target_x: float, target_y: float, speed: float = 2.0):
         """
         Initialize a projectile
@@ -368,8 +434,10 @@ class Projectile:
             target_y: Target Y position (player)
             speed: Movement speed
         """
-        self.x = x
-        self.y = y
+        # Position and velocity are kept in 8.8 fixed point so the per-frame
+        # step and bounds test stay on the integer path
+        self.x_fp = int(x * 256)
+        self.y_fp = int(y * 256)
         self.size = 8
         self.speed = speed
         self.active = True
@@ -378,25 +446,45 @@ class Projectile:
         # Calculate direction
         dx = target_x - x
         dy = target_y - y
-        distance = math.sqrt(dx * dx + dy * dy)
+        distance = _hypot(dx, dy)
         if distance > 0:
-            self.velocity_x = (dx / distance) * speed
-            self.velocity_y = (dy / distance) * speed
+            self.vx_fp = int((dx / distance) * speed * 256)
+            self.vy_fp = int((dy / distance) * speed * 256)
         else:
-            self.velocity_x = 0
-            self.velocity_y = 0
-
-        # Create sprite
-        self.sprite = pygame.Surface((self.size, self.size))
-        self.sprite.fill(self.color)
+            self.vx_fp = 0
+            self.vy_fp = 0
+
+        # Create shared sprite on first use
+        if Projectile._SPRITE is None:
+            sprite = pygame.Surface((self.size, self.size))
+            sprite.fill(self.color)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert()
+            Projectile._SPRITE = sprite
+
+    @property
+    def sprite(self) -> pygame.Surface:
+        """Shared projectile sprite"""
+        return Projectile._SPRITE
+
+    @property
+    def x(self) -> float:
+        """X position in pixels"""
+        return self.x_fp / 256
+
+    @property
+    def y(self) -> float:
+        """Y position in pixels"""
+        return self.y_fp / 256
 
     def update(self):
         """Update projectile position"""
-        self.x += self.velocity_x
-        self.y += self.velocity_y
+        self.x_fp += self.vx_fp
+        self.y_fp += self.vy_fp
 
         # Deactivate if out of bounds
-        if self.x < 0 or self.x > NATIVE_WIDTH or self.y < 0 or self.y > NATIVE_HEIGHT:
+        if (self.x_fp < 0 or self.x_fp > NATIVE_WIDTH << 8 or
+                self.y_fp < 0 or self.y_fp > NATIVE_HEIGHT << 8):
             self.active = False
 
     def get_rect(self) -> pygame.Rect:
@@ -406,14 +494,19 @@ class Projectile:
     def is_colliding_with_player(self, player_x: float, player_y: float,
                                   player_width: int, player_height: int) -> bool:
         """Check if projectile hit the player"""
-        proj_rect = self.get_rect()
-        player_rect = pygame.Rect(player_x, player_y, player_width, player_height)
-        return proj_rect.colliderect(player_rect)
+        # Inline AABB overlap test (same result as Rect.colliderect) so the
+        # common miss case returns without building any Rects
+        x = self.x_fp >> 8
+        y = self.y_fp >> 8
+        player_x = int(player_x)
+        player_y = int(player_y)
+        return (x < player_x + player_width and player_x < x + self.size and
+                y < player_y + player_height and player_y < y + self.size)
 
     def render(self, surface: pygame.Surface):
         """Render the projectile"""
         if self.active:
-            surface.blit(self.sprite, (int(self.x), int(self.y)))
+            surface.blit(Projectile._SPRITE, (self.x_fp >> 8, self.y_fp >> 8))
 
 
 class TheVoid(Enemy):
@@ -421,6 +514,10 @@ class TheVoid(Enemy):
     Final Boss: The Void - A flickering geometric polygon
     """
 
+    __slots__ = ('hits_remaining', 'immune_to_sword', 'invulnerable', 'invulnerable_timer',
+                 'velocity_x', 'velocity_y', 'flicker_timer', 'current_shape', 'shapes',
+                 'projectiles', 'shoot_cooldown')
+
     def __init__(self, x: float, y: float):
         super().__init__(EnemyType.VOID, x, y, 24, (255, 255, 255), 3.0)
 
@@ -431,8 +528,8 @@ class TheVoid(Enemy):
         self.invulnerable_timer = 0
 
         # Movement
-        self.velocity_x = random.uniform(-1, 1) * self.speed
-        self.velocity_y = random.uniform(-1, 1) * self.speed
+        self.velocity_x = _uniform(-1, 1) * self.speed
+        self.velocity_y = _uniform(-1, 1) * self.speed
 
         # Visual effects
         self.flicker_timer = 0
@@ -458,7 +555,7 @@ class TheVoid(Enemy):
             (0, 255, 255),  # Cyan
             (255, 255, 255) # White
         ]
-        self.color = random.choice(colors)
+        self.color = _choice(colors)
 
         # Create surface
         self.sprite = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
@@ -506,7 +603,7 @@ class TheVoid(Enemy):
             (40, NATIVE_HEIGHT - 64),
             (NATIVE_WIDTH - 64, NATIVE_HEIGHT - 64)
         ]
-        self.x, self.y = random.choice(corners)
+        self.x, self.y = _choice(corners)
 
         # Shoot projectile at player
         projectile = Projectile(
@@ -517,8 +614,8 @@ class TheVoid(Enemy):
         self.projectiles.append(projectile)
 
         # New random velocity
-        self.velocity_x = random.uniform(-1, 1) * self.speed
-        self.velocity_y = random.uniform(-1, 1) * self.speed
+        self.velocity_x = _uniform(-1, 1) * self.speed
+        self.velocity_y = _uniform(-1, 1) * self.speed
 
         # Brief invulnerability
         self.invulnerable = True
@@ -541,7 +638,7 @@ class TheVoid(Enemy):
         self.flicker_timer += 1
         if self.flicker_timer > 10:  # Change every ~0.16 seconds
             self.flicker_timer = 0
-            self.current_shape = random.choice(self.shapes)
+            self.current_shape = _choice(self.shapes)
             self._create_sprite()
 
         # Bouncing movement
@@ -566,6 +663,20 @@ class TheVoid(Enemy):
         if self.shoot_cooldown > 0:
             self.shoot_cooldown -= 1
 
+    def add_blits(self, blits: list):
+        """Append The Void boss and its projectiles to a blit batch"""
+        if not (self.active and self.alive):
+            return
+
+        # Render boss with flicker effect
+        if not self.invulnerable or (self.invulnerable_timer % 4 < 2):
+            blits.append((self.sprite, (int(self.x), int(self.y))))
+
+        # Render projectiles
+        sprite = Projectile._SPRITE
+        blits.extend((sprite, (projectile.x_fp >> 8, projectile.y_fp >> 8))
+                     for projectile in self.projectiles if projectile.active)
+
     def render(self, surface: pygame.Surface):
         """Render The Void boss and its projectiles"""
         if self.active and self.alive:
@@ -578,6 +689,45 @@ class TheVoid(Enemy):
                 projectile.render(surface)
 
 
+class EnemyManager:
+    """
+    Drives the per-frame update of the enemies on the current screen
+    """
+
+    def update(self, enemies: List[Enemy], player_x: float, player_y: float,
+               current_screen=None):
+        """
+        Update enemies, stepping far-away ones at a reduced rate
+
+        Enemies that allow it and are further than LOD_FAR_DISTANCE from the
+        player only update every LOD_STRIDE frames. That update is told it
+        covers LOD_STRIDE frames, so movement and timers advance as they
+        would have over those frames.
+
+        Args:
+            enemies: Enemies to update
+            player_x: Player X position
+            player_y: Player Y position
+            current_screen: Current screen for collision detection
+        """
+        far_sq = LOD_FAR_DISTANCE * LOD_FAR_DISTANCE
+        skip_mask = LOD_STRIDE - 1
+
+        for enemy in enemies:
+            enemy._tick += 1
+
+            if enemy.lod_enabled:
+                dx = enemy.x - player_x
+                dy = enemy.y - player_y
+                if dx * dx + dy * dy > far_sq:
+                    if enemy._tick & skip_mask:
+                        continue
+                    enemy.update(player_x, player_y, current_screen, LOD_STRIDE)
+                    continue
+
+            enemy.update(player_x, player_y, current_screen)
+
+
 def create_enemy(enemy_type: EnemyType, x: float, y: float,
                  waypoints: Optional[List[Tuple[float, float]]] = None) -> Enemy:
     """
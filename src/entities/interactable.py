@@ -3,12 +3,14 @@ Interactable objects system for Ouroboros - Ring of Eternity
 """
 
 import pygame
-from enum import Enum, auto
+from enum import IntEnum, auto
 from typing import Optional
 from src.core.constants import COLOR_WHITE, COLOR_GREEN, COLOR_RED, COLOR_BLUE, COLOR_YELLOW, COLOR_GRAY
+from src.entities.item import Item, ItemType
+from src.entities.sprites import get_sprite, solid_sprite
 
 
-class InteractableType(Enum):
+class InteractableType(IntEnum):
     """Types of interactable objects"""
     # Pedestals for crystals
     PEDESTAL_GREEN = auto()
@@ -30,11 +32,33 @@ class InteractableType(Enum):
     CHASM = auto()
 
 
+# Display names for each interactable type
+_INTERACTABLE_NAMES = {
+    InteractableType.PEDESTAL_GREEN: "Green Pedestal",
+    InteractableType.PEDESTAL_RED: "Red Pedestal",
+    InteractableType.PEDESTAL_BLUE: "Blue Pedestal",
+    InteractableType.PEDESTAL_YELLOW: "Yellow Pedestal",
+    InteractableType.GOLD_GATE: "Gold Gate",
+    InteractableType.SILVER_GATE: "Silver Gate",
+    InteractableType.FOUNTAIN: "Fountain",
+    InteractableType.SOFT_DIRT: "Soft Dirt",
+    InteractableType.CRACKED_WALL: "Cracked Wall",
+    InteractableType.TOXIC_BASIN: "Toxic Basin",
+    InteractableType.BLESSED_SPRING: "Blessed Spring",
+    InteractableType.SLEEPLESS_STATUE: "Sleepless Statue",
+    InteractableType.CHASM: "Chasm"
+}
+
+
 class Interactable:
     """
     Base class for interactable objects in the game
     """
 
+    __slots__ = ('interactable_type', '_x', '_y', '_pos', 'cx', 'cy', 'width', 'height',
+                 'color', 'active', 'solid', '_interaction_range', '_range_sq', '_rect',
+                 'requires_item', 'is_activated', 'sprite', '_pool')
+
     def __init__(self, interactable_type: InteractableType, x: float, y: float,
                  width: int = 16, height: int = 16, color: tuple = COLOR_GRAY):
         """
@@ -49,26 +73,75 @@ class Interactable:
             color: Color of the object
         """
         self.interactable_type = interactable_type
-        self.x = x
-        self.y = y
         self.width = width
         self.height = height
+        self._pos = (0, 0)  # Integer blit position, kept in sync by the x/y setters
+        self._pool = None  # EntityPool holding this object, told when x/y/range change
+        self.x = x  # Also sets cx (center X)
+        self.y = y  # Also sets cy (center Y)
         self.color = color
         self.active = True
         self.solid = True  # Whether it blocks player movement
 
+        # Reused bounding rectangle (see get_rect)
+        self._rect = pygame.Rect(int(x), int(y), width, height)
+
         # Interaction properties
-        self.interaction_range = 24  # Pixels from player
+        self.interaction_range = 24  # Pixels from player (also sets _range_sq)
         self.requires_item = None  # ItemType required to interact
         self.is_activated = False  # Whether it's been used/solved
 
-        # Create basic sprite
-        self.sprite = pygame.Surface((width, height))
-        self.sprite.fill(color)
+        # Basic sprite, shared by all objects of the same size and color
+        self.sprite = solid_sprite(width, height, color)
+
+    @property
+    def x(self) -> float:
+        """X position in world"""
+        return self._x
+
+    @x.setter
+    def x(self, value: float):
+        self._x = value
+        self._pos = (int(value), self._pos[1])
+        self.cx = value + self.width * 0.5
+        if self._pool is not None:
+            self._pool.invalidate()
+
+    @property
+    def y(self) -> float:
+        """Y position in world"""
+        return self._y
+
+    @y.setter
+    def y(self, value: float):
+        self._y = value
+        self._pos = (self._pos[0], int(value))
+        self.cy = value + self.height * 0.5
+        if self._pool is not None:
+            self._pool.invalidate()
+
+    @property
+    def interaction_range(self) -> float:
+        """Interaction distance in pixels"""
+        return self._interaction_range
+
+    @interaction_range.setter
+    def interaction_range(self, value: float):
+        self._interaction_range = value
+        self._range_sq = value * value
+        if self._pool is not None:
+            self._pool.invalidate()
 
     def get_rect(self) -> pygame.Rect:
-        """Get the object's bounding rectangle"""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        """
+        Get the object's bounding rectangle
+
+        The same Rect is returned on every call; callers must not modify it.
+        """
+        rect = self._rect
+        rect.x = self.x
+        rect.y = self.y
+        return rect
 
     def is_near_player(self, player_x: float, player_y: float,
                        player_width: int, player_height: int) -> bool:
@@ -84,18 +157,11 @@ class Interactable:
         Returns:
             True if within range, False otherwise
         """
-        # Calculate centers
-        obj_center_x = self.x + self.width / 2
-        obj_center_y = self.y + self.height / 2
-        player_center_x = player_x + player_width / 2
-        player_center_y = player_y + player_height / 2
+        # Compare squared center distance against the squared range
+        dx = self.cx - (player_x + player_width * 0.5)
+        dy = self.cy - (player_y + player_height * 0.5)
 
-        # Calculate distance
-        dx = obj_center_x - player_center_x
-        dy = obj_center_y - player_center_y
-        distance = (dx * dx + dy * dy) ** 0.5
-
-        return distance <= self.interaction_range
+        return dx * dx + dy * dy <= self._range_sq
 
     def can_interact_with_item(self, item) -> bool:
         """
@@ -111,7 +177,7 @@ class Interactable:
             return False
         if self.requires_item is None:
             return False
-        return hasattr(item, 'item_type') and item.item_type == self.requires_item
+        return isinstance(item, Item) and item.item_type is self.requires_item
 
     def interact(self, item=None):
         """
@@ -126,6 +192,16 @@ class Interactable:
         """
         return None
 
+    def add_blits(self, blits: list):
+        """
+        Append this object's (sprite, position) pair to a blit batch
+
+        Args:
+            blits: Batch passed to Surface.blits
+        """
+        if self.active:
+            blits.append((self.sprite, self._pos))
+
     def render(self, surface: pygame.Surface):
         """
         Render the interactable object
@@ -134,31 +210,18 @@ class Interactable:
             surface: Surface to render to
         """
         if self.active:
-            surface.blit(self.sprite, (int(self.x), int(self.y)))
+            surface.blit(self.sprite, self._pos)
 
     def get_name(self) -> str:
         """Get the display name of the object"""
-        names = {
-            InteractableType.PEDESTAL_GREEN: "Green Pedestal",
-            InteractableType.PEDESTAL_RED: "Red Pedestal",
-            InteractableType.PEDESTAL_BLUE: "Blue Pedestal",
-            InteractableType.PEDESTAL_YELLOW: "Yellow Pedestal",
-            InteractableType.GOLD_GATE: "Gold Gate",
-            InteractableType.SILVER_GATE: "Silver Gate",
-            InteractableType.FOUNTAIN: "Fountain",
-            InteractableType.SOFT_DIRT: "Soft Dirt",
-            InteractableType.CRACKED_WALL: "Cracked Wall",
-            InteractableType.TOXIC_BASIN: "Toxic Basin",
-            InteractableType.BLESSED_SPRING: "Blessed Spring",
-            InteractableType.SLEEPLESS_STATUE: "Sleepless Statue",
-            InteractableType.CHASM: "Chasm"
-        }
-        return names.get(self.interactable_type, "Unknown Object")
+        return _INTERACTABLE_NAMES.get(self.interactable_type, "Unknown Object")
 
 
 class Pedestal(Interactable):
     """Crystal pedestal in the Tower Hub"""
 
+    __slots__ = ('outline_color', 'has_crystal', '_active_sprite')
+
     def __init__(self, x: float, y: float, crystal_type, outline_color: tuple):
         """
         Create a pedestal for a specific crystal
@@ -176,9 +239,15 @@ class Pedestal(Interactable):
         self.solid = False  # Pedestals don't block movement
 
         # Create pedestal sprite with colored outline
-        self.sprite = pygame.Surface((16, 16))
-        self.sprite.fill(COLOR_GRAY)
-        pygame.draw.rect(self.sprite, outline_color, (0, 0, 16, 16), 2)
+        def build():
+            sprite = pygame.Surface((16, 16))
+            sprite.fill(COLOR_GRAY)
+            pygame.draw.rect(sprite, outline_color, (0, 0, 16, 16), 2)
+            return sprite
+        self.sprite = get_sprite(('pedestal', outline_color), build)
+
+        # Sprite shown once the crystal is placed
+        self._active_sprite = solid_sprite(16, 16, outline_color)
 
     def interact(self, item=None):
         """Place crystal on pedestal"""
@@ -186,7 +255,7 @@ class Pedestal(Interactable):
             self.has_crystal = True
             self.is_activated = True
             # Update sprite to show crystal
-            self.sprite.fill(self.outline_color)
+            self.sprite = self._active_sprite
             return True
         return False
 
@@ -194,6 +263,8 @@ class Pedestal(Interactable):
 class Gate(Interactable):
     """Locked gate that requires a key"""
 
+    __slots__ = ()
+
     def __init__(self, x: float, y: float, width: int, height: int,
                  gate_type: InteractableType, key_type, color: tuple):
         """
@@ -213,12 +284,14 @@ class Gate(Interactable):
         self.solid = True
 
         # Create gate sprite with keyhole
-        self.sprite = pygame.Surface((width, height))
-        self.sprite.fill(color)
-        # Draw keyhole
-        keyhole_x = width // 2 - 2
-        keyhole_y = height // 2 - 2
-        pygame.draw.rect(self.sprite, COLOR_GRAY, (keyhole_x, keyhole_y, 4, 4))
+        def build():
+            sprite = pygame.Surface((width, height))
+            sprite.fill(color)
+            keyhole_x = width // 2 - 2
+            keyhole_y = height // 2 - 2
+            pygame.draw.rect(sprite, COLOR_GRAY, (keyhole_x, keyhole_y, 4, 4))
+            return sprite
+        self.sprite = get_sprite(('gate', width, height, color), build)
 
     def interact(self, item=None):
         """Unlock gate with key"""
@@ -233,21 +306,21 @@ class Gate(Interactable):
 class Fountain(Interactable):
     """Fountain for filling watering can"""
 
+    __slots__ = ()
+
     def __init__(self, x: float, y: float):
         super().__init__(InteractableType.FOUNTAIN, x, y, 16, 16, COLOR_BLUE)
         self.solid = True
-        from src.entities.item import ItemType
         self.requires_item = ItemType.WATERING_CAN
 
     def interact(self, item=None):
         """Fill watering can"""
-        from src.entities.item import ItemType
-        if item and hasattr(item, 'item_type'):
-            if item.item_type == ItemType.WATERING_CAN:
+        if isinstance(item, Item):
+            if item.item_type is ItemType.WATERING_CAN:
                 # Transform to filled watering can
                 item.item_type = ItemType.WATERING_CAN_FULL
                 item.color = COLOR_BLUE
-                item.sprite.fill(COLOR_BLUE)
+                item.sprite = solid_sprite(item.size, item.size, COLOR_BLUE)
                 return "filled"
         return None
 
@@ -255,24 +328,27 @@ class Fountain(Interactable):
 class SoftDirt(Interactable):
     """Soft dirt patch where acorn can be planted"""
 
+    __slots__ = ('has_acorn', '_planted_sprite')
+
     def __init__(self, x: float, y: float):
         super().__init__(InteractableType.SOFT_DIRT, x, y, 16, 16, (101, 67, 33))
         self.solid = False
         self.has_acorn = False
-        from src.entities.item import ItemType
         self.requires_item = ItemType.ACORN
 
+        # Darker sprite shown once an acorn is planted
+        self._planted_sprite = solid_sprite(16, 16, (80, 50, 20))
+
     def interact(self, item=None):
         """Plant acorn or water it"""
-        from src.entities.item import ItemType
-        if not self.has_acorn and item and hasattr(item, 'item_type'):
-            if item.item_type == ItemType.ACORN:
+        if not self.has_acorn and isinstance(item, Item):
+            if item.item_type is ItemType.ACORN:
                 self.has_acorn = True
                 # Change color to show planted acorn
-                self.sprite.fill((80, 50, 20))
+                self.sprite = self._planted_sprite
                 return "planted"
-        elif self.has_acorn and item and hasattr(item, 'item_type'):
-            if item.item_type == ItemType.WATERING_CAN_FULL:
+        elif self.has_acorn and isinstance(item, Item):
+            if item.item_type is ItemType.WATERING_CAN_FULL:
                 # Grow tree bridge
                 return "grow_tree"
         return None
@@ -281,22 +357,26 @@ class SoftDirt(Interactable):
 class CrackedWall(Interactable):
     """Cracked wall that can be destroyed with bomb"""
 
+    __slots__ = ()
+
     def __init__(self, x: float, y: float):
         super().__init__(InteractableType.CRACKED_WALL, x, y, 16, 16, COLOR_GRAY)
         self.solid = True
-        from src.entities.item import ItemType
         self.requires_item = ItemType.BOMB
 
         # Draw cracks
-        self.sprite.fill(COLOR_GRAY)
-        pygame.draw.line(self.sprite, (50, 50, 50), (2, 2), (14, 14), 1)
-        pygame.draw.line(self.sprite, (50, 50, 50), (14, 2), (2, 14), 1)
+        def build():
+            sprite = pygame.Surface((16, 16))
+            sprite.fill(COLOR_GRAY)
+            pygame.draw.line(sprite, (50, 50, 50), (2, 2), (14, 14), 1)
+            pygame.draw.line(sprite, (50, 50, 50), (14, 2), (2, 14), 1)
+            return sprite
+        self.sprite = get_sprite(('cracked_wall',), build)
 
     def interact(self, item=None):
         """Place bomb at wall"""
-        from src.entities.item import ItemType
-        if not self.is_activated and item and hasattr(item, 'item_type'):
-            if item.item_type == ItemType.BOMB:
+        if not self.is_activated and isinstance(item, Item):
+            if item.item_type is ItemType.BOMB:
                 return "bomb_placed"
         return None
 
@@ -304,18 +384,18 @@ class CrackedWall(Interactable):
 class ToxicBasin(Interactable):
     """Toxic basin that kills on contact (until cleansed)"""
 
+    __slots__ = ('deadly',)
+
     def __init__(self, x: float, y: float, width: int = 32, height: int = 32):
         super().__init__(InteractableType.TOXIC_BASIN, x, y, width, height, (128, 0, 128))
         self.solid = False  # Can walk through but deadly
         self.deadly = True
-        from src.entities.item import ItemType
         self.requires_item = ItemType.CHALICE_FILLED
 
     def interact(self, item=None):
         """Cleanse basin with filled chalice"""
-        from src.entities.item import ItemType
-        if not self.is_activated and item and hasattr(item, 'item_type'):
-            if item.item_type == ItemType.CHALICE_FILLED:
+        if not self.is_activated and isinstance(item, Item):
+            if item.item_type is ItemType.CHALICE_FILLED:
                 self.is_activated = True
                 self.deadly = False
                 self.active = False  # Basin disappears
@@ -326,21 +406,21 @@ class ToxicBasin(Interactable):
 class BlessedSpring(Interactable):
     """Blessed spring for filling chalice"""
 
+    __slots__ = ()
+
     def __init__(self, x: float, y: float):
         super().__init__(InteractableType.BLESSED_SPRING, x, y, 16, 16, (100, 200, 255))
         self.solid = True
-        from src.entities.item import ItemType
         self.requires_item = ItemType.CHALICE
 
     def interact(self, item=None):
         """Fill chalice"""
-        from src.entities.item import ItemType
-        if item and hasattr(item, 'item_type'):
-            if item.item_type == ItemType.CHALICE:
+        if isinstance(item, Item):
+            if item.item_type is ItemType.CHALICE:
                 # Transform to filled chalice
                 item.item_type = ItemType.CHALICE_FILLED
                 item.color = COLOR_BLUE
-                item.sprite.fill(COLOR_BLUE)
+                item.sprite = solid_sprite(item.size, item.size, COLOR_BLUE)
                 return "filled"
         return None
 
@@ -348,28 +428,39 @@ class BlessedSpring(Interactable):
 class SleeplessStatue(Interactable):
     """Statue that attacks player unless put to sleep with flute"""
 
+    __slots__ = ('attack_range', '_asleep_sprite')
+
     def __init__(self, x: float, y: float):
         super().__init__(InteractableType.SLEEPLESS_STATUE, x, y, 16, 24, COLOR_YELLOW)
         self.solid = True
         self.attack_range = 40
-        from src.entities.item import ItemType
         self.requires_item = ItemType.FLUTE
 
         # Draw statue with eyes
-        self.sprite.fill(COLOR_YELLOW)
-        pygame.draw.rect(self.sprite, COLOR_RED, (4, 6, 3, 3))  # Left eye
-        pygame.draw.rect(self.sprite, COLOR_RED, (9, 6, 3, 3))  # Right eye
+        def build_awake():
+            sprite = pygame.Surface((16, 24))
+            sprite.fill(COLOR_YELLOW)
+            pygame.draw.rect(sprite, COLOR_RED, (4, 6, 3, 3))  # Left eye
+            pygame.draw.rect(sprite, COLOR_RED, (9, 6, 3, 3))  # Right eye
+            return sprite
+        self.sprite = get_sprite(('statue_awake',), build_awake)
+
+        # Closed eyes, shown once put to sleep
+        def build_asleep():
+            sprite = pygame.Surface((16, 24))
+            sprite.fill(COLOR_YELLOW)
+            pygame.draw.line(sprite, COLOR_GRAY, (4, 7), (6, 7), 1)
+            pygame.draw.line(sprite, COLOR_GRAY, (9, 7), (11, 7), 1)
+            return sprite
+        self._asleep_sprite = get_sprite(('statue_asleep',), build_asleep)
 
     def interact(self, item=None):
         """Put statue to sleep with flute"""
-        from src.entities.item import ItemType
-        if not self.is_activated and item and hasattr(item, 'item_type'):
-            if item.item_type == ItemType.FLUTE:
+        if not self.is_activated and isinstance(item, Item):
+            if item.item_type is ItemType.FLUTE:
                 self.is_activated = True
-                # Draw closed eyes
-                self.sprite.fill(COLOR_YELLOW)
-                pygame.draw.line(self.sprite, COLOR_GRAY, (4, 7), (6, 7), 1)
-                pygame.draw.line(self.sprite, COLOR_GRAY, (9, 7), (11, 7), 1)
+                # Show closed eyes
+                self.sprite = self._asleep_sprite
                 return "sleeping"
         return None
 
@@ -377,11 +468,16 @@ class SleeplessStatue(Interactable):
 class Chasm(Interactable):
     """Wide chasm that blocks passage (until tree bridge is grown)"""
 
+    __slots__ = ('_bridge_sprite',)
+
     def __init__(self, x: float, y: float, width: int = 16, height: int = 48):
         super().__init__(InteractableType.CHASM, x, y, width, height, (20, 20, 20))
         self.solid = True
 
+        # Brown tree bridge, shown once grown
+        self._bridge_sprite = solid_sprite(width, height, (101, 67, 33))
+
     def grow_bridge(self):
         """Grow tree bridge to cross chasm"""
         self.solid = False
-        self.sprite.fill((101, 67, 33))  # Brown tree bridge
+        self.sprite = self._bridge_sprite
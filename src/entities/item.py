@@ -3,11 +3,15 @@ Item system for Ouroboros - Ring of Eternity
 """
 
 import pygame
-from enum import Enum, auto
-from src.core.constants import COLOR_WHITE
+from enum import IntEnum, auto
+from src.core.constants import (
+    COLOR_WHITE, COLOR_YELLOW, COLOR_GRAY, COLOR_GREEN, COLOR_RED,
+    COLOR_BLUE, COLOR_ORANGE
+)
+from src.entities.sprites import get_sprite, solid_sprite
 
 
-class ItemType(Enum):
+class ItemType(IntEnum):
     """Types of items in the game"""
     # Keys
     GOLD_KEY = auto()
@@ -34,11 +38,55 @@ class ItemType(Enum):
     RING_OF_ETERNITY = auto()
 
 
+# Display names for each item type
+_ITEM_NAMES = {
+    ItemType.GOLD_KEY: "Gold Key",
+    ItemType.SILVER_KEY: "Silver Key",
+    ItemType.GREEN_CRYSTAL: "Green Crystal",
+    ItemType.RED_CRYSTAL: "Red Crystal",
+    ItemType.BLUE_CRYSTAL: "Blue Crystal",
+    ItemType.YELLOW_CRYSTAL: "Yellow Crystal",
+    ItemType.ACORN: "Acorn",
+    ItemType.WATERING_CAN: "Watering Can",
+    ItemType.WATERING_CAN_FULL: "Watering Can (Full)",
+    ItemType.BOMB: "Bomb",
+    ItemType.CHALICE: "Chalice",
+    ItemType.CHALICE_FILLED: "Chalice (Filled)",
+    ItemType.FLUTE: "Flute",
+    ItemType.SWORD: "Sword",
+    ItemType.FISH: "Fish",
+    ItemType.RING_OF_ETERNITY: "Ring of Eternity"
+}
+
+# Sprite colors for each item type
+_ITEM_COLORS = {
+    ItemType.GOLD_KEY: COLOR_YELLOW,
+    ItemType.SILVER_KEY: COLOR_GRAY,
+    ItemType.GREEN_CRYSTAL: COLOR_GREEN,
+    ItemType.RED_CRYSTAL: COLOR_RED,
+    ItemType.BLUE_CRYSTAL: COLOR_BLUE,
+    ItemType.YELLOW_CRYSTAL: COLOR_YELLOW,
+    ItemType.ACORN: (101, 67, 33),  # Brown
+    ItemType.WATERING_CAN: COLOR_GRAY,
+    ItemType.WATERING_CAN_FULL: COLOR_BLUE,
+    ItemType.BOMB: COLOR_RED,
+    ItemType.CHALICE: COLOR_YELLOW,
+    ItemType.CHALICE_FILLED: COLOR_BLUE,
+    ItemType.FLUTE: (210, 180, 140),  # Tan
+    ItemType.SWORD: COLOR_GRAY,
+    ItemType.FISH: COLOR_ORANGE,
+    ItemType.RING_OF_ETERNITY: COLOR_YELLOW  # Golden circle
+}
+
+
 class Item:
     """
     Base class for all items in the game
     """
 
+    __slots__ = ('item_type', '_x', '_y', '_pos', 'cx', 'cy', 'color', 'size', 'active',
+                 '_rect', '_pickup_range', '_range_sq', 'sprite', '_pool')
+
     def __init__(self, item_type: ItemType, x: float, y: float,
                  color: tuple = COLOR_WHITE, size: int = 8):
         """
@@ -52,22 +100,71 @@ class Item:
             size: Size of the item (square)
         """
         self.item_type = item_type
-        self.x = x
-        self.y = y
-        self.color = color
         self.size = size
+        self._pos = (0, 0)  # Integer blit position, kept in sync by the x/y setters
+        self._pool = None  # EntityPool holding this item, told when x/y/range change
+        self.x = x  # Also sets cx (center X)
+        self.y = y  # Also sets cy (center Y)
+        self.color = color
         self.active = True  # Whether item is in the world or held
 
-        # Create simple square sprite (can be enhanced later)
-        self.sprite = pygame.Surface((size, size))
-        self.sprite.fill(color)
+        # Reused bounding rectangle (see get_rect)
+        self._rect = pygame.Rect(int(x), int(y), size, size)
+
+        # Simple square sprite, shared by items of the same size and color
+        self.sprite = solid_sprite(size, size, color)
 
         # Interaction properties
-        self.pickup_range = 20  # Pixels from player center
+        self.pickup_range = 20  # Pixels from player center (also sets _range_sq)
+
+    @property
+    def x(self) -> float:
+        """X position in world"""
+        return self._x
+
+    @x.setter
+    def x(self, value: float):
+        self._x = value
+        self._pos = (int(value), self._pos[1])
+        self.cx = value + self.size * 0.5
+        if self._pool is not None:
+            self._pool.invalidate()
+
+    @property
+    def y(self) -> float:
+        """Y position in world"""
+        return self._y
+
+    @y.setter
+    def y(self, value: float):
+        self._y = value
+        self._pos = (self._pos[0], int(value))
+        self.cy = value + self.size * 0.5
+        if self._pool is not None:
+            self._pool.invalidate()
+
+    @property
+    def pickup_range(self) -> float:
+        """Pickup distance in pixels"""
+        return self._pickup_range
+
+    @pickup_range.setter
+    def pickup_range(self, value: float):
+        self._pickup_range = value
+        self._range_sq = value * value
+        if self._pool is not None:
+            self._pool.invalidate()
 
     def get_rect(self) -> pygame.Rect:
-        """Get the item's bounding rectangle"""
-        return pygame.Rect(self.x, self.y, self.size, self.size)
+        """
+        Get the item's bounding rectangle
+
+        The same Rect is returned on every call; callers must not modify it.
+        """
+        rect = self._rect
+        rect.x = self.x
+        rect.y = self.y
+        return rect
 
     def is_near_player(self, player_x: float, player_y: float,
                        player_width: int, player_height: int) -> bool:
@@ -83,18 +180,21 @@ class Item:
         Returns:
             True if within range, False otherwise
         """
-        # Calculate centers
-        item_center_x = self.x + self.size / 2
-        item_center_y = self.y + self.size / 2
-        player_center_x = player_x + player_width / 2
-        player_center_y = player_y + player_height / 2
+        # Compare squared center distance against the squared range
+        dx = self.cx - (player_x + player_width * 0.5)
+        dy = self.cy - (player_y + player_height * 0.5)
 
-        # Calculate distance
-        dx = item_center_x - player_center_x
-        dy = item_center_y - player_center_y
-        distance = (dx * dx + dy * dy) ** 0.5
+        return dx * dx + dy * dy <= self._range_sq
 
-        return distance <= self.pickup_range
+    def add_blits(self, blits: list):
+        """
+        Append this item's (sprite, position) pair to a blit batch
+
+        Args:
+            blits: Batch passed to Surface.blits
+        """
+        if self.active:
+            blits.append((self.sprite, self._pos))
 
     def render(self, surface: pygame.Surface):
         """
@@ -104,31 +204,37 @@ class Item:
             surface: Surface to render to
         """
         if self.active:
-            surface.blit(self.sprite, (int(self.x), int(self.y)))
+            surface.blit(self.sprite, self._pos)
 
             # Draw white outline when in pickup range (done by game logic)
 
     def get_name(self) -> str:
         """Get the display name of the item"""
-        names = {
-            ItemType.GOLD_KEY: "Gold Key",
-            ItemType.SILVER_KEY: "Silver Key",
-            ItemType.GREEN_CRYSTAL: "Green Crystal",
-            ItemType.RED_CRYSTAL: "Red Crystal",
-            ItemType.BLUE_CRYSTAL: "Blue Crystal",
-            ItemType.YELLOW_CRYSTAL: "Yellow Crystal",
-            ItemType.ACORN: "Acorn",
-            ItemType.WATERING_CAN: "Watering Can",
-            ItemType.WATERING_CAN_FULL: "Watering Can (Full)",
-            ItemType.BOMB: "Bomb",
-            ItemType.CHALICE: "Chalice",
-            ItemType.CHALICE_FILLED: "Chalice (Filled)",
-            ItemType.FLUTE: "Flute",
-            ItemType.SWORD: "Sword",
-            ItemType.FISH: "Fish",
-            ItemType.RING_OF_ETERNITY: "Ring of Eternity"
-        }
-        return names.get(self.item_type, "Unknown Item")
+        return _ITEM_NAMES.get(self.item_type, "Unknown Item")
+
+
+def _make_default(item_type: ItemType, x: float, y: float) -> Item:
+    """Create a plain square item in its type's color"""
+    return Item(item_type, x, y, _ITEM_COLORS.get(item_type, COLOR_WHITE), 8)
+
+
+def _make_ring(item_type: ItemType, x: float, y: float) -> Item:
+    """Create the Ring of Eternity with its golden circle sprite"""
+    size = 12
+    item = Item(item_type, x, y, _ITEM_COLORS[item_type], size)
+
+    def build():
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, COLOR_YELLOW, (size // 2, size // 2), size // 2, 2)
+        return sprite
+    item.sprite = get_sprite(('ring', size), build)
+    return item
+
+
+# Item types that need more than a plain colored square
+_ITEM_FACTORIES = {
+    ItemType.RING_OF_ETERNITY: _make_ring,
+}
 
 
 def create_item(item_type: ItemType, x: float, y: float) -> Item:
@@ -143,40 +249,4 @@ def create_item(item_type: ItemType, x: float, y: float) -> Item:
     Returns:
         Item instance
     """
-    from src.core.constants import (
-        COLOR_YELLOW, COLOR_GRAY, COLOR_GREEN, COLOR_RED,
-        COLOR_BLUE, COLOR_ORANGE, COLOR_PURPLE, COLOR_WHITE
-    )
-
-    # Define colors for each item type
-    colors = {
-        ItemType.GOLD_KEY: COLOR_YELLOW,
-        ItemType.SILVER_KEY: COLOR_GRAY,
-        ItemType.GREEN_CRYSTAL: COLOR_GREEN,
-        ItemType.RED_CRYSTAL: COLOR_RED,
-        ItemType.BLUE_CRYSTAL: COLOR_BLUE,
-        ItemType.YELLOW_CRYSTAL: COLOR_YELLOW,
-        ItemType.ACORN: (101, 67, 33),  # Brown
-        ItemType.WATERING_CAN: COLOR_GRAY,
-        ItemType.WATERING_CAN_FULL: COLOR_BLUE,
-        ItemType.BOMB: COLOR_RED,
-        ItemType.CHALICE: COLOR_YELLOW,
-        ItemType.CHALICE_FILLED: COLOR_BLUE,
-        ItemType.FLUTE: (210, 180, 140),  # Tan
-        ItemType.SWORD: COLOR_GRAY,
-        ItemType.FISH: COLOR_ORANGE,
-        ItemType.RING_OF_ETERNITY: COLOR_YELLOW  # Golden circle
-    }
-
-    color = colors.get(item_type, COLOR_WHITE)
-    size = 12 if item_type == ItemType.RING_OF_ETERNITY else 8
-
-    # Create the item
-    item = Item(item_type, x, y, color, size)
-
-    # Special sprite for Ring of Eternity (golden circle)
-    if item_type == ItemType.RING_OF_ETERNITY:
-        item.sprite = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(item.sprite, COLOR_YELLOW, (size // 2, size // 2), size // 2, 2)
-
-    return item
+    return _ITEM_FACTORIES.get(item_type, _make_default)(item_type, x, y)
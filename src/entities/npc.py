@@ -11,6 +11,35 @@ from src.core.constants import (
     COLOR_BROWN, COLOR_ORANGE, COLOR_WHITE, COLOR_BLACK,
     NATIVE_WIDTH, NATIVE_HEIGHT
 )
+from src.entities.item import Item, ItemType
+from src.entities._fastkernels import follow_step
+from src.entities.sprites import get_sprite, solid_sprite
+from src.ui.hud import get_font
+
+
+# Owl hint box, rendered once on first use (needs pygame.font)
+_HINT_PADDING = 2
+_HINT_SURFACE = None
+
+
+def _get_hint_surface():
+    """
+    Get the owl's boxed "Song of Sleep..." hint, rendering it on first use
+
+    Returns:
+        Surface with the hint text on a white-bordered black box
+    """
+    global _HINT_SURFACE
+    if _HINT_SURFACE is None:
+        text = get_font(12).render("Song of Sleep...", True, COLOR_WHITE)
+
+        box = pygame.Surface((text.get_width() + _HINT_PADDING * 2,
+                              text.get_height() + _HINT_PADDING * 2))
+        box.fill(COLOR_BLACK)
+        pygame.draw.rect(box, COLOR_WHITE, box.get_rect(), 1)
+        box.blit(text, (_HINT_PADDING, _HINT_PADDING))
+        _HINT_SURFACE = box
+    return _HINT_SURFACE
 
 
 class NPCType(Enum):
@@ -31,21 +60,51 @@ class NPC:
         color: Sprite color
     """
 
+    __slots__ = ('_x', '_y', '_pos', 'cx', 'cy', 'width', 'height', 'color', 'active',
+                 'sprite', 'npc_type', '_pool')
+
     def __init__(self, x, y, width=16, height=16, color=COLOR_WHITE):
-        self.x = x
-        self.y = y
         self.width = width
         self.height = height
+        self._pos = (0, 0)  # Integer blit position, kept in sync by the x/y setters
+        self._pool = None  # NPCPool holding this NPC, told when x/y change
+        self.x = x  # Also sets cx (center X)
+        self.y = y  # Also sets cy (center Y)
         self.color = color
         self.active = True
 
-        # Create sprite
-        self.sprite = pygame.Surface((width, height))
-        self.sprite.fill(color)
+        # Create sprite (shared by NPCs of the same size and color)
+        self.sprite = solid_sprite(width, height, color)
 
         # NPC type
         self.npc_type = None
 
+    @property
+    def x(self):
+        """X position"""
+        return self._x
+
+    @x.setter
+    def x(self, value):
+        self._x = value
+        self._pos = (int(value), self._pos[1])
+        self.cx = value + self.width * 0.5
+        if self._pool is not None:
+            self._pool.invalidate()
+
+    @property
+    def y(self):
+        """Y position"""
+        return self._y
+
+    @y.setter
+    def y(self, value):
+        self._y = value
+        self._pos = (self._pos[0], int(value))
+        self.cy = value + self.height * 0.5
+        if self._pool is not None:
+            self._pool.invalidate()
+
     def update(self, player_x, player_y, player_held_item):
         """
         Update NPC logic
@@ -57,6 +116,16 @@ class NPC:
         """
         pass
 
+    def add_blits(self, blits):
+        """
+        Append this NPC's (sprite, position) pairs to a blit batch
+
+        Args:
+            blits: Batch passed to Surface.blits
+        """
+        if self.active:
+            blits.append((self.sprite, self._pos))
+
     def render(self, surface):
         """
         Render the NPC
@@ -65,7 +134,7 @@ class NPC:
             surface: Surface to render to
         """
         if self.active:
-            surface.blit(self.sprite, (self.x, self.y))
+            surface.blit(self.sprite, self._pos)
 
     def is_near_player(self, player_x, player_y, player_width, player_height, distance=32):
         """
@@ -81,16 +150,10 @@ class NPC:
         Returns:
             True if player is within distance
         """
-        player_center_x = player_x + player_width // 2
-        player_center_y = player_y + player_height // 2
-        npc_center_x = self.x + self.width // 2
-        npc_center_y = self.y + self.height // 2
+        dx = player_x + player_width * 0.5 - self.cx
+        dy = player_y + player_height * 0.5 - self.cy
 
-        dx = player_center_x - npc_center_x
-        dy = player_center_y - npc_center_y
-        dist = (dx * dx + dy * dy) ** 0.5
-
-        return dist < distance
+        return dx * dx + dy * dy < distance * distance
 
 
 class Owl(NPC):
@@ -104,6 +167,8 @@ class Owl(NPC):
         y: Y position
     """
 
+    __slots__ = ('show_hint', 'hint_timer')
+
     def __init__(self, x, y):
         # Brown/orange owl sprite (16x16)
         super().__init__(x, y, width=16, height=16, color=COLOR_BROWN)
@@ -112,29 +177,32 @@ class Owl(NPC):
         self.show_hint = False
         self.hint_timer = 0
 
-        # Create a simple owl sprite
-        self._create_owl_sprite()
+        # Create a simple owl sprite (shared by all owls)
+        self.sprite = get_sprite(('owl',), self._create_owl_sprite)
 
     def _create_owl_sprite(self):
-        """Create a simple pixelated owl sprite"""
-        self.sprite.fill(COLOR_BLACK)  # Start with black background
+        """Build a simple pixelated owl sprite"""
+        sprite = pygame.Surface((16, 16))
+        sprite.fill(COLOR_BLACK)  # Start with black background
 
         # Draw owl body (brown)
-        pygame.draw.rect(self.sprite, COLOR_BROWN, (4, 6, 8, 8))
+        pygame.draw.rect(sprite, COLOR_BROWN, (4, 6, 8, 8))
 
         # Draw owl head (brown)
-        pygame.draw.rect(self.sprite, COLOR_BROWN, (3, 2, 10, 6))
+        pygame.draw.rect(sprite, COLOR_BROWN, (3, 2, 10, 6))
 
         # Draw eyes (white)
-        pygame.draw.rect(self.sprite, COLOR_WHITE, (5, 3, 2, 2))
-        pygame.draw.rect(self.sprite, COLOR_WHITE, (9, 3, 2, 2))
+        pygame.draw.rect(sprite, COLOR_WHITE, (5, 3, 2, 2))
+        pygame.draw.rect(sprite, COLOR_WHITE, (9, 3, 2, 2))
 
         # Draw ear tufts (brown)
-        pygame.draw.rect(self.sprite, COLOR_BROWN, (2, 1, 2, 2))
-        pygame.draw.rect(self.sprite, COLOR_BROWN, (12, 1, 2, 2))
+        pygame.draw.rect(sprite, COLOR_BROWN, (2, 1, 2, 2))
+        pygame.draw.rect(sprite, COLOR_BROWN, (12, 1, 2, 2))
 
         # Draw beak (orange)
-        pygame.draw.rect(self.sprite, COLOR_ORANGE, (7, 5, 2, 2))
+        pygame.draw.rect(sprite, COLOR_ORANGE, (7, 5, 2, 2))
+
+        return sprite
 
     def update(self, player_x, player_y, player_held_item):
         """
@@ -148,9 +216,8 @@ class Owl(NPC):
         # Check if player is near with flute
         if self.is_near_player(player_x, player_y, 16, 16, distance=40):
             # Check if player is holding the flute
-            if player_held_item and hasattr(player_held_item, 'item_type'):
-                from src.entities.item import ItemType
-                if player_held_item.item_type == ItemType.FLUTE:
+            if isinstance(player_held_item, Item):
+                if player_held_item.item_type is ItemType.FLUTE:
                     self.show_hint = True
                     self.hint_timer = 120  # Show for 2 seconds (60 FPS)
                 else:
@@ -164,6 +231,21 @@ class Owl(NPC):
         if self.hint_timer > 0:
             self.hint_timer -= 1
 
+    def add_blits(self, blits):
+        """
+        Append the owl and any hint box to a blit batch
+
+        Args:
+            blits: Batch passed to Surface.blits
+        """
+        super().add_blits(blits)
+
+        if self.show_hint and self.hint_timer > 0:
+            hint = _get_hint_surface()
+            box_x = self.x + self.width // 2 - hint.get_width() // 2
+            box_y = self.y - 15 - _HINT_PADDING
+            blits.append((hint, (box_x, box_y)))
+
     def render(self, surface):
         """
         Render the owl and any hint text
@@ -175,27 +257,13 @@ class Owl(NPC):
 
         # Render hint text if active
         if self.show_hint and self.hint_timer > 0:
-            pygame.font.init()
-            font = pygame.font.Font(None, 12)
-            hint_text = font.render("Song of Sleep...", True, COLOR_WHITE)
-
-            # Position text above owl
-            text_x = self.x + self.width // 2 - hint_text.get_width() // 2
-            text_y = self.y - 15
+            hint = _get_hint_surface()
 
-            # Draw background box
-            box_padding = 2
-            box_rect = pygame.Rect(
-                text_x - box_padding,
-                text_y - box_padding,
-                hint_text.get_width() + box_padding * 2,
-                hint_text.get_height() + box_padding * 2
-            )
-            pygame.draw.rect(surface, COLOR_BLACK, box_rect)
-            pygame.draw.rect(surface, COLOR_WHITE, box_rect, 1)
+            # Position box above owl (text sits inside a 2px padding)
+            box_x = self.x + self.width // 2 - hint.get_width() // 2
+            box_y = self.y - 15 - _HINT_PADDING
 
-            # Draw text
-            surface.blit(hint_text, (text_x, text_y))
+            surface.blit(hint, (box_x, box_y))
 
 
 class Cat(NPC):
@@ -209,6 +277,8 @@ class Cat(NPC):
         y: Y position
     """
 
+    __slots__ = ('following', 'target_x', 'target_y', 'speed')
+
     def __init__(self, x, y):
         # Orange cat sprite (12x12, smaller than player)
         super().__init__(x, y, width=12, height=12, color=COLOR_ORANGE)
@@ -219,29 +289,32 @@ class Cat(NPC):
         self.target_y = y
         self.speed = 1.5
 
-        # Create a simple cat sprite
-        self._create_cat_sprite()
+        # Create a simple cat sprite (shared by all cats)
+        self.sprite = get_sprite(('cat',), self._create_cat_sprite)
 
     def _create_cat_sprite(self):
-        """Create a simple pixelated cat sprite"""
-        self.sprite.fill(COLOR_BLACK)  # Start with black background
+        """Build a simple pixelated cat sprite"""
+        sprite = pygame.Surface((12, 12))
+        sprite.fill(COLOR_BLACK)  # Start with black background
 
         # Draw cat body (orange)
-        pygame.draw.rect(self.sprite, COLOR_ORANGE, (2, 4, 8, 6))
+        pygame.draw.rect(sprite, COLOR_ORANGE, (2, 4, 8, 6))
 
         # Draw cat head (orange)
-        pygame.draw.rect(self.sprite, COLOR_ORANGE, (3, 1, 6, 5))
+        pygame.draw.rect(sprite, COLOR_ORANGE, (3, 1, 6, 5))
 
         # Draw ears (orange)
-        pygame.draw.rect(self.sprite, COLOR_ORANGE, (2, 0, 2, 2))
-        pygame.draw.rect(self.sprite, COLOR_ORANGE, (8, 0, 2, 2))
+        pygame.draw.rect(sprite, COLOR_ORANGE, (2, 0, 2, 2))
+        pygame.draw.rect(sprite, COLOR_ORANGE, (8, 0, 2, 2))
 
         # Draw eyes (white)
-        self.sprite.set_at((4, 2), COLOR_WHITE)
-        self.sprite.set_at((7, 2), COLOR_WHITE)
+        sprite.set_at((4, 2), COLOR_WHITE)
+        sprite.set_at((7, 2), COLOR_WHITE)
 
         # Draw tail (orange)
-        pygame.draw.rect(self.sprite, COLOR_ORANGE, (9, 6, 2, 4))
+        pygame.draw.rect(sprite, COLOR_ORANGE, (9, 6, 2, 4))
+
+        return sprite
 
     def activate_following(self):
         """Activate the cat's following behavior"""
@@ -262,24 +335,12 @@ class Cat(NPC):
             self.target_x = player_x
             self.target_y = player_y
 
-            # Move towards target
-            dx = self.target_x - self.x
-            dy = self.target_y - self.y
-            distance = (dx * dx + dy * dy) ** 0.5
-
-            # Only move if far enough away
-            if distance > 20:
-                if distance > 0:
-                    # Normalize and apply speed
-                    dx = (dx / distance) * self.speed
-                    dy = (dy / distance) * self.speed
-
-                    self.x += dx
-                    self.y += dy
-
-            # Keep cat on screen
-            self.x = max(0, min(NATIVE_WIDTH - self.width, self.x))
-            self.y = max(0, min(NATIVE_HEIGHT - self.height, self.y))
+            # Move towards target (stays put within 20 pixels)
+            x, y = follow_step(self.x, self.y, player_x, player_y, self.speed)
+            if x != self.x or y != self.y:
+                # Keep cat on screen
+                self.x = max(0, min(NATIVE_WIDTH - self.width, x))
+                self.y = max(0, min(NATIVE_HEIGHT - self.height, y))
 
     def set_position(self, x, y):
         """
@@ -293,6 +354,13 @@ class Cat(NPC):
         self.y = y
 
 
+# NPC classes by type
+_NPC_FACTORIES = {
+    NPCType.OWL: Owl,
+    NPCType.CAT: Cat,
+}
+
+
 def create_npc(npc_type, x, y):
     """
     Factory function to create NPCs
@@ -305,9 +373,7 @@ def create_npc(npc_type, x, y):
     Returns:
         NPC instance
     """
-    if npc_type == NPCType.OWL:
-        return Owl(x, y)
-    elif npc_type == NPCType.CAT:
-        return Cat(x, y)
-    else:
+    factory = _NPC_FACTORIES.get(npc_type)
+    if factory is None:
         raise ValueError(f"Unknown NPC type: {npc_type}")
+    return factory(x, y)
@@ -9,11 +9,21 @@ from src.core.constants import (
 )
 
 
+# Movement key bindings (arrow keys and WASD)
+_KEY_LEFT, _KEY_A = pygame.K_LEFT, pygame.K_a
+_KEY_RIGHT, _KEY_D = pygame.K_RIGHT, pygame.K_d
+_KEY_UP, _KEY_W = pygame.K_UP, pygame.K_w
+_KEY_DOWN, _KEY_S = pygame.K_DOWN, pygame.K_s
+
+
 class Player:
     """
     Player entity - 8x8 white square
     """
 
+    __slots__ = ('x', 'y', 'width', 'height', 'speed', '_rect', 'sprite',
+                 'held_item', 'velocity_x', 'velocity_y')
+
     def __init__(self, x: int, y: int):
         """
         Initialize the player
@@ -22,12 +32,17 @@ class Player:
             x: Starting x position
             y: Starting y position
         """
-        self.x = x
-        self.y = y
+        # Position stays in whole pixels: spawn points and PLAYER_SPEED are
+        # integers, so render can blit without converting
+        self.x: int = x
+        self.y: int = y
         self.width = PLAYER_SIZE
         self.height = PLAYER_SIZE
         self.speed = PLAYER_SPEED
 
+        # Bounding rectangle reused by get_rect
+        self._rect = pygame.Rect(self.x, self.y, self.width, self.height)
+
         # Create player sprite (white square)
         self.sprite = pygame.Surface((self.width, self.height))
         self.sprite.fill(COLOR_WHITE)
@@ -45,20 +60,22 @@ class Player:
         Non-inertial movement (instant stop when key released)
         """
         keys = pygame.key.get_pressed()
-
-        # Reset velocity
-        self.velocity_x = 0
-        self.velocity_y = 0
-
-        # WASD and Arrow key controls
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            self.velocity_x = -self.speed
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            self.velocity_x = self.speed
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            self.velocity_y = -self.speed
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            self.velocity_y = self.speed
+        speed = self.speed
+
+        # WASD and Arrow key controls; right/down win over left/up
+        if keys[_KEY_RIGHT] or keys[_KEY_D]:
+            self.velocity_x = speed
+        elif keys[_KEY_LEFT] or keys[_KEY_A]:
+            self.velocity_x = -speed
+        else:
+            self.velocity_x = 0
+
+        if keys[_KEY_DOWN] or keys[_KEY_S]:
+            self.velocity_y = speed
+        elif keys[_KEY_UP] or keys[_KEY_W]:
+            self.velocity_y = -speed
+        else:
+            self.velocity_y = 0
 
     def update(self, current_screen=None):
         """
@@ -75,38 +92,37 @@ class Player:
         self.x += self.velocity_x
         self.y += self.velocity_y
 
-        # Check collision with screen if provided
-        if current_screen is not None:
-            # Check all four corners of the player
-            corners = [
-                (self.x, self.y),  # Top-left
-                (self.x + self.width - 1, self.y),  # Top-right
-                (self.x, self.y + self.height - 1),  # Bottom-left
-                (self.x + self.width - 1, self.y + self.height - 1)  # Bottom-right
-            ]
-
-            # If any corner collides with a solid tile, revert position
-            for corner_x, corner_y in corners:
-                if current_screen.is_tile_solid(corner_x, corner_y):
-                    self.x = old_x
-                    self.y = old_y
-                    break
-
-            # Check collision with solid interactable objects
-            player_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-            for entity in current_screen.entities:
-                if hasattr(entity, 'solid') and entity.solid and hasattr(entity, 'active') and entity.active:
-                    entity_rect = entity.get_rect()
-                    if player_rect.colliderect(entity_rect):
-                        self.x = old_x
-                        self.y = old_y
-                        break
+        # If the new position is blocked, reject the whole move
+        if current_screen is not None and self._is_blocked(current_screen):
+            self.x = old_x
+            self.y = old_y
 
         # Keep player within screen boundaries (allow slightly off-screen for transitions)
         # Extended bounds to allow screen transitions
         self.x = max(-self.width, min(self.x, NATIVE_WIDTH + self.width))
         self.y = max(-self.height, min(self.y, NATIVE_HEIGHT + self.height))
 
+    def _is_blocked(self, current_screen) -> bool:
+        """
+        Check if the player overlaps a wall or a solid object
+
+        Args:
+            current_screen: Current screen for collision detection
+
+        Returns:
+            True if the current position is blocked
+        """
+        if current_screen.is_area_solid(self.x, self.y, self.width, self.height):
+            return True
+
+        # Check collision with solid interactable objects
+        player_rect = self.get_rect()
+        for entity in current_screen.get_solid_entities_near(self.x, self.y,
+                                                             self.width, self.height):
+            if player_rect.colliderect(entity.get_rect()):
+                return True
+        return False
+
     def render(self, surface: pygame.Surface):
         """
         Render the player to the given surface
@@ -114,11 +130,18 @@ class Player:
         Args:
             surface: Surface to render to (should be native resolution)
         """
-        surface.blit(self.sprite, (int(self.x), int(self.y)))
+        surface.blit(self.sprite, (self.x, self.y))
 
     def get_rect(self) -> pygame.Rect:
-        """Get the player's bounding rectangle"""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        """
+        Get the player's bounding rectangle
+
+        The same Rect is returned on every call; callers must not modify it.
+        """
+        rect = self._rect
+        rect.x = self.x
+        rect.y = self.y
+        return rect
 
     def pick_up_item(self, item):
         """
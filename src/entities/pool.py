@@ -0,0 +1,178 @@
+"""
+Entity pools for Ouroboros - Ring of Eternity
+
+Keeps interactables, items and NPCs of a screen in parallel NumPy columns so
+that proximity to the player is computed in one vectorized pass per frame
+instead of one is_near_player call per entity.
+"""
+
+import numpy as np
+from typing import List
+
+from src.entities._fastkernels import proximity_mask
+from src.entities.interactable import Interactable
+from src.entities.item import Item
+from src.entities.npc import NPC
+
+
+class EntityPool:
+    """
+    Struct-of-arrays view over one kind of entity on a screen
+
+    Subclasses set entity_class; _fill_columns copies each member's center
+    and squared range into the columns. A pool is bound to one screen at a time; the screen's
+    add_entity/remove_entity and the pooled entities' position and range
+    setters call invalidate(), and the columns are refilled on the next
+    sync(). Call sync() each frame before querying.
+    """
+
+    entity_class = object
+
+    def __init__(self):
+        """Initialize an empty pool"""
+        self.entities: List = []
+        self.cx = np.zeros(0, dtype=np.float32)
+        self.cy = np.zeros(0, dtype=np.float32)
+        self.range_sq = np.zeros(0, dtype=np.float32)
+        self._mask = np.zeros(0, dtype=np.bool_)
+        self._screen = None
+        self._dirty = True
+
+    def invalidate(self):
+        """Mark the columns stale so the next sync() refills them"""
+        self._dirty = True
+
+    def sync(self, screen):
+        """
+        Bind the pool to a screen and refill the columns if they are stale
+
+        Args:
+            screen: Current screen
+        """
+        if screen is not self._screen:
+            if self._screen is not None:
+                self._screen._pools.remove(self)
+            screen._pools.append(self)
+            self._screen = screen
+            self._dirty = True
+
+        if self._dirty:
+            self._refill()
+
+    def _refill(self):
+        """Rebuild the member list from the bound screen and refill the columns"""
+        for entity in self.entities:
+            if entity._pool is self:
+                entity._pool = None
+
+        members = [e for e in self._screen.entities if isinstance(e, self.entity_class)]
+        for entity in members:
+            entity._pool = self
+        self.entities = members
+
+        # Reuse the column arrays unless the member count changed
+        n = len(members)
+        if n != len(self.cx):
+            self.cx = np.empty(n, dtype=np.float32)
+            self.cy = np.empty(n, dtype=np.float32)
+            self.range_sq = np.empty(n, dtype=np.float32)
+            self._mask = np.empty(n, dtype=np.bool_)
+        self._fill_columns()
+        self._dirty = False
+
+    def _fill_columns(self):
+        """Write the pooled entities' centers and ranges into the columns"""
+        entities = self.entities
+        self.cx[:] = [e.cx for e in entities]
+        self.cy[:] = [e.cy for e in entities]
+        self.range_sq[:] = [e._range_sq for e in entities]
+
+    def query_near(self, px: float, py: float) -> np.ndarray:
+        """
+        Compute which pooled entities are within range of a point
+
+        Args:
+            px: Query center X
+            py: Query center Y
+
+        Returns:
+            Boolean mask aligned with self.entities (reused between calls)
+        """
+        return proximity_mask(self.cx, self.cy, self.range_sq,
+                              float(px), float(py), self._mask)
+
+    def near(self, px: float, py: float) -> list:
+        """
+        Get the pooled entities within range of a point
+
+        Args:
+            px: Query center X
+            py: Query center Y
+
+        Returns:
+            Entities in range, in screen order
+        """
+        entities = self.entities
+        return [entities[i] for i in np.flatnonzero(self.query_near(px, py))]
+
+
+class InteractablePool(EntityPool):
+    """Pool of Interactable objects"""
+
+    entity_class = Interactable
+
+
+class ItemPool(EntityPool):
+    """Pool of Item objects"""
+
+    entity_class = Item
+
+
+class NPCPool(EntityPool):
+    """
+    Pool of NPCs
+
+    The range is passed per query, matching NPC.is_near_player, so the range
+    column is filled at query time rather than from the members.
+    """
+
+    entity_class = NPC
+
+    def _fill_columns(self):
+        """Write the pooled NPCs' centers into the columns"""
+        entities = self.entities
+        self.cx[:] = [e.cx for e in entities]
+        self.cy[:] = [e.cy for e in entities]
+
+    def query_near(self, px: float, py: float, distance: float = 32) -> np.ndarray:
+        """
+        Compute which pooled NPCs are strictly within a distance of a point
+
+        Args:
+            px: Query center X
+            py: Query center Y
+            distance: Distance threshold in pixels
+
+        Returns:
+            Boolean mask aligned with self.entities (reused between calls)
+        """
+        # is_near_player uses a strict <, while the kernel tests <=; the next
+        # float32 below distance**2 gives the same answer for pixel positions
+        self.range_sq.fill(np.nextafter(np.float32(distance * distance), np.float32(0)))
+        return proximity_mask(self.cx, self.cy, self.range_sq,
+                              float(px), float(py), self._mask)
+
+    def near(self, px: float, py: float, distance: float = 32) -> list:
+        """
+        Get the pooled NPCs strictly within a distance of a point
+
+        Args:
+            px: Query center X
+            py: Query center Y
+            distance: Distance threshold in pixels
+
+        Returns:
+            NPCs in range, in screen order
+        """
+        entities = self.entities
+        return [entities[i] for i in np.flatnonzero(self.query_near(px, py, distance))]
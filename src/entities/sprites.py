@@ -0,0 +1,67 @@
+"""
+Sprite helpers for Ouroboros - Ring of Eternity
+"""
+
+import pygame
+
+
+def convert_sprite(sprite: pygame.Surface) -> pygame.Surface:
+    """
+    Convert a sprite to the display's pixel format for fast blitting
+
+    Surfaces created with SRCALPHA keep their per-pixel alpha. Without a
+    display (e.g. in tests) the sprite is returned unchanged.
+
+    Args:
+        sprite: Sprite surface to convert
+
+    Returns:
+        Converted surface, or the original if no display is set
+    """
+    if pygame.display.get_surface() is None:
+        return sprite
+    if sprite.get_flags() & pygame.SRCALPHA:
+        return sprite.convert_alpha()
+    return sprite.convert()
+
+
+# Shared sprites keyed by appearance. Entities that draw on their sprite
+# after construction must copy it first (copy-on-write).
+_SPRITE_CACHE = {}
+
+
+def get_sprite(key, builder) -> pygame.Surface:
+    """
+    Get a shared sprite, building and converting it on first use
+
+    Args:
+        key: Hashable description of the sprite's appearance
+        builder: Callable returning a new Surface for the key
+
+    Returns:
+        Cached sprite surface (must not be drawn on)
+    """
+    sprite = _SPRITE_CACHE.get(key)
+    if sprite is None:
+        sprite = convert_sprite(builder())
+        _SPRITE_CACHE[key] = sprite
+    return sprite
+
+
+def solid_sprite(width: int, height: int, color: tuple) -> pygame.Surface:
+    """
+    Get a shared single-color rectangle sprite
+
+    Args:
+        width: Sprite width
+        height: Sprite height
+        color: Fill color
+
+    Returns:
+        Cached sprite surface (must not be drawn on)
+    """
+    def build():
+        sprite = pygame.Surface((width, height))
+        sprite.fill(color)
+        return sprite
+    return get_sprite(('solid', width, height, color), build)
@@ -5,6 +5,40 @@ CRT scanline effect for retro Atari 2600 aesthetic
 import pygame
 
 
+# Scanline overlays shared by all CRT effects, keyed by
+# (width, height, intensity, step)
+_SCANLINE_CACHE = {}
+
+
+def _get_scanlines(width: int, height: int, intensity: float, step: int) -> pygame.Surface:
+    """
+    Get a scanline overlay, building it on first use
+
+    Args:
+        width: Overlay width
+        height: Overlay height
+        intensity: Scanline darkness (0.0-1.0)
+        step: Vertical distance between scanlines in pixels
+
+    Returns:
+        Surface with scanline pattern
+    """
+    key = (width, height, intensity, step)
+    surface = _SCANLINE_CACHE.get(key)
+    if surface is None:
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+
+        # One strided store into the alpha plane; pixels_alpha is indexed
+        # [x, y], so every step-th row is a slice on axis 1
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        alpha[:, ::step] = int(255 * intensity)
+        del alpha  # Release the surface lock
+
+        _SCANLINE_CACHE[key] = surface
+    return surface
+
+
 class CRTEffect:
     """
     Applies a CRT scanline effect to give the game a retro feel
@@ -33,33 +67,23 @@ class CRTEffect:
         Returns:
             Surface with scanline pattern
         """
-        surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-
-        # Draw horizontal scanlines (every other line)
-        scanline_color = (0, 0, 0, int(255 * self.intensity))
-
-        for y in range(0, self.height, 2):
-            pygame.draw.line(surface, scanline_color, (0, y), (self.width, y), 1)
-
-        return surface
+        # Horizontal scanlines (every other line)
+        return _get_scanlines(self.width, self.height, self.intensity, 2)
 
     def apply(self, surface: pygame.Surface) -> pygame.Surface:
         """
         Apply CRT effect to a surface
 
+        The surface is modified in place.
+
         Args:
             surface: Surface to apply effect to
 
         Returns:
-            Surface with CRT effect applied
+            The same surface, with CRT effect applied
         """
-        # Create copy to avoid modifying original
-        result = surface.copy()
-
-        # Apply scanlines
-        result.blit(self.scanline_surface, (0, 0))
-
-        return result
+        surface.blit(self.scanline_surface, (0, 0))
+        return surface
 
 
 class CRTEffectScaled:
@@ -85,18 +109,10 @@ class CRTEffectScaled:
 
     def _create_scanlines(self) -> pygame.Surface:
         """Create scanline overlay for scaled display"""
-        surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-
         # Scanlines every 3 pixels for that authentic CRT look when scaled
-        scanline_color = (0, 0, 0, int(255 * self.intensity))
-
-        for y in range(0, self.height, 3):
-            pygame.draw.line(surface, scanline_color, (0, y), (self.width, y), 1)
-
-        return surface
+        return _get_scanlines(self.width, self.height, self.intensity, 3)
 
     def apply(self, surface: pygame.Surface) -> pygame.Surface:
-        """Apply CRT effect to scaled surface"""
-        result = surface.copy()
-        result.blit(self.scanline_surface, (0, 0))
-        return result
+        """Apply CRT effect to scaled surface in place and return it"""
+        surface.blit(self.scanline_surface, (0, 0))
+        return surface
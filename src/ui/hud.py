@@ -4,6 +4,37 @@ HUD (Heads-Up Display) for Ouroboros - Ring of Eternity
 
 import pygame
 from src.core.constants import NATIVE_WIDTH, NATIVE_HEIGHT, COLOR_WHITE, COLOR_BLACK
+from src.entities.sprites import convert_sprite
+
+
+# Default-font instances shared by all UI code, keyed by point size
+_FONTS = {}
+
+
+def get_font(size: int = 12) -> pygame.font.Font:
+    """
+    Get the shared default font at a size, loading it on first use
+
+    Args:
+        size: Font size in points
+
+    Returns:
+        Shared font instance
+    """
+    font = _FONTS.get(size)
+    if font is None:
+        if not _FONTS:
+            pygame.font.init()
+        font = pygame.font.Font(None, size)
+        _FONTS[size] = font
+    return font
+
+
+# Padding between a HUD box's border and its text
+_BOX_PADDING = 2
+
+# Maximum number of cached HUD boxes before the cache is reset
+_BOX_CACHE_SIZE = 64
 
 
 class HUD:
@@ -13,9 +44,35 @@ class HUD:
 
     def __init__(self):
         """Initialize the HUD"""
-        # Initialize pygame font (use default system font)
-        pygame.font.init()
-        self.font = pygame.font.Font(None, 12)  # Small pixel font
+        self.font = get_font(12)  # Small pixel font
+
+        # Boxed text surfaces keyed by their text; HUD text rarely changes
+        self._box_cache = {}
+
+    def _get_box(self, text: str) -> pygame.Surface:
+        """
+        Get a bordered text box, rendering it on first use
+
+        Args:
+            text: Text to show in the box
+
+        Returns:
+            Cached box surface
+        """
+        box = self._box_cache.get(text)
+        if box is None:
+            rendered = self.font.render(text, True, COLOR_WHITE)
+            box = pygame.Surface((rendered.get_width() + _BOX_PADDING * 2,
+                                  rendered.get_height() + _BOX_PADDING * 2))
+            box.fill(COLOR_BLACK)
+            pygame.draw.rect(box, COLOR_WHITE, box.get_rect(), 1)  # Border
+            box.blit(rendered, (_BOX_PADDING, _BOX_PADDING))
+            box = convert_sprite(box)
+
+            if len(self._box_cache) >= _BOX_CACHE_SIZE:
+                self._box_cache.clear()
+            self._box_cache[text] = box
+        return box
 
     def render(self, surface: pygame.Surface, player, crystals_placed=None):
         """
@@ -29,38 +86,10 @@ class HUD:
         # Display crystal count in top-right corner
         if crystals_placed is not None:
             crystal_count = sum(1 for placed in crystals_placed.values() if placed)
-            text = self.font.render(f"Crystals: {crystal_count}/4", True, COLOR_WHITE)
-
-            # Draw in top-right
-            padding = 2
-            box_width = text.get_width() + padding * 2
-            box_height = text.get_height() + padding * 2
-            box_x = NATIVE_WIDTH - box_width - 2
-            box_rect = pygame.Rect(box_x, 2, box_width, box_height)
-
-            pygame.draw.rect(surface, COLOR_BLACK, box_rect)
-            pygame.draw.rect(surface, COLOR_WHITE, box_rect, 1)  # Border
-            surface.blit(text, (box_x + padding, 2 + padding))
+            box = self._get_box(f"Crystals: {crystal_count}/4")
+            surface.blit(box, (NATIVE_WIDTH - box.get_width() - 2, 2))
 
         # Display held item in bottom-left corner
         if player.has_item():
-            item = player.held_item
-            item_name = item.get_name()
-
-            # Create text surface
-            text = self.font.render(f"Holding: {item_name}", True, COLOR_WHITE)
-
-            # Draw background box
-            padding = 2
-            box_width = text.get_width() + padding * 2
-            box_height = text.get_height() + padding * 2
-            box_rect = pygame.Rect(2, NATIVE_HEIGHT - box_height - 2, box_width, box_height)
-
-            pygame.draw.rect(surface, COLOR_BLACK, box_rect)
-            pygame.draw.rect(surface, COLOR_WHITE, box_rect, 1)  # Border
-
-            # Draw text
-            surface.blit(text, (4, NATIVE_HEIGHT - box_height))
-
-            # Draw item sprite preview next to player if held
-            # (Small indicator that shows what's being carried)
+            box = self._get_box(f"Holding: {player.held_item.get_name()}")
+            surface.blit(box, (2, NATIVE_HEIGHT - box.get_height() - 2))
@@ -3,69 +3,163 @@ Simple particle system for visual effects
 """
 
 import pygame
-import random
-from typing import List
+import numpy as np
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
-class Particle:
-    """Single particle in a particle system"""
 
-    def __init__(self, x: float, y: float, vx: float, vy: float, color: tuple, lifetime: int):
-        """
-        Initialize a particle
+# Particles preallocated per system; the buffers double when exceeded
+_INITIAL_CAPACITY = 1024
 
-        Args:
-            x, y: Starting position
-            vx, vy: Velocity
-            color: RGB color tuple
-            lifetime: Frames until particle dies
-        """
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.color = color
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.alive = True
+# Downward acceleration applied each frame
+GRAVITY = 0.1
 
-    def update(self):
-        """Update particle physics"""
-        if not self.alive:
-            return
+# Pixel offsets of a particle's 2x2 square; the first is its 1x1 pixel
+_SQUARE_DX = np.array([0, 1, 0, 1], dtype=np.intp)
+_SQUARE_DY = np.array([0, 0, 1, 1], dtype=np.intp)
 
-        # Move particle
-        self.x += self.vx
-        self.y += self.vy
 
-        # Apply gravity (optional)
-        self.vy += 0.1
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _step_particles(x, y, vx, vy, lifetime, max_lifetime, color, n):
+        """
+        Advance particles one frame and compact the survivors in place
 
-        # Decrease lifetime
-        self.lifetime -= 1
-        if self.lifetime <= 0:
-            self.alive = False
+        Moving, gravity, aging and removal are fused into one pass.
 
-    def render(self, surface: pygame.Surface):
-        """Render particle"""
-        if not self.alive:
-            return
+        Args:
+            x, y, vx, vy, lifetime, max_lifetime, color: Particle columns
+            n: Number of live particles
 
-        # Fade out as lifetime decreases
-        alpha = int(255 * (self.lifetime / self.max_lifetime))
-        color_with_alpha = (*self.color, alpha)
+        Returns:
+            New number of live particles
+        """
+        write = 0
+        for i in range(n):
+            remaining = lifetime[i] - 1
+            if remaining > 0:
+                x[write] = x[i] + vx[i]
+                y[write] = y[i] + vy[i]
+                vx[write] = vx[i]
+                vy[write] = vy[i] + GRAVITY
+                lifetime[write] = remaining
+                max_lifetime[write] = max_lifetime[i]
+                color[write, 0] = color[i, 0]
+                color[write, 1] = color[i, 1]
+                color[write, 2] = color[i, 2]
+                write += 1
+        return write
+else:
+    def _step_particles(x, y, vx, vy, lifetime, max_lifetime, color, n):
+        """
+        Advance particles one frame and compact the survivors in place
 
-        # Draw as small square (1-2 pixels)
-        size = 2 if self.lifetime > self.max_lifetime / 2 else 1
-        pygame.draw.rect(surface, self.color, (int(self.x), int(self.y), size, size))
+        Args:
+            x, y, vx, vy, lifetime, max_lifetime, color: Particle columns
+            n: Number of live particles
+
+        Returns:
+            New number of live particles
+        """
+        x[:n] += vx[:n]
+        y[:n] += vy[:n]
+        vy[:n] += GRAVITY
+        lifetime[:n] -= 1
+
+        # Remove dead particles, keeping survivors in order. Most frames
+        # nothing expires, so check that before building an index.
+        if lifetime[:n].min() > 0:
+            return n
+        survivors = np.flatnonzero(lifetime[:n] > 0)
+        for column in (x, y, vx, vy, lifetime, max_lifetime, color):
+            column[:len(survivors)] = column[survivors]
+        return len(survivors)
 
 
 class ParticleSystem:
-    """Manages multiple particle effects"""
+    """
+    Manages multiple particle effects
+
+    Particles are stored as parallel NumPy columns (structure of arrays).
+    Only the first self.count slots are live; update() compacts dead
+    particles away while keeping the survivors in spawn order.
+    """
+
+    _COLUMNS = ('x', 'y', 'vx', 'vy', 'lifetime', 'max_lifetime', 'color')
 
     def __init__(self):
         """Initialize particle system"""
-        self.particles: List[Particle] = []
+        self.count = 0
+        self.x = np.zeros(_INITIAL_CAPACITY, dtype=np.float32)
+        self.y = np.zeros(_INITIAL_CAPACITY, dtype=np.float32)
+        self.vx = np.zeros(_INITIAL_CAPACITY, dtype=np.float32)
+        self.vy = np.zeros(_INITIAL_CAPACITY, dtype=np.float32)
+        self.lifetime = np.zeros(_INITIAL_CAPACITY, dtype=np.int16)
+        self.max_lifetime = np.zeros(_INITIAL_CAPACITY, dtype=np.int16)
+        self.color = np.zeros((_INITIAL_CAPACITY, 3), dtype=np.uint8)
+
+    def _grow(self, needed: int):
+        """
+        Enlarge the column buffers to hold at least needed particles
+
+        Args:
+            needed: Required capacity
+        """
+        capacity = len(self.x)
+        while capacity < needed:
+            capacity *= 2
+        n = self.count
+        for name in self._COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:n] = old[:n]
+            setattr(self, name, new)
+
+    def _spawn(self, x: float, y: float, vx, vy, lifetime, color: tuple):
+        """
+        Append a batch of particles sharing an origin and color
+
+        Args:
+            x, y: Starting position
+            vx, vy: Velocity per particle
+            lifetime: Frames until each particle dies
+            color: RGB color tuple
+        """
+        start = self.count
+        end = start + len(lifetime)
+        if end > len(self.x):
+            self._grow(end)
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = vx
+        self.vy[start:end] = vy
+        self.lifetime[start:end] = lifetime
+        self.max_lifetime[start:end] = lifetime
+        self.color[start:end] = color
+        self.count = end
+
+    def _spawn_radial(self, x: float, y: float, color: tuple, count: int,
+                      min_speed: float, max_speed: float,
+                      min_life: int, max_life: int):
+        """
+        Spawn particles flying out in random directions
+
+        Args:
+            x, y: Origin
+            color: Particle color
+            count: Number of particles
+            min_speed, max_speed: Speed range in pixels per frame
+            min_life, max_life: Inclusive lifetime range in frames
+        """
+        angles = np.random.uniform(0, 2 * np.pi, count)
+        speeds = np.random.uniform(min_speed, max_speed, count)
+        lifetimes = np.random.randint(min_life, max_life + 1, count)
+        self._spawn(x, y, speeds * np.cos(angles), speeds * np.sin(angles),
+                    lifetimes, color)
 
     def add_explosion(self, x: float, y: float, color: tuple = (255, 100, 0), count: int = 12):
         """
@@ -76,17 +170,7 @@ class ParticleSystem:
             color: Particle color
             count: Number of particles
         """
-        for _ in range(count):
-            # Random velocity in all directions
-            angle = random.uniform(0, 2 * 3.14159)
-            speed = random.uniform(0.5, 2.5)
-            vx = speed * pygame.math.Vector2(1, 0).rotate_rad(angle).x
-            vy = speed * pygame.math.Vector2(0, 1).rotate_rad(angle).y
-
-            # Create particle
-            lifetime = random.randint(15, 30)
-            particle = Particle(x, y, vx, vy, color, lifetime)
-            self.particles.append(particle)
+        self._spawn_radial(x, y, color, count, 0.5, 2.5, 15, 30)
 
     def add_sparkle(self, x: float, y: float, color: tuple = (255, 255, 100)):
         """
@@ -96,15 +180,7 @@ class ParticleSystem:
             x, y: Center of sparkle
             color: Particle color
         """
-        for _ in range(6):
-            angle = random.uniform(0, 2 * 3.14159)
-            speed = random.uniform(0.3, 1.0)
-            vx = speed * pygame.math.Vector2(1, 0).rotate_rad(angle).x
-            vy = speed * pygame.math.Vector2(0, 1).rotate_rad(angle).y
-
-            lifetime = random.randint(10, 20)
-            particle = Particle(x, y, vx, vy, color, lifetime)
-            self.particles.append(particle)
+        self._spawn_radial(x, y, color, 6, 0.3, 1.0, 10, 20)
 
     def add_dust(self, x: float, y: float, direction: tuple = (0, -1), color: tuple = (150, 150, 150)):
         """
@@ -115,14 +191,10 @@ class ParticleSystem:
             direction: General direction tuple (vx, vy)
             color: Dust color
         """
-        for _ in range(8):
-            # Add randomness to direction
-            vx = direction[0] + random.uniform(-0.5, 0.5)
-            vy = direction[1] + random.uniform(-0.5, 0.5)
-
-            lifetime = random.randint(20, 40)
-            particle = Particle(x, y, vx, vy, color, lifetime)
-            self.particles.append(particle)
+        # Add randomness to direction
+        vx = direction[0] + np.random.uniform(-0.5, 0.5, 8)
+        vy = direction[1] + np.random.uniform(-0.5, 0.5, 8)
+        self._spawn(x, y, vx, vy, np.random.randint(20, 41, 8), color)
 
     def add_trail(self, x: float, y: float, color: tuple = (200, 200, 255)):
         """
@@ -132,27 +204,54 @@ class ParticleSystem:
             x, y: Position
             color: Trail color
         """
-        for _ in range(3):
-            vx = random.uniform(-0.2, 0.2)
-            vy = random.uniform(-0.2, 0.2)
-            lifetime = random.randint(5, 15)
-            particle = Particle(x, y, vx, vy, color, lifetime)
-            self.particles.append(particle)
+        vx = np.random.uniform(-0.2, 0.2, 3)
+        vy = np.random.uniform(-0.2, 0.2, 3)
+        self._spawn(x, y, vx, vy, np.random.randint(5, 16, 3), color)
 
     def update(self):
         """Update all particles"""
-        # Update all particles
-        for particle in self.particles:
-            particle.update()
+        n = self.count
+        if n == 0:
+            return
 
-        # Remove dead particles
-        self.particles = [p for p in self.particles if p.alive]
+        self.count = _step_particles(self.x, self.y, self.vx, self.vy,
+                                     self.lifetime, self.max_lifetime,
+                                     self.color, n)
 
     def render(self, surface: pygame.Surface):
-        """Render all particles"""
-        for particle in self.particles:
-            particle.render(surface)
+        """
+        Render all particles
+
+        Particles are plotted straight into the surface's pixel array: a
+        2x2 square while in the first half of their lifetime, then a single
+        pixel. Later particles draw over earlier ones.
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        ix = self.x[:n].astype(np.intp)
+        iy = self.y[:n].astype(np.intp)
+        big = self.lifetime[:n] * 2 > self.max_lifetime[:n]
+
+        # Four candidate pixels per particle, flattened in particle order
+        px = (ix[:, None] + _SQUARE_DX).ravel()
+        py = (iy[:, None] + _SQUARE_DY).ravel()
+        keep = np.empty((n, 4), dtype=np.bool_)
+        keep[:, 0] = True
+        keep[:, 1:] = big[:, None]
+        keep = keep.ravel()
+
+        width, height = surface.get_size()
+        keep &= (px >= 0) & (px < width) & (py >= 0) & (py < height)
+
+        # Slot i belongs to particle i // 4, so colors are gathered by
+        # index rather than repeated four times
+        slots = np.flatnonzero(keep)
+        pixels = pygame.surfarray.pixels3d(surface)
+        pixels[px[slots], py[slots]] = self.color[slots >> 2]
+        del pixels  # Release the surface lock
 
     def clear(self):
         """Clear all particles"""
-        self.particles.clear()
+        self.count = 0
@@ -3,8 +3,47 @@ Camera system for screen transitions and viewport management
 """
 
 import pygame
-from src.core.constants import NATIVE_WIDTH, NATIVE_HEIGHT
-from src.world.screen import Direction
+from src.core.constants import NATIVE_WIDTH, NATIVE_HEIGHT, PLAYER_SIZE
+from src.world.screen import Direction, OPPOSITE_DIRECTIONS
+
+
+def _spawn_position(direction: Direction, width: int, height: int) -> tuple:
+    """
+    Compute where an entity of a given size enters a screen
+
+    Args:
+        direction: Direction the entity came from
+        width: Entity width
+        height: Entity height
+
+    Returns:
+        (x, y) spawn position
+    """
+    margin = 8  # Margin from edge
+
+    if direction == Direction.WEST:
+        # Coming from west, spawn on east side
+        return (NATIVE_WIDTH - width - margin,
+                NATIVE_HEIGHT // 2 - height // 2)
+    elif direction == Direction.EAST:
+        # Coming from east, spawn on west side
+        return (margin, NATIVE_HEIGHT // 2 - height // 2)
+    elif direction == Direction.NORTH:
+        # Coming from north, spawn on south side
+        return (NATIVE_WIDTH // 2 - width // 2,
+                NATIVE_HEIGHT - height - margin)
+    elif direction == Direction.SOUTH:
+        # Coming from south, spawn on north side
+        return (NATIVE_WIDTH // 2 - width // 2, margin)
+
+    return (NATIVE_WIDTH // 2, NATIVE_HEIGHT // 2)
+
+
+# Spawn positions for the player's fixed size, one per entry direction
+_PLAYER_SPAWN_POSITIONS = {
+    direction: _spawn_position(direction, PLAYER_SIZE, PLAYER_SIZE)
+    for direction in Direction
+}
 
 
 class Camera:
@@ -94,31 +133,12 @@ class Camera:
         Returns:
             (x, y) spawn position
         """
-        margin = 8  # Margin from edge
-
-        if direction == Direction.WEST:
-            # Coming from west, spawn on east side
-            return (NATIVE_WIDTH - player_width - margin,
-                    NATIVE_HEIGHT // 2 - player_height // 2)
-        elif direction == Direction.EAST:
-            # Coming from east, spawn on west side
-            return (margin, NATIVE_HEIGHT // 2 - player_height // 2)
-        elif direction == Direction.NORTH:
-            # Coming from north, spawn on south side
-            return (NATIVE_WIDTH // 2 - player_width // 2,
-                    NATIVE_HEIGHT - player_height - margin)
-        elif direction == Direction.SOUTH:
-            # Coming from south, spawn on north side
-            return (NATIVE_WIDTH // 2 - player_width // 2, margin)
-
-        return (NATIVE_WIDTH // 2, NATIVE_HEIGHT // 2)
+        if player_width == PLAYER_SIZE and player_height == PLAYER_SIZE:
+            position = _PLAYER_SPAWN_POSITIONS.get(direction)
+            if position is not None:
+                return position
+        return _spawn_position(direction, player_width, player_height)
 
     def get_opposite_direction(self, direction: Direction) -> Direction:
         """Get the opposite direction"""
-        opposites = {
-            Direction.NORTH: Direction.SOUTH,
-            Direction.SOUTH: Direction.NORTH,
-            Direction.EAST: Direction.WEST,
-            Direction.WEST: Direction.EAST
-        }
-        return opposites.get(direction)
+        return OPPOSITE_DIRECTIONS.get(direction)
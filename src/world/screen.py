@@ -3,9 +3,12 @@ Screen/Room system for Ouroboros - Ring of Eternity
 """
 
 import pygame
+import numpy as np
 from enum import Enum, auto
-from typing import Optional, Dict, List
+from typing import Optional, Dict
 from src.core.constants import NATIVE_WIDTH, NATIVE_HEIGHT, COLOR_GRAY, TILE_SIZE
+from src.entities.sprites import convert_sprite
+from src.world.spatial_hash import SpatialHashGrid
 
 
 class ScreenID(Enum):
@@ -40,6 +43,10 @@ class ScreenID(Enum):
     CLIFFS_3 = "cliffs_3"
     CLIFFS_4 = "cliffs_4"
 
+    def __init__(self, *args):
+        # Dense position of the member, used to index World's lookup tables
+        self.index = len(type(self).__members__)
+
 
 class Direction(Enum):
     """Cardinal directions for screen connections"""
@@ -48,12 +55,29 @@ class Direction(Enum):
     EAST = auto()
     WEST = auto()
 
+    def __init__(self, *args):
+        # Dense position of the member, used to index World's lookup tables
+        self.index = len(type(self).__members__)
+
+
+# Direction leading back the way each direction came
+OPPOSITE_DIRECTIONS = {
+    Direction.NORTH: Direction.SOUTH,
+    Direction.SOUTH: Direction.NORTH,
+    Direction.EAST: Direction.WEST,
+    Direction.WEST: Direction.EAST
+}
+
 
 class Screen:
     """
     Represents a single screen/room in the game world
     """
 
+    __slots__ = ('id', 'name', 'background_color', 'connections', 'tiles',
+                 '_row_bits', '_tile_surface', '_tile_dirty', 'entities',
+                 'enemies', '_solid_entities', '_solid_hash', '_solid_hash_dirty', '_pools')
+
     def __init__(self, screen_id: ScreenID, name: str, color: tuple = COLOR_GRAY):
         """
         Initialize a screen
@@ -75,30 +99,57 @@ class Screen:
             Direction.WEST: None
         }
 
-        # Tiles for collision (16x16 grid)
-        # True = solid wall, False = passable
-        self.tiles: List[List[bool]] = []
+        # Tiles for collision (16x16 grid), indexed [row, col]
+        # 1 = solid wall, 0 = passable. Edit through the set_* methods so
+        # the packed row bits below stay in sync.
+        self.tiles: np.ndarray = np.zeros((0, 0), dtype=np.uint8)
+
+        # One int per row with bit n set when column n is solid, so an area
+        # test is one AND per row
+        self._row_bits = []
         self._init_tiles()
 
+        # Pre-rendered wall layer, rebuilt on the next render after a tile edit
+        self._tile_surface: Optional[pygame.Surface] = None
+        self._tile_dirty = True
+
         # Entities on this screen (enemies, items, etc.)
         self.entities = []
 
+        # Enemies among self.entities, kept in step by add_entity/remove_entity
+        self.enemies = []
+
+        # Entities that can block movement (those with a solid flag), kept
+        # in step with self.entities by add_entity/remove_entity
+        self._solid_entities = []
+
+        # Broad-phase index of _solid_entities, rebuilt when it changes
+        self._solid_hash = SpatialHashGrid()
+        self._solid_hash_dirty = False
+
+        # Entity pools bound to this screen, invalidated when entities change
+        self._pools = []
+
     def _init_tiles(self):
         """Initialize the tile grid"""
         rows = NATIVE_HEIGHT // TILE_SIZE  # 12 rows
         cols = NATIVE_WIDTH // TILE_SIZE   # 10 columns
 
         # Create empty grid (all passable)
-        self.tiles = [[False for _ in range(cols)] for _ in range(rows)]
+        self.tiles = np.zeros((rows, cols), dtype=np.uint8)
 
         # Add border walls by default
-        for row in range(rows):
-            self.tiles[row][0] = True  # Left wall
-            self.tiles[row][cols - 1] = True  # Right wall
-
-        for col in range(cols):
-            self.tiles[0][col] = True  # Top wall
-            self.tiles[rows - 1][col] = True  # Bottom wall
+        self.tiles[:, 0] = 1  # Left wall
+        self.tiles[:, cols - 1] = 1  # Right wall
+        self.tiles[0, :] = 1  # Top wall
+        self.tiles[rows - 1, :] = 1  # Bottom wall
+        self._tiles_changed()
+
+    def _tiles_changed(self):
+        """Repack the row bits and schedule a wall layer rebuild"""
+        packed = np.packbits(self.tiles, axis=1, bitorder='little')
+        self._row_bits = [int.from_bytes(row.tobytes(), 'little') for row in packed]
+        self._tile_dirty = True
 
     def connect(self, direction: Direction, screen_id: ScreenID):
         """
@@ -128,14 +179,42 @@ class Screen:
         tile_x = int(x // TILE_SIZE)
         tile_y = int(y // TILE_SIZE)
 
-        rows = len(self.tiles)
-        cols = len(self.tiles[0]) if rows > 0 else 0
+        row_bits = self._row_bits
 
-        if 0 <= tile_y < rows and 0 <= tile_x < cols:
-            return self.tiles[tile_y][tile_x]
+        if 0 <= tile_y < len(row_bits) and 0 <= tile_x < self.tiles.shape[1]:
+            return bool((row_bits[tile_y] >> tile_x) & 1)
 
         return False  # Out of bounds = passable (allows screen transitions)
 
+    def is_area_solid(self, x: float, y: float, width: int, height: int) -> bool:
+        """
+        Check if any solid tile overlaps a pixel rectangle
+
+        Args:
+            x: Left edge in pixels
+            y: Top edge in pixels
+            width: Width in pixels
+            height: Height in pixels
+
+        Returns:
+            True if the rectangle touches a solid tile; the parts outside
+            the grid count as passable
+        """
+        rows, cols = self.tiles.shape
+        tile_x0 = max(int(x // TILE_SIZE), 0)
+        tile_x1 = min(int((x + width - 1) // TILE_SIZE), cols - 1)
+        tile_y0 = max(int(y // TILE_SIZE), 0)
+        tile_y1 = min(int((y + height - 1) // TILE_SIZE), rows - 1)
+
+        if tile_x0 > tile_x1 or tile_y0 > tile_y1:
+            return False
+
+        mask = ((1 << (tile_x1 - tile_x0 + 1)) - 1) << tile_x0
+        for bits in self._row_bits[tile_y0:tile_y1 + 1]:
+            if bits & mask:
+                return True
+        return False
+
     def set_tile_solid(self, tile_x: int, tile_y: int, solid: bool = True):
         """
         Set a tile to be solid or passable
@@ -145,11 +224,120 @@ class Screen:
             tile_y: Y coordinate in tile grid
             solid: True for solid, False for passable
         """
-        rows = len(self.tiles)
-        cols = len(self.tiles[0]) if rows > 0 else 0
+        rows, cols = self.tiles.shape
 
         if 0 <= tile_y < rows and 0 <= tile_x < cols:
-            self.tiles[tile_y][tile_x] = solid
+            self.tiles[tile_y, tile_x] = 1 if solid else 0
+            self._tiles_changed()
+
+    def load_tiles(self, tiles: np.ndarray):
+        """
+        Replace the tile grid with a copy of another grid
+
+        Args:
+            tiles: Grid of the same shape, 1 = solid
+        """
+        self.tiles = np.array(tiles, dtype=np.uint8)
+        self._tiles_changed()
+
+    def set_rect_solid(self, tile_x0: int, tile_y0: int, tile_x1: int, tile_y1: int,
+                       solid: bool = True):
+        """
+        Set a rectangle of tiles to be solid or passable
+
+        Args:
+            tile_x0: Left tile column
+            tile_y0: Top tile row
+            tile_x1: Right tile column (inclusive)
+            tile_y1: Bottom tile row (inclusive)
+            solid: True for solid, False for passable
+        """
+        rows, cols = self.tiles.shape
+        tile_x0 = max(tile_x0, 0)
+        tile_y0 = max(tile_y0, 0)
+        tile_x1 = min(tile_x1, cols - 1)
+        tile_y1 = min(tile_y1, rows - 1)
+
+        if tile_x0 <= tile_x1 and tile_y0 <= tile_y1:
+            self.tiles[tile_y0:tile_y1 + 1, tile_x0:tile_x1 + 1] = 1 if solid else 0
+            self._tiles_changed()
+
+    def add_entity(self, entity):
+        """
+        Add an entity to this screen
+
+        Args:
+            entity: Entity to add
+        """
+        self.entities.append(entity)
+        if hasattr(entity, 'enemy_type'):
+            self.enemies.append(entity)
+        if hasattr(entity, 'solid'):
+            self._solid_entities.append(entity)
+            self._solid_hash_dirty = True
+        for pool in self._pools:
+            pool.invalidate()
+
+    def remove_entity(self, entity):
+        """
+        Remove an entity from this screen
+
+        Args:
+            entity: Entity to remove
+
+        Raises:
+            ValueError: If the entity is not on this screen
+        """
+        self.entities.remove(entity)
+        if entity in self.enemies:
+            self.enemies.remove(entity)
+        if entity in self._solid_entities:
+            self._solid_entities.remove(entity)
+            self._solid_hash_dirty = True
+        for pool in self._pools:
+            pool.invalidate()
+
+    def get_solid_entities_near(self, x: float, y: float, width: int, height: int) -> list:
+        """
+        Get solid, active entities that may overlap a pixel rectangle
+
+        Solid entities do not move, so the spatial hash is rebuilt only when
+        one is added or removed. Their solid/active flags change in place
+        and are checked per query.
+
+        Args:
+            x: Left edge in pixels
+            y: Top edge in pixels
+            width: Width in pixels
+            height: Height in pixels
+
+        Returns:
+            Candidate entities for an exact overlap test
+        """
+        if self._solid_hash_dirty:
+            self._solid_hash.clear()
+            for entity in self._solid_entities:
+                self._solid_hash.insert(entity, entity.x, entity.y,
+                                        entity.width, entity.height)
+            self._solid_hash_dirty = False
+        return [entity for entity in self._solid_hash.query(x, y, width, height)
+                if entity.solid and entity.active]
+
+    def _rebuild_tile_surface(self):
+        """Draw all solid tiles onto a transparent layer for blitting"""
+        layer = pygame.Surface((NATIVE_WIDTH, NATIVE_HEIGHT), pygame.SRCALPHA)
+        layer.fill((0, 0, 0, 0))
+
+        rows, cols = np.nonzero(self.tiles)
+        for row_idx, col_idx in zip(rows.tolist(), cols.tolist()):
+            pygame.draw.rect(
+                layer,
+                (100, 100, 100),  # Gray walls
+                (col_idx * TILE_SIZE, row_idx * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+            )
+
+        self._tile_surface = convert_sprite(layer)
+        self._tile_dirty = False
 
     def render(self, surface: pygame.Surface):
         """
@@ -162,18 +350,20 @@ class Screen:
         surface.fill(self.background_color)
 
         # Render tiles (for debugging, can be replaced with sprites later)
-        for row_idx, row in enumerate(self.tiles):
-            for col_idx, is_solid in enumerate(row):
-                if is_solid:
-                    x = col_idx * TILE_SIZE
-                    y = row_idx * TILE_SIZE
-                    pygame.draw.rect(
-                        surface,
-                        (100, 100, 100),  # Gray walls
-                        (x, y, TILE_SIZE, TILE_SIZE)
-                    )
-
-        # Render entities
+        if self._tile_dirty:
+            self._rebuild_tile_surface()
+        surface.blit(self._tile_surface, (0, 0))
+
+        # Render entities in list order, batching consecutive add_blits
+        # contributions into one Surface.blits call
+        blits = []
         for entity in self.entities:
-            if hasattr(entity, 'render'):
+            if hasattr(entity, 'add_blits'):
+                entity.add_blits(blits)
+            elif hasattr(entity, 'render'):
+                if blits:
+                    surface.blits(blits, doreturn=False)
+                    blits = []
                 entity.render(surface)
+        if blits:
+            surface.blits(blits, doreturn=False)
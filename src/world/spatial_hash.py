@@ -0,0 +1,90 @@
+"""
+Spatial hash grid for Ouroboros - Ring of Eternity
+"""
+
+from typing import Dict, List, Tuple
+from src.core.constants import TILE_SIZE
+
+
+class SpatialHashGrid:
+    """
+    Buckets objects into fixed-size cells by their bounding box
+
+    A query only inspects the cells its rectangle covers, so broad-phase
+    collision checks cost a few dict lookups instead of a scan over every
+    object. Results are candidates; callers still do the exact overlap test.
+    """
+
+    def __init__(self, cell_size: int = TILE_SIZE):
+        """
+        Initialize an empty grid
+
+        Args:
+            cell_size: Cell edge length in pixels
+        """
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List] = {}
+
+    def clear(self):
+        """Remove all objects"""
+        self.cells.clear()
+
+    def _cell_range(self, x: float, y: float, width: int, height: int):
+        """
+        Get the inclusive cell range covered by a rectangle
+
+        Returns:
+            (cell_x0, cell_y0, cell_x1, cell_y1)
+        """
+        cell = self.cell_size
+        return (int(x // cell), int(y // cell),
+                int((x + width - 1) // cell), int((y + height - 1) // cell))
+
+    def insert(self, obj, x: float, y: float, width: int, height: int):
+        """
+        Add an object to every cell its bounding box touches
+
+        Args:
+            obj: Object to store
+            x: Left edge in pixels
+            y: Top edge in pixels
+            width: Width in pixels
+            height: Height in pixels
+        """
+        cell_x0, cell_y0, cell_x1, cell_y1 = self._cell_range(x, y, width, height)
+        cells = self.cells
+        for cell_y in range(cell_y0, cell_y1 + 1):
+            for cell_x in range(cell_x0, cell_x1 + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket is None:
+                    cells[(cell_x, cell_y)] = [obj]
+                else:
+                    bucket.append(obj)
+
+    def query(self, x: float, y: float, width: int, height: int) -> List:
+        """
+        Get the objects sharing a cell with a rectangle
+
+        Args:
+            x: Left edge in pixels
+            y: Top edge in pixels
+            width: Width in pixels
+            height: Height in pixels
+
+        Returns:
+            Candidate objects, each listed once
+        """
+        cell_x0, cell_y0, cell_x1, cell_y1 = self._cell_range(x, y, width, height)
+        cells = self.cells
+        found = []
+        seen = set()
+        for cell_y in range(cell_y0, cell_y1 + 1):
+            for cell_x in range(cell_x0, cell_x1 + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket is None:
+                    continue
+                for obj in bucket:
+                    if id(obj) not in seen:
+                        seen.add(id(obj))
+                        found.append(obj)
+        return found
@@ -2,204 +2,195 @@
 World manager for Ouroboros - Ring of Eternity
 """
 
-from typing import Dict
-from src.world.screen import Screen, ScreenID, Direction
+import logging
+import numpy as np
+from typing import Dict, List, Optional
+from src.world.screen import Screen, ScreenID, Direction, OPPOSITE_DIRECTIONS
 from src.core.constants import (
     COLOR_BLACK, COLOR_GREEN, COLOR_RED,
     COLOR_BLUE, COLOR_YELLOW, COLOR_GRAY
 )
 
 
+_log = logging.getLogger(__name__)
+
+# Region background colors
+_EARTH_COLOR = (40, 50, 30)  # Dark greenish
+_FIRE_COLOR = (40, 20, 20)  # Dark reddish
+_WATER_COLOR = (20, 30, 50)  # Dark bluish
+_AIR_COLOR = (50, 50, 40)  # Grayish-yellow
+_FINAL_COLOR = (10, 10, 20)  # Very dark blue
+
+# (id, display name, background color) for every screen
+_SCREEN_DEFS = (
+    # Hub - Tower
+    (ScreenID.TOWER_HUB, "The Ouroboros Tower", COLOR_GRAY),
+
+    # North - Withered Gardens (Earth - Green tones)
+    (ScreenID.GARDENS_1, "Withered Gardens - Entrance", _EARTH_COLOR),
+    (ScreenID.GARDENS_2, "Withered Gardens - Acorn Grove", _EARTH_COLOR),
+    (ScreenID.GARDENS_3, "Withered Gardens - Soft Dirt", _EARTH_COLOR),
+    (ScreenID.GARDENS_4, "Withered Gardens - Hollow Tree", _EARTH_COLOR),
+
+    # East - Catacombs (Fire/Dark - Red/black tones)
+    (ScreenID.CATACOMBS_1, "Catacombs - Gold Gate", _FIRE_COLOR),
+    (ScreenID.CATACOMBS_2, "Catacombs - Bomb Chamber", _FIRE_COLOR),
+    (ScreenID.CATACOMBS_3, "Catacombs - Ogre's Lair", _FIRE_COLOR),
+    (ScreenID.CATACOMBS_4, "Catacombs - Cracked Wall", _FIRE_COLOR),
+
+    # South - Sunken Ruins (Water - Blue tones)
+    (ScreenID.RUINS_1, "Sunken Ruins - Entrance", _WATER_COLOR),
+    (ScreenID.RUINS_2, "Sunken Ruins - Maze", _WATER_COLOR),
+    (ScreenID.RUINS_3, "Sunken Ruins - Toxic Basin", _WATER_COLOR),
+    (ScreenID.RUINS_4, "Sunken Ruins - Blessed Spring", _WATER_COLOR),
+
+    # West - High Cliffs (Air - Light/yellow tones)
+    (ScreenID.CLIFFS_1, "High Cliffs - Sheet Music", _AIR_COLOR),
+    (ScreenID.CLIFFS_2, "High Cliffs - Flute Chamber", _AIR_COLOR),
+    (ScreenID.CLIFFS_3, "High Cliffs - Ascent", _AIR_COLOR),
+    (ScreenID.CLIFFS_4, "High Cliffs - Sleepless Statue", _AIR_COLOR),
+
+    # Final Chamber (behind Silver Gate) - Dark/mysterious
+    (ScreenID.FINAL_CHAMBER, "The Final Chamber", _FINAL_COLOR),
+)
+
+
+# (from, direction, to) for every connection; the way back is implied
+_CONNECTIONS = (
+    # Hub connections (center of the web)
+    (ScreenID.TOWER_HUB, Direction.NORTH, ScreenID.GARDENS_1),
+    (ScreenID.TOWER_HUB, Direction.EAST, ScreenID.CATACOMBS_1),
+    (ScreenID.TOWER_HUB, Direction.SOUTH, ScreenID.RUINS_1),
+    (ScreenID.TOWER_HUB, Direction.WEST, ScreenID.CLIFFS_1),
+
+    # North - Gardens chain
+    (ScreenID.GARDENS_1, Direction.NORTH, ScreenID.GARDENS_2),
+    (ScreenID.GARDENS_2, Direction.WEST, ScreenID.GARDENS_3),
+    (ScreenID.GARDENS_3, Direction.NORTH, ScreenID.GARDENS_4),
+
+    # East - Catacombs chain
+    (ScreenID.CATACOMBS_1, Direction.EAST, ScreenID.CATACOMBS_2),
+    (ScreenID.CATACOMBS_2, Direction.NORTH, ScreenID.CATACOMBS_3),
+    (ScreenID.CATACOMBS_3, Direction.EAST, ScreenID.CATACOMBS_4),
+
+    # South - Ruins chain
+    (ScreenID.RUINS_1, Direction.SOUTH, ScreenID.RUINS_2),
+    (ScreenID.RUINS_2, Direction.EAST, ScreenID.RUINS_3),
+    (ScreenID.RUINS_3, Direction.SOUTH, ScreenID.RUINS_4),
+
+    # West - Cliffs chain
+    (ScreenID.CLIFFS_1, Direction.WEST, ScreenID.CLIFFS_2),
+    (ScreenID.CLIFFS_2, Direction.SOUTH, ScreenID.CLIFFS_3),
+    (ScreenID.CLIFFS_3, Direction.WEST, ScreenID.CLIFFS_4),
+)
+
+
+# Row length of World._neighbors
+_DIRECTION_COUNT = len(Direction)
+
+# Finished tile grids per screen, filled in by the first World built
+_TILE_TEMPLATES: Dict[ScreenID, np.ndarray] = {}
+
+
 class World:
     """
     Manages all screens and world layout
     """
 
+    __slots__ = ('screens', '_neighbors', '_current_screen')
+
     def __init__(self):
         """Initialize the world"""
-        self.screens: Dict[ScreenID, Screen] = {}
-        self.current_screen_id = ScreenID.TOWER_HUB
+        self.screens: List[Screen] = []
+
+        # Neighbor of each screen, at screen.index * _DIRECTION_COUNT + direction.index
+        self._neighbors: List[Optional[Screen]] = []
 
         # Build the world
         self._create_screens()
+        self.current_screen_id = ScreenID.TOWER_HUB
         self._connect_screens()
+        self._add_tiles()
+
+    def _add_tiles(self):
+        """
+        Give every screen its wall tiles
+
+        The first World builds the layouts and keeps a read-only copy of
+        each grid; later worlds (e.g. after a restart) copy those instead.
+        """
+        if _TILE_TEMPLATES:
+            for screen in self.screens:
+                screen.load_tiles(_TILE_TEMPLATES[screen.id])
+            return
+
         self._add_exit_gaps()  # Add gaps in walls for exits
         self._add_room_layouts()
+        for screen in self.screens:
+            template = screen.tiles.copy()
+            template.flags.writeable = False
+            _TILE_TEMPLATES[screen.id] = template
 
     def _create_screens(self):
-        """Create all 24 screens"""
-        # Hub - Tower
-        self.screens[ScreenID.TOWER_HUB] = Screen(
-            ScreenID.TOWER_HUB,
-            "The Ouroboros Tower",
-            COLOR_GRAY
-        )
-
-        # North - Withered Gardens (Earth - Green tones)
-        earth_color = (40, 50, 30)  # Dark greenish
-        self.screens[ScreenID.GARDENS_1] = Screen(
-            ScreenID.GARDENS_1,
-            "Withered Gardens - Entrance",
-            earth_color
-        )
-        self.screens[ScreenID.GARDENS_2] = Screen(
-            ScreenID.GARDENS_2,
-            "Withered Gardens - Acorn Grove",
-            earth_color
-        )
-        self.screens[ScreenID.GARDENS_3] = Screen(
-            ScreenID.GARDENS_3,
-            "Withered Gardens - Soft Dirt",
-            earth_color
-        )
-        self.screens[ScreenID.GARDENS_4] = Screen(
-            ScreenID.GARDENS_4,
-            "Withered Gardens - Hollow Tree",
-            earth_color
-        )
-
-        # East - Catacombs (Fire/Dark - Red/black tones)
-        fire_color = (40, 20, 20)  # Dark reddish
-        self.screens[ScreenID.CATACOMBS_1] = Screen(
-            ScreenID.CATACOMBS_1,
-            "Catacombs - Gold Gate",
-            fire_color
-        )
-        self.screens[ScreenID.CATACOMBS_2] = Screen(
-            ScreenID.CATACOMBS_2,
-            "Catacombs - Bomb Chamber",
-            fire_color
-        )
-        self.screens[ScreenID.CATACOMBS_3] = Screen(
-            ScreenID.CATACOMBS_3,
-            "Catacombs - Ogre's Lair",
-            fire_color
-        )
-        self.screens[ScreenID.CATACOMBS_4] = Screen(
-            ScreenID.CATACOMBS_4,
-            "Catacombs - Cracked Wall",
-            fire_color
-        )
-
-        # South - Sunken Ruins (Water - Blue tones)
-        water_color = (20, 30, 50)  # Dark bluish
-        self.screens[ScreenID.RUINS_1] = Screen(
-            ScreenID.RUINS_1,
-            "Sunken Ruins - Entrance",
-            water_color
-        )
-        self.screens[ScreenID.RUINS_2] = Screen(
-            ScreenID.RUINS_2,
-            "Sunken Ruins - Maze",
-            water_color
-        )
-        self.screens[ScreenID.RUINS_3] = Screen(
-            ScreenID.RUINS_3,
-            "Sunken Ruins - Toxic Basin",
-            water_color
-        )
-        self.screens[ScreenID.RUINS_4] = Screen(
-            ScreenID.RUINS_4,
-            "Sunken Ruins - Blessed Spring",
-            water_color
-        )
-
-        # West - High Cliffs (Air - Light/yellow tones)
-        air_color = (50, 50, 40)  # Grayish-yellow
-        self.screens[ScreenID.CLIFFS_1] = Screen(
-            ScreenID.CLIFFS_1,
-            "High Cliffs - Sheet Music",
-            air_color
-        )
-        self.screens[ScreenID.CLIFFS_2] = Screen(
-            ScreenID.CLIFFS_2,
-            "High Cliffs - Flute Chamber",
-            air_color
-        )
-        self.screens[ScreenID.CLIFFS_3] = Screen(
-            ScreenID.CLIFFS_3,
-            "High Cliffs - Ascent",
-            air_color
-        )
-        self.screens[ScreenID.CLIFFS_4] = Screen(
-            ScreenID.CLIFFS_4,
-            "High Cliffs - Sleepless Statue",
-            air_color
-        )
-
-        # Final Chamber (behind Silver Gate) - Dark/mysterious
-        final_color = (10, 10, 20)  # Very dark blue
-        self.screens[ScreenID.FINAL_CHAMBER] = Screen(
-            ScreenID.FINAL_CHAMBER,
-            "The Final Chamber",
-            final_color
-        )
+        """Create all screens from the screen table, indexed by ScreenID.index"""
+        self.screens = [None] * len(ScreenID)
+        for screen_id, name, color in _SCREEN_DEFS:
+            self.screens[screen_id.index] = Screen(screen_id, name, color)
 
     def _add_room_layouts(self):
         """Add detailed wall layouts to each room for visual interest and challenge"""
         # Tower Hub - Four pillars in corners + central area
-        hub = self.screens[ScreenID.TOWER_HUB]
+        hub = self.screens[ScreenID.TOWER_HUB.index]
         # Corner pillars (2x2 tiles each)
         for px, py in [(1, 1), (7, 1), (1, 9), (7, 9)]:
-            hub.set_tile_solid(px, py, True)
-            hub.set_tile_solid(px+1, py, True)
-            hub.set_tile_solid(px, py+1, True)
-            hub.set_tile_solid(px+1, py+1, True)
+            hub.set_rect_solid(px, py, px + 1, py + 1)
 
         # Gardens 1 - Entrance with side bushes
-        g1 = self.screens[ScreenID.GARDENS_1]
+        g1 = self.screens[ScreenID.GARDENS_1.index]
         # Side obstacles
-        for y in range(2, 5):
-            g1.set_tile_solid(2, y, True)
-            g1.set_tile_solid(7, y, True)
+        g1.set_rect_solid(2, 2, 2, 4)
+        g1.set_rect_solid(7, 2, 7, 4)
 
         # Gardens 2 - Open area with scattered obstacles
-        g2 = self.screens[ScreenID.GARDENS_2]
+        g2 = self.screens[ScreenID.GARDENS_2.index]
         g2.set_tile_solid(3, 4, True)
         g2.set_tile_solid(6, 7, True)
         g2.set_tile_solid(4, 9, True)
 
         # Gardens 3 - Path with obstacles (chasm puzzle area)
-        g3 = self.screens[ScreenID.GARDENS_3]
+        g3 = self.screens[ScreenID.GARDENS_3.index]
         # L-shaped wall
-        for x in range(2, 5):
-            g3.set_tile_solid(x, 3, True)
-        for y in range(3, 7):
-            g3.set_tile_solid(4, y, True)
+        g3.set_rect_solid(2, 3, 4, 3)
+        g3.set_rect_solid(4, 3, 4, 6)
 
         # Gardens 4 - Narrow passages leading to tree
-        g4 = self.screens[ScreenID.GARDENS_4]
-        for y in range(1, 6):
-            g4.set_tile_solid(3, y, True)
-        for y in range(7, 11):
-            g4.set_tile_solid(6, y, True)
+        g4 = self.screens[ScreenID.GARDENS_4.index]
+        g4.set_rect_solid(3, 1, 3, 5)
+        g4.set_rect_solid(6, 7, 6, 10)
 
         # Catacombs 1 - Narrow entrance corridor
-        c1 = self.screens[ScreenID.CATACOMBS_1]
+        c1 = self.screens[ScreenID.CATACOMBS_1.index]
         # Side walls creating corridor
-        for y in range(1, 8):
-            c1.set_tile_solid(3, y, True)
-            c1.set_tile_solid(6, y, True)
+        c1.set_rect_solid(3, 1, 3, 7)
+        c1.set_rect_solid(6, 1, 6, 7)
 
         # Catacombs 2 - Chamber with pillars
-        c2 = self.screens[ScreenID.CATACOMBS_2]
+        c2 = self.screens[ScreenID.CATACOMBS_2.index]
         c2.set_tile_solid(3, 4, True)
         c2.set_tile_solid(6, 4, True)
         c2.set_tile_solid(3, 8, True)
         c2.set_tile_solid(6, 8, True)
 
         # Catacombs 3 - Ogre's lair with alcoves
-        c3 = self.screens[ScreenID.CATACOMBS_3]
+        c3 = self.screens[ScreenID.CATACOMBS_3.index]
         # Create alcoves
-        for x in range(1, 3):
-            c3.set_tile_solid(x, 4, True)
-            c3.set_tile_solid(x, 8, True)
-        for x in range(7, 9):
-            c3.set_tile_solid(x, 4, True)
-            c3.set_tile_solid(x, 8, True)
+        c3.set_rect_solid(1, 4, 2, 4)
+        c3.set_rect_solid(1, 8, 2, 8)
+        c3.set_rect_solid(7, 4, 8, 4)
+        c3.set_rect_solid(7, 8, 8, 8)
 
         # Catacombs 4 - Cracked wall room with obstacles
-        c4 = self.screens[ScreenID.CATACOMBS_4]
+        c4 = self.screens[ScreenID.CATACOMBS_4.index]
         # Scattered rubble
         c4.set_tile_solid(2, 3, True)
         c4.set_tile_solid(7, 3, True)
@@ -207,55 +198,45 @@ class World:
         c4.set_tile_solid(7, 9, True)
 
         # Ruins 1 - Flooded entrance
-        r1 = self.screens[ScreenID.RUINS_1]
+        r1 = self.screens[ScreenID.RUINS_1.index]
         # Broken walls
-        for x in range(2, 4):
-            r1.set_tile_solid(x, 5, True)
-        for x in range(6, 8):
-            r1.set_tile_solid(x, 7, True)
+        r1.set_rect_solid(2, 5, 3, 5)
+        r1.set_rect_solid(6, 7, 7, 7)
 
         # Ruins 2 - Maze layout
-        r2 = self.screens[ScreenID.RUINS_2]
+        r2 = self.screens[ScreenID.RUINS_2.index]
         # Create maze walls
-        for y in range(2, 7):
-            r2.set_tile_solid(3, y, True)
-        for x in range(5, 8):
-            r2.set_tile_solid(x, 5, True)
-        r2.set_tile_solid(5, 8, True)
-        r2.set_tile_solid(5, 9, True)
+        r2.set_rect_solid(3, 2, 3, 6)
+        r2.set_rect_solid(5, 5, 7, 5)
+        r2.set_rect_solid(5, 8, 5, 9)
 
         # Ruins 3 - Toxic basin room with careful paths
-        r3 = self.screens[ScreenID.RUINS_3]
+        r3 = self.screens[ScreenID.RUINS_3.index]
         # Narrow paths around basin
-        for x in range(2, 4):
-            r3.set_tile_solid(x, 3, True)
-        for x in range(6, 8):
-            r3.set_tile_solid(x, 3, True)
+        r3.set_rect_solid(2, 3, 3, 3)
+        r3.set_rect_solid(6, 3, 7, 3)
 
         # Ruins 4 - Blessed Spring chamber
-        r4 = self.screens[ScreenID.RUINS_4]
+        r4 = self.screens[ScreenID.RUINS_4.index]
         # Pool edges
-        for x in range(4, 7):
-            r4.set_tile_solid(x, 4, True)
-            r4.set_tile_solid(x, 9, True)
+        r4.set_rect_solid(4, 4, 6, 4)
+        r4.set_rect_solid(4, 9, 6, 9)
 
         # Cliffs 1 - Windy entrance
-        cl1 = self.screens[ScreenID.CLIFFS_1]
+        cl1 = self.screens[ScreenID.CLIFFS_1.index]
         # Scattered rocks
         cl1.set_tile_solid(2, 4, True)
         cl1.set_tile_solid(7, 6, True)
         cl1.set_tile_solid(4, 9, True)
 
         # Cliffs 2 - Flute chamber with platforms
-        cl2 = self.screens[ScreenID.CLIFFS_2]
+        cl2 = self.screens[ScreenID.CLIFFS_2.index]
         # Platform-like obstacles
-        for x in range(2, 4):
-            cl2.set_tile_solid(x, 3, True)
-        for x in range(6, 8):
-            cl2.set_tile_solid(x, 8, True)
+        cl2.set_rect_solid(2, 3, 3, 3)
+        cl2.set_rect_solid(6, 8, 7, 8)
 
         # Cliffs 3 - Ascending platforms
-        cl3 = self.screens[ScreenID.CLIFFS_3]
+        cl3 = self.screens[ScreenID.CLIFFS_3.index]
         # Step-like pattern
         cl3.set_tile_solid(2, 8, True)
         cl3.set_tile_solid(3, 6, True)
@@ -263,14 +244,13 @@ class World:
         cl3.set_tile_solid(7, 2, True)
 
         # Cliffs 4 - Statue chamber
-        cl4 = self.screens[ScreenID.CLIFFS_4]
+        cl4 = self.screens[ScreenID.CLIFFS_4.index]
         # Create a chamber feel
-        for y in range(3, 6):
-            cl4.set_tile_solid(2, y, True)
-            cl4.set_tile_solid(7, y, True)
+        cl4.set_rect_solid(2, 3, 2, 5)
+        cl4.set_rect_solid(7, 3, 7, 5)
 
         # Final Chamber - Boss arena with corner pillars
-        final = self.screens[ScreenID.FINAL_CHAMBER]
+        final = self.screens[ScreenID.FINAL_CHAMBER.index]
         # Just corner markers for dramatic effect
         final.set_tile_solid(2, 2, True)
         final.set_tile_solid(7, 2, True)
@@ -278,61 +258,17 @@ class World:
         final.set_tile_solid(7, 9, True)
 
     def _connect_screens(self):
-        """Set up connections between screens"""
-        # Hub connections (center of the web)
-        hub = self.screens[ScreenID.TOWER_HUB]
-        hub.connect(Direction.NORTH, ScreenID.GARDENS_1)
-        hub.connect(Direction.EAST, ScreenID.CATACOMBS_1)
-        hub.connect(Direction.SOUTH, ScreenID.RUINS_1)
-        hub.connect(Direction.WEST, ScreenID.CLIFFS_1)
-
-        # North - Gardens chain
-        self.screens[ScreenID.GARDENS_1].connect(Direction.SOUTH, ScreenID.TOWER_HUB)
-        self.screens[ScreenID.GARDENS_1].connect(Direction.NORTH, ScreenID.GARDENS_2)
-
-        self.screens[ScreenID.GARDENS_2].connect(Direction.SOUTH, ScreenID.GARDENS_1)
-        self.screens[ScreenID.GARDENS_2].connect(Direction.WEST, ScreenID.GARDENS_3)
-
-        self.screens[ScreenID.GARDENS_3].connect(Direction.EAST, ScreenID.GARDENS_2)
-        self.screens[ScreenID.GARDENS_3].connect(Direction.NORTH, ScreenID.GARDENS_4)
-
-        self.screens[ScreenID.GARDENS_4].connect(Direction.SOUTH, ScreenID.GARDENS_3)
-
-        # East - Catacombs chain
-        self.screens[ScreenID.CATACOMBS_1].connect(Direction.WEST, ScreenID.TOWER_HUB)
-        self.screens[ScreenID.CATACOMBS_1].connect(Direction.EAST, ScreenID.CATACOMBS_2)
-
-        self.screens[ScreenID.CATACOMBS_2].connect(Direction.WEST, ScreenID.CATACOMBS_1)
-        self.screens[ScreenID.CATACOMBS_2].connect(Direction.NORTH, ScreenID.CATACOMBS_3)
-
-        self.screens[ScreenID.CATACOMBS_3].connect(Direction.SOUTH, ScreenID.CATACOMBS_2)
-        self.screens[ScreenID.CATACOMBS_3].connect(Direction.EAST, ScreenID.CATACOMBS_4)
-
-        self.screens[ScreenID.CATACOMBS_4].connect(Direction.WEST, ScreenID.CATACOMBS_3)
-
-        # South - Ruins chain
-        self.screens[ScreenID.RUINS_1].connect(Direction.NORTH, ScreenID.TOWER_HUB)
-        self.screens[ScreenID.RUINS_1].connect(Direction.SOUTH, ScreenID.RUINS_2)
-
-        self.screens[ScreenID.RUINS_2].connect(Direction.NORTH, ScreenID.RUINS_1)
-        self.screens[ScreenID.RUINS_2].connect(Direction.EAST, ScreenID.RUINS_3)
-
-        self.screens[ScreenID.RUINS_3].connect(Direction.WEST, ScreenID.RUINS_2)
-        self.screens[ScreenID.RUINS_3].connect(Direction.SOUTH, ScreenID.RUINS_4)
-
-        self.screens[ScreenID.RUINS_4].connect(Direction.NORTH, ScreenID.RUINS_3)
-
-        # West - Cliffs chain
-        self.screens[ScreenID.CLIFFS_1].connect(Direction.EAST, ScreenID.TOWER_HUB)
-        self.screens[ScreenID.CLIFFS_1].connect(Direction.WEST, ScreenID.CLIFFS_2)
-
-        self.screens[ScreenID.CLIFFS_2].connect(Direction.EAST, ScreenID.CLIFFS_1)
-        self.screens[ScreenID.CLIFFS_2].connect(Direction.SOUTH, ScreenID.CLIFFS_3)
-
-        self.screens[ScreenID.CLIFFS_3].connect(Direction.NORTH, ScreenID.CLIFFS_2)
-        self.screens[ScreenID.CLIFFS_3].connect(Direction.WEST, ScreenID.CLIFFS_4)
-
-        self.screens[ScreenID.CLIFFS_4].connect(Direction.EAST, ScreenID.CLIFFS_3)
+        """Set up connections between screens, in both directions"""
+        for from_id, direction, to_id in _CONNECTIONS:
+            self.screens[from_id.index].connect(direction, to_id)
+            self.screens[to_id.index].connect(OPPOSITE_DIRECTIONS[direction], from_id)
+
+        self._neighbors = [None] * (len(self.screens) * _DIRECTION_COUNT)
+        for screen in self.screens:
+            base = screen.id.index * _DIRECTION_COUNT
+            for direction, target_id in screen.connections.items():
+                if target_id is not None:
+                    self._neighbors[base + direction.index] = self.screens[target_id.index]
 
     def _add_exit_gaps(self):
         """Create gaps in border walls where there are screen connections"""
@@ -343,7 +279,7 @@ class World:
         cols = NATIVE_WIDTH // 16   # 10 columns
 
         # For each screen, add gaps based on connections
-        for screen_id, screen in self.screens.items():
+        for screen in self.screens:
             # North exit - gap in top wall (row 0, middle columns)
             if screen.get_connection(Direction.NORTH) is not None:
                 screen.set_tile_solid(4, 0, False)  # Center-left
@@ -364,9 +300,18 @@ class World:
                 screen.set_tile_solid(0, 5, False)  # Center-top
                 screen.set_tile_solid(0, 6, False)  # Center-bottom
 
+    @property
+    def current_screen_id(self) -> ScreenID:
+        """ID of the screen the player is on"""
+        return self._current_screen.id
+
+    @current_screen_id.setter
+    def current_screen_id(self, screen_id: ScreenID):
+        self._current_screen = self.screens[screen_id.index]
+
     def get_current_screen(self) -> Screen:
         """Get the current screen"""
-        return self.screens[self.current_screen_id]
+        return self._current_screen
 
     def change_screen(self, direction: Direction) -> bool:
         """
@@ -378,16 +323,16 @@ class World:
         Returns:
             True if screen changed, False if no connection
         """
-        current = self.get_current_screen()
-        next_screen_id = current.get_connection(direction)
+        next_screen = self._neighbors[self._current_screen.id.index * _DIRECTION_COUNT
+                                      + direction.index]
 
-        if next_screen_id is not None:
-            self.current_screen_id = next_screen_id
-            print(f"Moved to: {self.screens[next_screen_id].name}")
+        if next_screen is not None:
+            self._current_screen = next_screen
+            _log.debug("Moved to: %s", next_screen.name)
             return True
 
         return False
 
     def get_screen(self, screen_id: ScreenID) -> Screen:
         """Get a specific screen by ID"""
-        return self.screens.get(screen_id)
+        return self.screens[screen_id.index]
@@ -0,0 +1,63 @@
+"""
+Unit tests for the camera
+
+Tests screen transition helpers.
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.constants import NATIVE_WIDTH, NATIVE_HEIGHT, PLAYER_SIZE
+from src.world.camera import Camera
+from src.world.screen import Direction
+
+
+class TestCameraDirections(unittest.TestCase):
+    """Test direction helpers"""
+
+    def test_opposite_direction(self):
+        """Test that every direction maps to its opposite"""
+        camera = Camera()
+
+        self.assertEqual(camera.get_opposite_direction(Direction.NORTH), Direction.SOUTH)
+        self.assertEqual(camera.get_opposite_direction(Direction.SOUTH), Direction.NORTH)
+        self.assertEqual(camera.get_opposite_direction(Direction.EAST), Direction.WEST)
+        self.assertEqual(camera.get_opposite_direction(Direction.WEST), Direction.EAST)
+        self.assertIsNone(camera.get_opposite_direction(None))
+
+
+class TestSpawnPositions(unittest.TestCase):
+    """Test where the player enters a new screen"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.camera = Camera()
+
+    def test_player_spawns_opposite_the_exit(self):
+        """Test spawn positions for the player's size"""
+        half = PLAYER_SIZE // 2
+        expected = {
+            Direction.WEST: (NATIVE_WIDTH - PLAYER_SIZE - 8, NATIVE_HEIGHT // 2 - half),
+            Direction.EAST: (8, NATIVE_HEIGHT // 2 - half),
+            Direction.NORTH: (NATIVE_WIDTH // 2 - half, NATIVE_HEIGHT - PLAYER_SIZE - 8),
+            Direction.SOUTH: (NATIVE_WIDTH // 2 - half, 8),
+        }
+        for direction, position in expected.items():
+            self.assertEqual(
+                self.camera.get_player_spawn_position(direction, PLAYER_SIZE, PLAYER_SIZE),
+                position)
+
+    def test_other_sizes_and_no_direction(self):
+        """Test that non-player sizes and a missing direction are computed"""
+        self.assertEqual(self.camera.get_player_spawn_position(Direction.EAST, 16, 16),
+                         (8, NATIVE_HEIGHT // 2 - 8))
+        self.assertEqual(self.camera.get_player_spawn_position(None, PLAYER_SIZE, PLAYER_SIZE),
+                         (NATIVE_WIDTH // 2, NATIVE_HEIGHT // 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Unit tests for the CRT scanline effect
+
+Tests scanline overlay construction without a display.
+"""
+
+import unittest
+import sys
+import os
+import pygame
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ui.crt_effect import CRTEffect, CRTEffectScaled
+
+
+class TestScanlines(unittest.TestCase):
+    """Test scanline overlay pattern"""
+
+    def test_scanlines_every_other_row(self):
+        """Test that CRTEffect darkens every second row only"""
+        effect = CRTEffect(8, 6, intensity=0.5)
+        overlay = effect.scanline_surface
+
+        self.assertEqual(overlay.get_at((3, 0)), (0, 0, 0, 127))
+        self.assertEqual(overlay.get_at((3, 1)).a, 0)
+        self.assertEqual(overlay.get_at((7, 4)), (0, 0, 0, 127))
+
+    def test_scaled_scanlines_every_third_row(self):
+        """Test that CRTEffectScaled darkens every third row only"""
+        effect = CRTEffectScaled(8, 7, intensity=1.0)
+        overlay = effect.scanline_surface
+
+        rows = [overlay.get_at((0, y)).a for y in range(7)]
+        self.assertEqual(rows, [255, 0, 0, 255, 0, 0, 255])
+
+    def test_overlay_shared_between_effects(self):
+        """Test that identical effects reuse one overlay surface"""
+        first = CRTEffectScaled(16, 16, intensity=0.25)
+        second = CRTEffectScaled(16, 16, intensity=0.25)
+
+        self.assertIs(first.scanline_surface, second.scanline_surface)
+
+
+class TestApply(unittest.TestCase):
+    """Test applying the effect to a frame"""
+
+    def test_apply_darkens_frame_in_place(self):
+        """Test that apply blits onto and returns the given surface"""
+        effect = CRTEffectScaled(6, 6, intensity=1.0)
+        frame = pygame.Surface((6, 6))
+        frame.fill((200, 200, 200))
+
+        result = effect.apply(frame)
+
+        self.assertIs(result, frame)
+        self.assertEqual(frame.get_at((2, 0))[:3], (0, 0, 0))
+        self.assertEqual(frame.get_at((2, 1))[:3], (200, 200, 200))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+Unit tests for enemy AI
+
+Tests enemy movement and projectile behaviour without a display.
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.constants import NATIVE_WIDTH
+from src.entities.enemy import Chaser, Crawler, EnemyManager, Projectile, Sentinel, LOD_STRIDE
+from src.world.screen import Screen, ScreenID
+
+
+class TestProjectile(unittest.TestCase):
+    """Test projectile movement"""
+
+    def test_projectile_moves_towards_target(self):
+        """Test that projectile steps along its heading each update"""
+        projectile = Projectile(10, 10, 110, 10, speed=2.0)
+
+        projectile.update()
+
+        self.assertAlmostEqual(projectile.x, 12.0)
+        self.assertAlmostEqual(projectile.y, 10.0)
+        self.assertTrue(projectile.active)
+
+    def test_projectile_deactivates_out_of_bounds(self):
+        """Test that projectile deactivates once it leaves the screen"""
+        projectile = Projectile(NATIVE_WIDTH - 1, 10, NATIVE_WIDTH + 100, 10, speed=2.0)
+
+        projectile.update()
+
+        self.assertFalse(projectile.active)
+
+    def test_projectile_collides_with_player(self):
+        """Test projectile hit detection against the player box"""
+        projectile = Projectile(50, 50, 100, 50)
+
+        self.assertTrue(projectile.is_colliding_with_player(52, 52, 8, 8))
+        self.assertFalse(projectile.is_colliding_with_player(100, 100, 8, 8))
+
+
+class TestChaser(unittest.TestCase):
+    """Test Chaser line-of-sight chasing"""
+
+    def test_chaser_moves_towards_visible_player(self):
+        """Test that chaser closes distance when it can see the player"""
+        screen = Screen(ScreenID.TOWER_HUB, "Test")
+        chaser = Chaser(40, 40)
+
+        chaser.update(80, 40, screen)
+
+        self.assertTrue(chaser.is_chasing)
+        self.assertAlmostEqual(chaser.x, 40 + chaser.speed)
+        self.assertAlmostEqual(chaser.y, 40)
+
+    def test_chaser_ignores_player_behind_wall(self):
+        """Test that a solid tile between chaser and player blocks the chase"""
+        screen = Screen(ScreenID.TOWER_HUB, "Test")
+        screen.set_tile_solid(4, 2, True)
+        chaser = Chaser(40, 40)
+
+        chaser.update(100, 40, screen)
+
+        self.assertFalse(chaser.is_chasing)
+        self.assertEqual((chaser.x, chaser.y), (40, 40))
+
+
+class TestEnemyManager(unittest.TestCase):
+    """Test reduced-rate updates for distant enemies"""
+
+    def test_far_enemy_updates_every_stride_frames(self):
+        """Test that a distant sentinel moves in larger, less frequent steps"""
+        sentinel = Sentinel(20, 20, [(140, 20)])
+        manager = EnemyManager()
+
+        positions = []
+        for _ in range(LOD_STRIDE):
+            manager.update([sentinel], 140, 180)
+            positions.append(sentinel.x)
+
+        # Only the last frame of the stride moves the sentinel
+        self.assertEqual(positions[:-1], [20] * (LOD_STRIDE - 1))
+        self.assertAlmostEqual(positions[-1], 20 + sentinel.speed * LOD_STRIDE)
+        self.assertEqual(sentinel.speed, 2.0)
+
+    def test_far_crawler_timers_advance_by_stride(self):
+        """Test that a strided crawler update counts down its timers per frame covered"""
+        crawler = Crawler(40, 40)
+        crawler.direction_x = 1
+        crawler.move_timer = 3 * LOD_STRIDE
+        manager = EnemyManager()
+
+        for _ in range(LOD_STRIDE):
+            manager.update([crawler], 140, 180)
+
+        self.assertEqual(crawler.move_timer, 2 * LOD_STRIDE)
+        self.assertAlmostEqual(crawler.x, 40 + crawler.speed * LOD_STRIDE)
+
+        crawler.is_paused = True
+        crawler.pause_timer = 3 * LOD_STRIDE
+        for _ in range(LOD_STRIDE):
+            manager.update([crawler], 140, 180)
+
+        self.assertEqual(crawler.pause_timer, 2 * LOD_STRIDE)
+
+    def test_near_enemy_updates_every_frame(self):
+        """Test that an enemy close to the player is updated each frame"""
+        sentinel = Sentinel(20, 20, [(140, 20)])
+        manager = EnemyManager()
+
+        manager.update([sentinel], 30, 30)
+
+        self.assertAlmostEqual(sentinel.x, 20 + sentinel.speed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,7 +6,7 @@ Tests game initialization, rendering, and state management.
 
 import unittest
 from unittest.mock import Mock, patch, MagicMock
-import pygame
+import numpy as np
 import sys
 import os
 
@@ -14,59 +14,110 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 
-class TestGameInitialization(unittest.TestCase):
-    """Test game initialization"""
+def _fake_surface(size, *args, **kwargs):
+    """Stand-in for pygame.Surface that reports the size it was built with"""
+    surface = MagicMock()
+    surface.get_size.return_value = tuple(size)
+    surface.get_width.return_value = size[0]
+    surface.get_height.return_value = size[1]
+    return surface
 
-    @patch('pygame.display.set_mode')
-    @patch('pygame.init')
-    def test_game_initializes_without_errors(self, mock_init, mock_set_mode):
-        """Test that game initializes without raising errors"""
-        from src.core.game import Game
 
-        mock_display = Mock()
-        mock_set_mode.return_value = mock_display
+# Pygame stand-in so Game can be built without a display, font files or an
+# audio device. Installed only while this module's tests run.
+_pygame = MagicMock()
+_pygame.Surface.side_effect = _fake_surface
+_PYGAME_MODULES = {
+    'pygame': _pygame,
+    'pygame.display': _pygame.display,
+    'pygame.font': _pygame.font,
+    'pygame.mixer': _pygame.mixer,
+    'pygame.sndarray': _pygame.sndarray,
+    'pygame.time': _pygame.time,
+}
+
+# Patches active while this module's tests run; the sys.modules patch comes
+# first so the window setup patches resolve against the stand-in
+_PATCHERS = (
+    patch.dict(sys.modules, _PYGAME_MODULES),
+    patch('pygame.display.set_mode', return_value=Mock()),
+    patch('pygame.init'),
+)
+
+# Game module, imported against the stand-in by setUpModule
+game_module = None
+
+# Game built on first use and shared by every test class
+_shared_game = None
+
+
+def setUpModule():
+    """Install the pygame stand-in and import the game module against it"""
+    global game_module
+    for patcher in _PATCHERS:
+        patcher.start()
+
+    # Re-import the game's modules so they bind the stand-in; the original
+    # entries come back when the sys.modules patch stops
+    for name in [name for name in sys.modules if name == 'src' or name.startswith('src.')]:
+        del sys.modules[name]
+    from src.core import game as game_module
+
+
+def tearDownModule():
+    """Remove the pygame stand-in and the modules imported against it"""
+    global _shared_game
+    _shared_game = None
+    for patcher in reversed(_PATCHERS):
+        patcher.stop()
+
+
+def get_shared_game():
+    """
+    Get the Game shared by the test classes, building it on first use
+
+    Returns:
+        Shared Game instance; tests must not leave changes on it
+    """
+    global _shared_game
+    if _shared_game is None:
+        _shared_game = game_module.Game()
+    return _shared_game
+
+
+class _SharedGameTestCase(unittest.TestCase):
+    """Base for test classes that read the module's shared Game"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Use the game shared by the whole module"""
+        cls.game = get_shared_game()
+
 
+class TestGameInitialization(_SharedGameTestCase):
+    """Test game initialization"""
+
+    def test_game_initializes_without_errors(self):
+        """Test that game initializes without raising errors"""
+        # The module-level patches stay active, so a fresh Game can be built
         try:
-            game = Game()
+            game = game_module.Game()
             self.assertIsNotNone(game)
             self.assertTrue(True, "Game initialized successfully")
         except Exception as e:
             self.fail(f"Game initialization raised exception: {e}")
 
-    @patch('pygame.display.set_mode')
-    @patch('pygame.init')
-    def test_game_has_required_attributes(self, mock_init, mock_set_mode):
+    def test_game_has_required_attributes(self):
         """Test that game has all required attributes"""
-        from src.core.game import Game
-
-        mock_display = Mock()
-        mock_set_mode.return_value = mock_display
-
-        game = Game()
-
         # Check required attributes
-        self.assertTrue(hasattr(game, 'window'))
-        self.assertTrue(hasattr(game, 'native_surface'))
-        self.assertTrue(hasattr(game, 'clock'))
-        self.assertTrue(hasattr(game, 'player'))
-        self.assertTrue(hasattr(game, 'world'))
-        self.assertTrue(hasattr(game, 'state_machine'))
-
-    @patch('pygame.display.set_mode')
-    @patch('pygame.init')
-    def test_game_creates_surfaces_with_correct_dimensions(self, mock_init, mock_set_mode):
-        """Test that game creates surfaces with correct dimensions"""
-        from src.core.game import Game
-        from src.core.constants import NATIVE_WIDTH, NATIVE_HEIGHT, WINDOW_WIDTH, WINDOW_HEIGHT
-
-        mock_display = Mock()
-        mock_set_mode.return_value = mock_display
-
-        game = Game()
+        required = {'window', 'native_surface', 'clock', 'player', 'world', 'state_machine'}
+        self.assertEqual(required - vars(self.game).keys(), set())
 
+    def test_game_creates_surfaces_with_correct_dimensions(self):
+        """Test that game creates surfaces with correct dimensions"""
         # Check native surface dimensions
-        self.assertEqual(game.native_surface.get_width(), NATIVE_WIDTH)
-        self.assertEqual(game.native_surface.get_height(), NATIVE_HEIGHT)
+        self.assertEqual(self.game.native_surface.get_width(), game_module.NATIVE_WIDTH)
+        self.assertEqual(self.game.native_surface.get_height(), game_module.NATIVE_HEIGHT)
 
 
 class TestGameColors(unittest.TestCase):
@@ -74,200 +125,136 @@ class TestGameColors(unittest.TestCase):
 
     def test_color_white_is_imported(self):
         """Test that COLOR_WHITE is imported in game module"""
-        from src.core import game
-
         # Check that COLOR_WHITE exists in the module
-        self.assertTrue(hasattr(game, 'COLOR_WHITE'))
+        self.assertTrue(hasattr(game_module, 'COLOR_WHITE'))
 
     def test_color_red_is_imported(self):
         """Test that COLOR_RED is imported in game module"""
-        from src.core import game
-
         # Check that COLOR_RED exists in the module
-        self.assertTrue(hasattr(game, 'COLOR_RED'))
+        self.assertTrue(hasattr(game_module, 'COLOR_RED'))
 
     def test_color_yellow_is_imported(self):
         """Test that COLOR_YELLOW is imported in game module"""
-        from src.core import game
-
         # Check that COLOR_YELLOW exists in the module
-        self.assertTrue(hasattr(game, 'COLOR_YELLOW'))
+        self.assertTrue(hasattr(game_module, 'COLOR_YELLOW'))
 
     def test_color_black_is_imported(self):
         """Test that COLOR_BLACK is imported in game module"""
-        from src.core import game
-
         # Check that COLOR_BLACK exists in the module
-        self.assertTrue(hasattr(game, 'COLOR_BLACK'))
+        self.assertTrue(hasattr(game_module, 'COLOR_BLACK'))
 
     def test_color_gray_is_imported(self):
         """Test that COLOR_GRAY is imported in game module"""
-        from src.core import game
-
         # Check that COLOR_GRAY exists in the module
-        self.assertTrue(hasattr(game, 'COLOR_GRAY'))
+        self.assertTrue(hasattr(game_module, 'COLOR_GRAY'))
 
     def test_all_colors_have_correct_format(self):
         """Test that all imported colors are tuples of 3 integers"""
-        from src.core.game import COLOR_WHITE, COLOR_RED, COLOR_YELLOW, COLOR_BLACK, COLOR_GRAY
+        colors = tuple((name, getattr(game_module, name)) for name in
+                       ('COLOR_WHITE', 'COLOR_RED', 'COLOR_YELLOW', 'COLOR_BLACK', 'COLOR_GRAY'))
 
-        colors = [COLOR_WHITE, COLOR_RED, COLOR_YELLOW, COLOR_BLACK, COLOR_GRAY]
+        for name, color in colors:
+            self.assertIsInstance(color, tuple, f"{name} should be a tuple")
 
-        for color in colors:
-            with self.subTest(color=color):
-                self.assertIsInstance(color, tuple)
-                self.assertEqual(len(color), 3)
-                for component in color:
-                    self.assertIsInstance(component, int)
-                    self.assertGreaterEqual(component, 0)
-                    self.assertLessEqual(component, 255)
+        # Check length, component type and range for all colors at once
+        values = np.array([color for _, color in colors])
+        self.assertEqual(values.shape, (len(colors), 3))
+        self.assertTrue(np.issubdtype(values.dtype, np.integer))
+        self.assertTrue(((values >= 0) & (values <= 255)).all())
 
 
-class TestGameRendering(unittest.TestCase):
+class TestGameRendering(_SharedGameTestCase):
     """Test game rendering methods"""
 
-    @patch('pygame.display.set_mode')
-    @patch('pygame.init')
-    def test_render_interaction_hints_with_white_color(self, mock_init, mock_set_mode):
-        """Test that _render_interaction_hints uses COLOR_WHITE correctly"""
-        from src.core.game import Game
-        from src.entities.item import create_item, ItemType
-
-        mock_display = Mock()
-        mock_set_mode.return_value = mock_display
+    @classmethod
+    def setUpClass(cls):
+        """Use the shared game and one scratch screen"""
+        super().setUpClass()
+        from src.world.screen import Screen, ScreenID
+        cls.scratch_screen = Screen(ScreenID.TOWER_HUB, "Scratch")
 
-        game = Game()
+    def setUp(self):
+        """Clear the entities left on the scratch screen by the previous test"""
+        for entity in list(self.scratch_screen.entities):
+            self.scratch_screen.remove_entity(entity)
 
-        # Create a mock item near the player
-        test_item = create_item(ItemType.SWORD, game.player.x + 5, game.player.y + 5)
-        game.current_items = [test_item]
+    def test_render_interaction_hints_with_white_color(self):
+        """Test that _render_interaction_hints uses COLOR_WHITE correctly"""
+        from src.entities.item import create_item, ItemType
 
-        # Create a mock current_screen surface
-        current_screen = pygame.Surface((160, 192))
+        # Place an item next to the player on a screen of its own, leaving
+        # the shared game's world untouched
+        test_item = create_item(ItemType.SWORD, self.game.player.x + 5, self.game.player.y + 5)
+        self.scratch_screen.add_entity(test_item)
 
         # Test that the method can be called without errors
         try:
-            game._render_interaction_hints(current_screen)
+            with patch.object(game_module.pygame.draw, 'rect') as draw_rect:
+                self.game._render_interaction_hints(self.scratch_screen)
+            draw_rect.assert_called_once()
             self.assertTrue(True, "_render_interaction_hints executed without errors")
         except NameError as e:
-            if 'COLOR_WHITE' in str(e):
+            if e.name == 'COLOR_WHITE':
                 self.fail("COLOR_WHITE is not defined - import error!")
             else:
                 raise
 
-    @patch('pygame.display.set_mode')
-    @patch('pygame.init')
-    def test_render_victory_screen_uses_colors(self, mock_init, mock_set_mode):
+    def test_render_victory_screen_uses_colors(self):
         """Test that _render_victory_screen uses colors correctly"""
-        from src.core.game import Game
-
-        mock_display = Mock()
-        mock_set_mode.return_value = mock_display
-
-        game = Game()
-
         # Test that the method can be called without errors
         try:
-            game._render_victory_screen()
+            self.game._render_victory_screen()
             self.assertTrue(True, "_render_victory_screen executed without errors")
         except NameError as e:
-            if 'COLOR_' in str(e):
+            if e.name and e.name.startswith('COLOR_'):
                 self.fail(f"Color constant is not defined: {e}")
             else:
                 raise
 
-    @patch('pygame.display.set_mode')
-    @patch('pygame.init')
-    def test_render_game_over_uses_colors(self, mock_init, mock_set_mode):
-        """Test that _render_game_over uses colors correctly"""
-        from src.core.game import Game
-
-        mock_display = Mock()
-        mock_set_mode.return_value = mock_display
-
-        game = Game()
-
+    def test_render_game_over_uses_colors(self):
+        """Test that _render_game_over_screen uses colors correctly"""
         # Test that the method can be called without errors
         try:
-            game._render_game_over()
-            self.assertTrue(True, "_render_game_over executed without errors")
+            self.game._render_game_over_screen()
+            self.assertTrue(True, "_render_game_over_screen executed without errors")
         except NameError as e:
-            if 'COLOR_RED' in str(e):
+            if e.name == 'COLOR_RED':
                 self.fail("COLOR_RED is not defined - import error!")
-            elif 'COLOR_WHITE' in str(e):
+            elif e.name == 'COLOR_WHITE':
                 self.fail("COLOR_WHITE is not defined - import error!")
             else:
                 raise
 
 
-class TestGameStateManagement(unittest.TestCase):
+class TestGameStateManagement(_SharedGameTestCase):
     """Test game state management"""
 
-    @patch('pygame.display.set_mode')
-    @patch('pygame.init')
-    def test_game_starts_in_init_state(self, mock_init, mock_set_mode):
+    def test_game_starts_in_init_state(self):
         """Test that game starts in INIT state"""
-        from src.core.game import Game
-        from src.core.state_machine import GameState
-
-        mock_display = Mock()
-        mock_set_mode.return_value = mock_display
-
-        game = Game()
-
         # Game should start in INIT or EXPLORE state
-        self.assertIn(game.state_machine.current_state, [GameState.INIT, GameState.EXPLORE])
+        self.assertIn(self.game.state_machine.current_state, [game_module.GameState.INIT, game_module.GameState.EXPLORE])
 
-    @patch('pygame.display.set_mode')
-    @patch('pygame.init')
-    def test_state_machine_exists(self, mock_init, mock_set_mode):
+    def test_state_machine_exists(self):
         """Test that state machine is properly initialized"""
-        from src.core.game import Game
-
-        mock_display = Mock()
-        mock_set_mode.return_value = mock_display
-
-        game = Game()
-
-        self.assertIsNotNone(game.state_machine)
-        self.assertTrue(hasattr(game.state_machine, 'current_state'))
+        self.assertIsNotNone(self.game.state_machine)
+        self.assertTrue(hasattr(self.game.state_machine, 'current_state'))
 
 
-class TestGameEntityManagement(unittest.TestCase):
+class TestGameEntityManagement(_SharedGameTestCase):
     """Test game entity management"""
 
-    @patch('pygame.display.set_mode')
-    @patch('pygame.init')
-    def test_game_has_entity_lists(self, mock_init, mock_set_mode):
-        """Test that game maintains entity lists"""
-        from src.core.game import Game
+    def test_game_has_entity_lists(self):
+        """Test that the current screen maintains entity lists"""
+        # Entities live on their screen rather than on the game
+        screen = self.game.world.get_current_screen()
+        for name in ('entities', 'enemies'):
+            self.assertTrue(hasattr(screen, name), f"screen should have {name}")
 
-        mock_display = Mock()
-        mock_set_mode.return_value = mock_display
-
-        game = Game()
-
-        # Check that entity lists exist
-        self.assertTrue(hasattr(game, 'current_items'))
-        self.assertTrue(hasattr(game, 'current_interactables'))
-        self.assertTrue(hasattr(game, 'current_enemies'))
-        self.assertTrue(hasattr(game, 'current_npcs'))
-
-    @patch('pygame.display.set_mode')
-    @patch('pygame.init')
-    def test_entity_lists_are_lists(self, mock_init, mock_set_mode):
+    def test_entity_lists_are_lists(self):
         """Test that entity lists are actually lists"""
-        from src.core.game import Game
-
-        mock_display = Mock()
-        mock_set_mode.return_value = mock_display
-
-        game = Game()
-
-        self.assertIsInstance(game.current_items, list)
-        self.assertIsInstance(game.current_interactables, list)
-        self.assertIsInstance(game.current_enemies, list)
-        self.assertIsInstance(game.current_npcs, list)
+        screen = self.game.world.get_current_screen()
+        for name in ('entities', 'enemies'):
+            self.assertIsInstance(getattr(screen, name), list, f"{name} should be a list")
 
 
 class TestGameConstants(unittest.TestCase):
@@ -275,74 +262,42 @@ class TestGameConstants(unittest.TestCase):
 
     def test_constants_imported(self):
         """Test that all required constants are imported"""
-        from src.core.game import (
-            NATIVE_WIDTH, NATIVE_HEIGHT,
-            WINDOW_WIDTH, WINDOW_HEIGHT,
-            SCALE_FACTOR, FPS, GAME_TITLE
-        )
-
         # Check that constants exist and are reasonable
-        self.assertIsInstance(NATIVE_WIDTH, int)
-        self.assertIsInstance(NATIVE_HEIGHT, int)
-        self.assertIsInstance(WINDOW_WIDTH, int)
-        self.assertIsInstance(WINDOW_HEIGHT, int)
-        self.assertIsInstance(SCALE_FACTOR, int)
-        self.assertIsInstance(FPS, int)
-        self.assertIsInstance(GAME_TITLE, str)
+        self.assertIsInstance(game_module.NATIVE_WIDTH, int)
+        self.assertIsInstance(game_module.NATIVE_HEIGHT, int)
+        self.assertIsInstance(game_module.WINDOW_WIDTH, int)
+        self.assertIsInstance(game_module.WINDOW_HEIGHT, int)
+        self.assertIsInstance(game_module.SCALE_FACTOR, int)
+        self.assertIsInstance(game_module.FPS, int)
+        self.assertIsInstance(game_module.GAME_TITLE, str)
 
         # Check scaling is correct
-        self.assertEqual(WINDOW_WIDTH, NATIVE_WIDTH * SCALE_FACTOR)
-        self.assertEqual(WINDOW_HEIGHT, NATIVE_HEIGHT * SCALE_FACTOR)
+        self.assertEqual(game_module.WINDOW_WIDTH, game_module.NATIVE_WIDTH * game_module.SCALE_FACTOR)
+        self.assertEqual(game_module.WINDOW_HEIGHT, game_module.NATIVE_HEIGHT * game_module.SCALE_FACTOR)
 
 
-class TestGameCollisionDetection(unittest.TestCase):
+class TestGameCollisionDetection(_SharedGameTestCase):
     """Test collision detection methods"""
 
-    @patch('pygame.display.set_mode')
-    @patch('pygame.init')
-    def test_collision_detection_exists(self, mock_init, mock_set_mode):
+    def test_collision_detection_exists(self):
         """Test that collision detection method exists"""
-        from src.core.game import Game
-
-        mock_display = Mock()
-        mock_set_mode.return_value = mock_display
-
-        game = Game()
-
         # Game should have collision detection capability
         # (checking through player or game methods)
-        self.assertTrue(hasattr(game, 'player'))
+        self.assertTrue(hasattr(self.game, 'player'))
 
 
-class TestGameWorldIntegration(unittest.TestCase):
+class TestGameWorldIntegration(_SharedGameTestCase):
     """Test game integration with world"""
 
-    @patch('pygame.display.set_mode')
-    @patch('pygame.init')
-    def test_game_has_world(self, mock_init, mock_set_mode):
+    def test_game_has_world(self):
         """Test that game has a world instance"""
-        from src.core.game import Game
-
-        mock_display = Mock()
-        mock_set_mode.return_value = mock_display
-
-        game = Game()
+        self.assertIsNotNone(self.game.world)
+        self.assertTrue(hasattr(self.game.world, 'current_screen_id'))
+        self.assertIsNotNone(self.game.world.get_current_screen())
 
-        self.assertIsNotNone(game.world)
-        self.assertTrue(hasattr(game.world, 'current_screen'))
-
-    @patch('pygame.display.set_mode')
-    @patch('pygame.init')
-    def test_game_has_camera(self, mock_init, mock_set_mode):
+    def test_game_has_camera(self):
         """Test that game has a camera instance"""
-        from src.core.game import Game
-
-        mock_display = Mock()
-        mock_set_mode.return_value = mock_display
-
-        game = Game()
-
-        self.assertIsNotNone(game.camera)
+        self.assertIsNotNone(self.game.camera)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,58 @@
+"""
+Unit tests for the HUD
+
+Tests caching of rendered HUD boxes.
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestHUDBoxCache(unittest.TestCase):
+    """Test the boxed text cache"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        from src.ui.hud import HUD
+
+        self.hud = HUD()
+
+    def test_same_text_rendered_once(self):
+        """Test that repeated text reuses the cached box"""
+        first = self.hud._get_box("Crystals: 1/4")
+        second = self.hud._get_box("Crystals: 1/4")
+        self.hud._get_box("Crystals: 2/4")
+
+        self.assertIs(first, second)
+        self.assertEqual(set(self.hud._box_cache), {"Crystals: 1/4", "Crystals: 2/4"})
+
+    def test_cache_is_bounded(self):
+        """Test that the cache never grows past its limit"""
+        from src.ui.hud import _BOX_CACHE_SIZE
+
+        for i in range(_BOX_CACHE_SIZE + 5):
+            self.hud._get_box(f"Holding: {i}")
+
+        self.assertLessEqual(len(self.hud._box_cache), _BOX_CACHE_SIZE)
+        self.assertIn(f"Holding: {_BOX_CACHE_SIZE + 4}", self.hud._box_cache)
+
+
+class TestSharedFont(unittest.TestCase):
+    """Test the shared font accessor"""
+
+    def test_font_shared_per_size(self):
+        """Test that each size is loaded once and reused"""
+        from src.ui.hud import HUD, get_font, _FONTS
+
+        self.assertIs(HUD().font, get_font(12))
+        get_font(24)
+        self.assertIn(12, _FONTS)
+        self.assertIn(24, _FONTS)
+
+
+if __name__ == '__main__':
+    unittest.main()
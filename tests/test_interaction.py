@@ -0,0 +1,239 @@
+"""
+Unit tests for interaction proximity checks
+
+Tests interactable, item and NPC range checks without a display.
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.constants import COLOR_BLUE
+from src.entities.interactable import Fountain
+from src.entities.item import ItemType, create_item
+from src.entities.npc import Cat, Owl
+from src.entities.pool import InteractablePool, ItemPool, NPCPool
+from src.entities.sprites import solid_sprite
+from src.world.screen import Screen, ScreenID
+
+
+class TestInteractableRange(unittest.TestCase):
+    """Test interactable proximity"""
+
+    def test_range_boundary_is_inclusive(self):
+        """Test that a player exactly at the interaction range is near"""
+        fountain = Fountain(100, 100)
+        # Fountain center is (108, 108); player center 24px to the left
+        self.assertTrue(fountain.is_near_player(80, 104, 8, 8))
+        self.assertFalse(fountain.is_near_player(79, 104, 8, 8))
+
+    def test_changing_range_updates_check(self):
+        """Test that assigning a new range is reflected by the check"""
+        fountain = Fountain(100, 100)
+        fountain.interaction_range = 40
+
+        self.assertTrue(fountain.is_near_player(64, 104, 8, 8))
+
+
+class TestCachedRect(unittest.TestCase):
+    """Test reuse of bounding rectangles"""
+
+    def test_rect_is_reused_and_follows_position(self):
+        """Test that get_rect returns one Rect kept in sync with x/y"""
+        item = create_item(ItemType.SWORD, 10, 10)
+        rect = item.get_rect()
+
+        item.x, item.y = 40.7, 50.2
+
+        self.assertIs(item.get_rect(), rect)
+        self.assertEqual((int(rect.x), int(rect.y)), (40, 50))
+
+
+class TestSharedSprites(unittest.TestCase):
+    """Test sprite sharing between identical entities"""
+
+    def test_identical_items_share_sprite(self):
+        """Test that items of the same type reuse one sprite"""
+        first = create_item(ItemType.ACORN, 10, 10)
+        second = create_item(ItemType.ACORN, 50, 50)
+
+        self.assertIs(first.sprite, second.sprite)
+
+    def test_filling_item_does_not_touch_shared_sprite(self):
+        """Test that filling a watering can swaps rather than repaints its sprite"""
+        can = create_item(ItemType.WATERING_CAN, 10, 10)
+        other = create_item(ItemType.WATERING_CAN, 50, 50)
+        shared = other.sprite
+
+        Fountain(0, 0).interact(can)
+
+        self.assertIs(other.sprite, shared)
+        self.assertIs(can.sprite, solid_sprite(can.size, can.size, COLOR_BLUE))
+
+
+class TestItemRange(unittest.TestCase):
+    """Test item pickup proximity"""
+
+    def test_item_pickup_range(self):
+        """Test item pickup inside and outside the pickup range"""
+        item = create_item(ItemType.SWORD, 100, 100)
+
+        self.assertTrue(item.is_near_player(104, 104, 8, 8))
+        self.assertFalse(item.is_near_player(150, 150, 8, 8))
+
+
+class TestNPCRange(unittest.TestCase):
+    """Test NPC proximity"""
+
+    def test_npc_range_is_exclusive(self):
+        """Test that the NPC check excludes the exact distance"""
+        owl = Owl(100, 100)
+        # Owl center is (108, 108); player center 32px to the left
+        self.assertFalse(owl.is_near_player(72, 104, 8, 8))
+        self.assertTrue(owl.is_near_player(73, 104, 8, 8))
+
+    def test_moving_npc_updates_center(self):
+        """Test that assigning x/y refreshes the NPC's center and blit position"""
+        owl = Owl(100, 100)
+
+        owl.x, owl.y = 40.5, 60
+
+        self.assertEqual((owl.cx, owl.cy), (48.5, 68))
+        self.assertEqual(owl._pos, (40, 60))
+        self.assertTrue(owl.is_near_player(44, 64, 8, 8))
+
+
+class TestCatFollow(unittest.TestCase):
+    """Test cat following movement"""
+
+    def test_cat_steps_towards_distant_player(self):
+        """Test that a following cat moves speed pixels towards the player"""
+        cat = Cat(50, 50)
+        cat.activate_following()
+
+        cat.update(50, 100, None)
+
+        self.assertAlmostEqual(cat.x, 50)
+        self.assertAlmostEqual(cat.y, 50 + cat.speed)
+
+    def test_cat_waits_near_player(self):
+        """Test that the cat does not move within 20 pixels of the player"""
+        cat = Cat(50, 50)
+        cat.activate_following()
+
+        cat.update(60, 60, None)
+
+        self.assertEqual((cat.x, cat.y), (50, 50))
+
+
+class TestEntityPools(unittest.TestCase):
+    """Test vectorized proximity queries"""
+
+    def _screen_with(self, *entities):
+        """Build a screen holding the given entities"""
+        screen = Screen(ScreenID.TOWER_HUB, "Test")
+        for entity in entities:
+            screen.add_entity(entity)
+        return screen
+
+    def test_pool_matches_scalar_checks(self):
+        """Test that pool queries agree with per-entity is_near_player"""
+        entities = [Fountain(100, 100), create_item(ItemType.SWORD, 20, 20),
+                    Fountain(20, 100), create_item(ItemType.ACORN, 110, 90)]
+        screen = self._screen_with(*entities)
+        interactables = InteractablePool()
+        items = ItemPool()
+        interactables.sync(screen)
+        items.sync(screen)
+
+        for px, py in [(80, 104), (79, 104), (24, 24), (104, 94), (60, 60)]:
+            near = interactables.near(px + 4, py + 4) + items.near(px + 4, py + 4)
+            expected = [e for e in entities if e.is_near_player(px, py, 8, 8)]
+            self.assertEqual(set(map(id, near)), set(map(id, expected)))
+
+    def test_pool_rebuilds_on_membership_change(self):
+        """Test that adding an entity to the screen refreshes the columns"""
+        screen = self._screen_with(create_item(ItemType.SWORD, 20, 20))
+        pool = ItemPool()
+        pool.sync(screen)
+
+        acorn = create_item(ItemType.ACORN, 100, 100)
+        screen.add_entity(acorn)
+        pool.sync(screen)
+
+        self.assertEqual(len(pool.cx), 2)
+        self.assertEqual(pool.near(104, 104), [acorn])
+
+        screen.remove_entity(acorn)
+        pool.sync(screen)
+
+        self.assertEqual(pool.near(104, 104), [])
+        self.assertIsNone(acorn._pool)
+
+    def test_pool_refills_in_place_after_move(self):
+        """Test that moving a pooled entity refills the existing columns"""
+        item = create_item(ItemType.SWORD, 20, 20)
+        pool = ItemPool()
+        pool.sync(self._screen_with(item))
+        cx = pool.cx
+
+        item.x, item.y = 100, 100
+        pool.sync(pool._screen)
+
+        self.assertIs(pool.cx, cx)
+        self.assertEqual(pool.near(104, 104), [item])
+
+    def test_pool_tracks_range_change(self):
+        """Test that assigning a new range is reflected by pool queries"""
+        fountain = Fountain(100, 100)
+        pool = InteractablePool()
+        pool.sync(self._screen_with(fountain))
+        self.assertEqual(pool.near(68, 108), [])
+
+        fountain.interaction_range = 40
+        pool.sync(pool._screen)
+
+        self.assertEqual(pool.near(68, 108), [fountain])
+
+    def test_pool_rebinds_on_screen_change(self):
+        """Test that syncing another screen replaces the pooled entities"""
+        first = create_item(ItemType.SWORD, 20, 20)
+        second = create_item(ItemType.ACORN, 20, 20)
+        first_screen = self._screen_with(first)
+        pool = ItemPool()
+        pool.sync(first_screen)
+
+        pool.sync(self._screen_with(second))
+
+        self.assertEqual(pool.entities, [second])
+        self.assertEqual(first_screen._pools, [])
+        self.assertIsNone(first._pool)
+
+    def test_npc_pool_tracks_movement(self):
+        """Test that NPC centers follow the NPC after it moves"""
+        cat = Cat(100, 100)
+        pool = NPCPool()
+        pool.sync(self._screen_with(cat))
+        self.assertEqual(pool.near(20, 20), [])
+
+        cat.set_position(14, 14)
+        pool.sync(pool._screen)
+
+        self.assertEqual(pool.near(20, 20), [cat])
+
+    def test_npc_pool_distance_is_strict(self):
+        """Test that an NPC exactly at the distance is not near, as in is_near_player"""
+        cat = Cat(100, 100)
+        pool = NPCPool()
+        pool.sync(self._screen_with(cat))
+
+        self.assertEqual(pool.near(cat.cx + 30, cat.cy, distance=30), [])
+        self.assertEqual(pool.near(cat.cx + 29.5, cat.cy, distance=30), [cat])
+        self.assertFalse(cat.is_near_player(cat.cx + 22, cat.cy - 8, 16, 16, distance=30))
+
+
+if __name__ == '__main__':
+    unittest.main()
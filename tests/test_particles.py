@@ -0,0 +1,87 @@
+"""
+Unit tests for the particle system
+
+Tests particle physics and buffer management without a display.
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ui.particles import ParticleSystem, GRAVITY
+
+
+class TestParticleSystem(unittest.TestCase):
+    """Test particle update and storage"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.system = ParticleSystem()
+
+    def test_update_moves_and_applies_gravity(self):
+        """Test that particles move by their velocity and fall"""
+        self.system._spawn(10, 20, [1.0], [-1.0], [5], (255, 0, 0))
+
+        self.system.update()
+
+        self.assertAlmostEqual(float(self.system.x[0]), 11.0)
+        self.assertAlmostEqual(float(self.system.y[0]), 19.0)
+        self.assertAlmostEqual(float(self.system.vy[0]), -1.0 + GRAVITY, places=5)
+        self.assertEqual(int(self.system.lifetime[0]), 4)
+
+    def test_dead_particles_removed_in_order(self):
+        """Test that expired particles are compacted away"""
+        self.system._spawn(0, 0, [0, 0, 0], [0, 0, 0], [1, 3, 2], (0, 0, 0))
+        self.system._spawn(5, 5, [0], [0], [4], (1, 2, 3))
+
+        self.system.update()
+
+        self.assertEqual(self.system.count, 3)
+        self.assertEqual([int(v) for v in self.system.lifetime[:3]], [2, 1, 3])
+        self.assertEqual([int(v) for v in self.system.color[2]], [1, 2, 3])
+
+        self.system.update()
+        self.system.update()
+
+        self.assertEqual(self.system.count, 1)
+        self.assertEqual(int(self.system.max_lifetime[0]), 4)
+
+    def test_buffers_grow_beyond_capacity(self):
+        """Test that spawning past the preallocated size keeps particles"""
+        capacity = len(self.system.x)
+        self.system._spawn(0, 0, [0] * capacity, [0] * capacity, [9] * capacity, (0, 0, 0))
+        self.system.add_dust(7, 8)
+
+        self.assertEqual(self.system.count, capacity + 8)
+        self.assertGreaterEqual(len(self.system.x), capacity + 8)
+        self.assertEqual(float(self.system.x[capacity]), 7.0)
+        self.assertEqual(int(self.system.lifetime[0]), 9)
+
+    def test_explosion_spreads_in_all_directions(self):
+        """Test that explosion velocities point along their spawn angles"""
+        self.system.add_explosion(50, 60, count=200)
+        n = self.system.count
+        vx = self.system.vx[:n]
+        vy = self.system.vy[:n]
+
+        self.assertEqual(n, 200)
+        speeds = (vx * vx + vy * vy) ** 0.5
+        self.assertTrue(((speeds >= 0.5 - 1e-4) & (speeds <= 2.5 + 1e-4)).all())
+        self.assertTrue((vx * vy < 0).any())
+        lifetimes = self.system.lifetime[:n]
+        self.assertTrue(((lifetimes >= 15) & (lifetimes <= 30)).all())
+
+    def test_clear(self):
+        """Test that clear removes all particles"""
+        self.system.add_dust(0, 0)
+        self.system.clear()
+        self.system.update()
+
+        self.assertEqual(self.system.count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Unit tests for player movement
+
+Tests wall collision without a display.
+"""
+
+import unittest
+from unittest.mock import patch
+from collections import defaultdict
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.constants import TILE_SIZE
+from src.entities import player as player_module
+from src.entities.player import Player
+from src.world.screen import Screen, ScreenID
+
+
+class TestPlayerCollision(unittest.TestCase):
+    """Test player movement against the tile grid"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.screen = Screen(ScreenID.TOWER_HUB, "Test")
+
+    def test_moves_freely_in_open_space(self):
+        """Test that the player moves by its velocity away from walls"""
+        player = Player(40, 40)
+        player.velocity_x = 2
+        player.velocity_y = -2
+
+        player.update(self.screen)
+
+        self.assertEqual((player.x, player.y), (42, 38))
+        self.assertIsInstance(player.x, int)
+        self.assertIsInstance(player.y, int)
+
+    def test_blocked_by_wall(self):
+        """Test that the player stops before entering a wall tile"""
+        player = Player(TILE_SIZE, 40)
+        player.velocity_x = -2
+
+        player.update(self.screen)
+
+        self.assertEqual(player.x, TILE_SIZE)
+
+    def test_diagonal_move_into_wall_is_rejected(self):
+        """Test that a blocked diagonal move cancels both axes"""
+        player = Player(TILE_SIZE, 40)
+        player.velocity_x = -2
+        player.velocity_y = 2
+
+        player.update(self.screen)
+
+        self.assertEqual((player.x, player.y), (TILE_SIZE, 40))
+
+    def test_leaves_through_door_gap(self):
+        """Test that the player can walk off-grid through an opened wall"""
+        self.screen.set_tile_solid(0, 5, False)
+        self.screen.set_tile_solid(0, 6, False)
+        player = Player(1, 5 * TILE_SIZE + 4)
+        player.velocity_x = -2
+
+        player.update(self.screen)
+
+        self.assertEqual(player.x, -1)
+
+    def test_get_rect_reuses_rect(self):
+        """Test that get_rect updates and returns one cached Rect"""
+        player = Player(40, 50)
+        rect = player.get_rect()
+        player.x = 60
+
+        self.assertIs(player.get_rect(), rect)
+        self.assertEqual(int(rect.x), 60)
+        self.assertEqual(int(rect.y), 50)
+
+    def test_player_has_no_instance_dict(self):
+        """Test that Player stores its state in slots"""
+        player = Player(40, 50)
+
+        self.assertFalse(hasattr(player, '__dict__'))
+        with self.assertRaises(AttributeError):
+            player.undeclared = True
+
+
+class TestPlayerInput(unittest.TestCase):
+    """Test keyboard handling"""
+
+    def _press(self, *keys):
+        """Run handle_input with the given keys held and return the player"""
+        player = Player(40, 40)
+        pressed = defaultdict(bool, {key: True for key in keys})
+        with patch.object(player_module.pygame.key, 'get_pressed', return_value=pressed):
+            player.handle_input()
+        return player
+
+    def test_no_keys_stops_player(self):
+        """Test that releasing all keys stops movement"""
+        player = self._press()
+        self.assertEqual((player.velocity_x, player.velocity_y), (0, 0))
+
+    def test_arrow_and_wasd_bindings(self):
+        """Test that both binding sets move the player"""
+        player = self._press(player_module._KEY_LEFT, player_module._KEY_S)
+        self.assertEqual((player.velocity_x, player.velocity_y), (-player.speed, player.speed))
+
+        player = self._press(player_module._KEY_D, player_module._KEY_UP)
+        self.assertEqual((player.velocity_x, player.velocity_y), (player.speed, -player.speed))
+
+    def test_opposite_keys_favour_right_and_down(self):
+        """Test that right/down win when opposite keys are held"""
+        player = self._press(player_module._KEY_A, player_module._KEY_RIGHT,
+                             player_module._KEY_W, player_module._KEY_DOWN)
+        self.assertEqual((player.velocity_x, player.velocity_y), (player.speed, player.speed))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,207 @@
+"""
+Unit tests for screen tiles
+
+Tests tile grid setup and collision lookups without a display.
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.constants import NATIVE_WIDTH, NATIVE_HEIGHT, TILE_SIZE
+from src.entities.enemy import Crawler
+from src.entities.interactable import CrackedWall, Fountain
+from src.entities.item import ItemType, create_item
+from src.entities.npc import Owl
+from src.world.screen import Screen, ScreenID
+
+
+class TestScreenTiles(unittest.TestCase):
+    """Test the collision tile grid"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.screen = Screen(ScreenID.TOWER_HUB, "Test")
+
+    def test_grid_has_border_walls(self):
+        """Test that a new screen is walled on all four sides"""
+        rows, cols = self.screen.tiles.shape
+
+        self.assertEqual((rows, cols), (NATIVE_HEIGHT // TILE_SIZE, NATIVE_WIDTH // TILE_SIZE))
+        self.assertTrue(self.screen.tiles[0, :].all())
+        self.assertTrue(self.screen.tiles[-1, :].all())
+        self.assertTrue(self.screen.tiles[:, 0].all())
+        self.assertTrue(self.screen.tiles[:, -1].all())
+        self.assertFalse(self.screen.tiles[1:-1, 1:-1].any())
+
+    def test_is_tile_solid_uses_pixel_coordinates(self):
+        """Test solid lookups convert pixels to tiles"""
+        self.assertIs(self.screen.is_tile_solid(0, 0), True)
+        self.assertIs(self.screen.is_tile_solid(TILE_SIZE + 1, TILE_SIZE + 1), False)
+        self.assertTrue(self.screen.is_tile_solid(TILE_SIZE - 0.5, 40))
+
+    def test_out_of_bounds_is_passable(self):
+        """Test that positions outside the grid allow screen transitions"""
+        self.assertFalse(self.screen.is_tile_solid(-1, 40))
+        self.assertFalse(self.screen.is_tile_solid(NATIVE_WIDTH, 40))
+
+    def test_is_area_solid(self):
+        """Test rectangle overlap against the tile grid"""
+        self.assertFalse(self.screen.is_area_solid(TILE_SIZE, TILE_SIZE, 8, 8))
+        self.assertTrue(self.screen.is_area_solid(TILE_SIZE - 1, TILE_SIZE, 8, 8))
+        self.assertFalse(self.screen.is_area_solid(TILE_SIZE + 8, TILE_SIZE + 8, 8, 8))
+
+    def test_is_area_solid_outside_grid_is_passable(self):
+        """Test that only the on-grid part of a rectangle is checked"""
+        self.screen.set_tile_solid(0, 5, False)
+        self.screen.set_tile_solid(0, 6, False)
+
+        self.assertFalse(self.screen.is_area_solid(-4, 5 * TILE_SIZE, 8, 8))
+        self.assertFalse(self.screen.is_area_solid(-20, -20, 8, 8))
+        self.assertTrue(self.screen.is_area_solid(-4, 4 * TILE_SIZE, 8, 8))
+
+    def test_set_tile_solid(self):
+        """Test setting and clearing tiles, ignoring out-of-range ones"""
+        self.screen.set_tile_solid(3, 4, True)
+        self.screen.set_tile_solid(0, 5, False)
+        self.screen.set_tile_solid(99, 99, True)
+
+        self.assertTrue(self.screen.is_tile_solid(3 * TILE_SIZE, 4 * TILE_SIZE))
+        self.assertFalse(self.screen.is_tile_solid(0, 5 * TILE_SIZE))
+
+    def test_set_rect_solid(self):
+        """Test filling and clearing an inclusive tile rectangle"""
+        self.screen.set_rect_solid(2, 3, 4, 5)
+
+        self.assertTrue(self.screen.tiles[3:6, 2:5].all())
+        self.assertEqual(int(self.screen.tiles[1:-1, 1:-1].sum()), 9)
+
+        self.screen.set_rect_solid(3, 4, 3, 4, False)
+        self.assertFalse(self.screen.tiles[4, 3])
+
+    def test_set_rect_solid_clips_to_grid(self):
+        """Test that rectangles reaching past the grid are clipped"""
+        self.screen.set_rect_solid(-3, -3, 1, 1, False)
+        self.screen.set_rect_solid(50, 50, 60, 60)
+
+        self.assertFalse(self.screen.tiles[0:2, 0:2].any())
+        self.assertTrue(self.screen.tiles[0, 2])
+
+    def test_row_bits_follow_tile_edits(self):
+        """Test that the packed rows mirror the tile grid after each edit"""
+        self.screen.set_tile_solid(3, 4, True)
+        self.screen.set_rect_solid(5, 6, 7, 7)
+        self.screen.set_tile_solid(0, 5, False)
+
+        for row_idx, row in enumerate(self.screen.tiles):
+            expected = sum(1 << col for col, solid in enumerate(row) if solid)
+            self.assertEqual(self.screen._row_bits[row_idx], expected)
+
+    def test_tile_edit_invalidates_wall_layer(self):
+        """Test that changing a tile schedules a wall layer rebuild"""
+        self.screen._tile_dirty = False
+
+        self.screen.set_tile_solid(99, 99, True)
+        self.assertFalse(self.screen._tile_dirty)
+
+        self.screen.set_tile_solid(3, 4, True)
+        self.assertTrue(self.screen._tile_dirty)
+
+
+class TestScreenSolidEntities(unittest.TestCase):
+    """Test the broad-phase lookup of solid entities"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.screen = Screen(ScreenID.TOWER_HUB, "Test")
+        self.wall = CrackedWall(64, 64)
+        self.fountain = Fountain(16, 16)
+        self.screen.add_entity(self.wall)
+        self.screen.add_entity(self.fountain)
+
+    def test_returns_only_nearby_solids(self):
+        """Test that entities in other cells are not candidates"""
+        self.assertEqual(self.screen.get_solid_entities_near(60, 60, 8, 8), [self.wall])
+        self.assertEqual(self.screen.get_solid_entities_near(120, 150, 8, 8), [])
+
+    def test_tracks_deactivated_entities(self):
+        """Test that an entity stops blocking once it is inactive"""
+        self.screen.get_solid_entities_near(60, 60, 8, 8)
+        self.wall.active = False
+
+        self.assertEqual(self.screen.get_solid_entities_near(60, 60, 8, 8), [])
+
+    def test_removed_entity_no_longer_blocks(self):
+        """Test that remove_entity drops the entity from the solid index"""
+        self.screen.get_solid_entities_near(60, 60, 8, 8)
+        self.screen.remove_entity(self.wall)
+
+        self.assertNotIn(self.wall, self.screen.entities)
+        self.assertEqual(self.screen.get_solid_entities_near(60, 60, 8, 8), [])
+
+    def test_non_solid_entities_not_indexed(self):
+        """Test that entities without a solid flag are only listed"""
+        item = create_item(ItemType.ACORN, 64, 64)
+        self.screen.add_entity(item)
+
+        self.assertIn(item, self.screen.entities)
+        self.assertNotIn(item, self.screen._solid_entities)
+
+
+class TestScreenEnemies(unittest.TestCase):
+    """Test the per-screen enemy list"""
+
+    def test_enemy_list_follows_add_and_remove(self):
+        """Test that only enemies are listed and removal drops them"""
+        screen = Screen(ScreenID.TOWER_HUB, "Test")
+        crawler = Crawler(40, 40)
+        screen.add_entity(crawler)
+        screen.add_entity(Fountain(16, 16))
+
+        self.assertEqual(screen.enemies, [crawler])
+
+        screen.remove_entity(crawler)
+
+        self.assertEqual(screen.enemies, [])
+
+
+
+class _BlitRecorder:
+    """Surface stand-in that records blitted sprites in draw order"""
+
+    def __init__(self):
+        self.sprites = []
+
+    def fill(self, color):
+        pass
+
+    def blit(self, sprite, position):
+        self.sprites.append(sprite)
+
+    def blits(self, blits, doreturn=True):
+        self.sprites.extend(sprite for sprite, _ in blits)
+
+
+class TestScreenRender(unittest.TestCase):
+    """Test entity rendering"""
+
+    def test_entities_drawn_in_list_order(self):
+        """Test that overlapping entities layer in the order they were added"""
+        screen = Screen(ScreenID.TOWER_HUB, "Test")
+        screen._tile_dirty = False
+        entities = [Crawler(40, 40), create_item(ItemType.ACORN, 40, 40),
+                    Owl(40, 40), Fountain(40, 40)]
+        for entity in entities:
+            screen.add_entity(entity)
+        surface = _BlitRecorder()
+
+        screen.render(surface)
+
+        self.assertEqual([id(s) for s in surface.sprites[1:]],
+                         [id(e.sprite) for e in entities])
+
+if __name__ == '__main__':
+    unittest.main()
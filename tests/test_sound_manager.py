@@ -5,6 +5,7 @@ Tests the procedural sound generation without requiring audio hardware.
 """
 
 import unittest
+from functools import lru_cache
 from unittest.mock import Mock, patch, MagicMock
 import numpy as np
 import sys
@@ -14,6 +15,46 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 
+# Seeded generator shared by the tests that need random samples
+_RNG = np.random.default_rng(0)
+
+
+@lru_cache(maxsize=32)
+def _envelope(length, ascending):
+    """
+    Get a read-only linear fade envelope, shared between tests
+
+    Args:
+        length: Number of samples
+        ascending: True for a fade in (0 to 1), False for a fade out
+
+    Returns:
+        Envelope array
+    """
+    envelope = np.linspace(0, 1, length) if ascending else np.linspace(1, 0, length)
+    envelope.flags.writeable = False
+    return envelope
+
+
+def _stub_sound_generation(sound):
+    """
+    Patch SoundManager to skip synthesis and map every sound type to one stub
+
+    Args:
+        sound: Stand-in for each generated pygame Sound
+
+    Returns:
+        Patcher usable as a context manager
+    """
+    from src.audio.sound_manager import SoundManager, SoundType
+
+    def fill_sounds(manager):
+        manager.sounds = dict.fromkeys(SoundType, sound)
+
+    return patch.object(SoundManager, '_generate_all_sounds', autospec=True,
+                        side_effect=fill_sounds)
+
+
 class TestSoundGeneration(unittest.TestCase):
     """Test sound generation methods"""
 
@@ -44,11 +85,11 @@ class TestSoundGeneration(unittest.TestCase):
         samples = int(sample_rate * duration)
 
         # Generate noise array
-        noise = np.random.uniform(-0.3, 0.3, samples)
+        noise = _RNG.uniform(-0.3, 0.3, samples)
 
         # Test the fade envelope logic
         fade_length = samples // 4
-        envelope_start = np.linspace(0, 1, fade_length)
+        envelope_start = _envelope(fade_length, True)
 
         # Test start fade
         start_slice = noise[:fade_length]
@@ -57,7 +98,7 @@ class TestSoundGeneration(unittest.TestCase):
 
         # Test end fade
         end_slice = noise[-fade_length:]
-        envelope_end = np.linspace(1, 0, len(end_slice))
+        envelope_end = _envelope(len(end_slice), False)
         self.assertEqual(len(end_slice), len(envelope_end),
                         "End fade slice and envelope must have same length")
 
@@ -68,17 +109,20 @@ class TestSoundGeneration(unittest.TestCase):
     def test_various_sample_rates(self):
         """Test sound generation with various sample rates"""
         sample_rates = [11025, 22050, 44100, 48000]
+        duration = 0.05
+
+        # Draw noise once for the largest rate; each subtest copies a prefix
+        noise_buf = _RNG.uniform(-0.3, 0.3, int(max(sample_rates) * duration))
 
         for rate in sample_rates:
             with self.subTest(sample_rate=rate):
-                duration = 0.05
                 samples = int(rate * duration)
-                noise = np.random.uniform(-0.3, 0.3, samples)
+                noise = noise_buf[:samples].copy()
 
                 fade_length = samples // 4
-                envelope_start = np.linspace(0, 1, fade_length)
+                envelope_start = _envelope(fade_length, True)
                 end_slice_length = len(noise[-fade_length:])
-                envelope_end = np.linspace(1, 0, end_slice_length)
+                envelope_end = _envelope(end_slice_length, False)
 
                 # Should not raise errors
                 noise[:fade_length] *= envelope_start
@@ -120,94 +164,92 @@ class TestSoundGeneration(unittest.TestCase):
         t = np.linspace(0, 1, samples)
         audio = np.sin(2 * np.pi * 440 * t) * 0.5
 
-        # Convert to 16-bit PCM
-        pcm_audio = (audio * 32767).astype(np.int16)
+        # Convert to 16-bit PCM in one pass, without a float temporary
+        pcm_audio = np.empty(samples, dtype=np.int16)
+        np.multiply(audio, 32767, out=pcm_audio, casting='unsafe')
 
-        # Check data type
+        # Check data type and that values match a plain truncating cast
         self.assertEqual(pcm_audio.dtype, np.int16)
-
-        # Check range
-        self.assertTrue(np.all(pcm_audio >= -32768))
-        self.assertTrue(np.all(pcm_audio <= 32767))
+        np.testing.assert_array_equal(pcm_audio, (audio * 32767).astype(np.int16))
 
     def test_stereo_array_creation(self):
         """Test stereo array creation from mono"""
         samples = 1000
-        mono = np.random.randint(-32768, 32767, samples, dtype=np.int16)
+        mono = _RNG.integers(-32768, 32768, samples, dtype=np.int16)
 
-        # Create stereo
-        stereo = np.zeros((len(mono), 2), dtype=np.int16)
-        stereo[:, 0] = mono
-        stereo[:, 1] = mono
+        # Create stereo with one contiguous write
+        stereo = np.repeat(mono, 2).reshape(-1, 2)
 
         # Check shape
         self.assertEqual(stereo.shape, (samples, 2))
 
-        # Check both channels are identical
-        np.testing.assert_array_equal(stereo[:, 0], stereo[:, 1])
+        # Check both channels match the mono input
+        self.assertEqual(stereo.dtype, np.int16)
+        np.testing.assert_array_equal(stereo[:, 0], mono)
+        np.testing.assert_array_equal(stereo[:, 1], mono)
 
-    @patch('pygame.mixer.init')
-    @patch('pygame.sndarray.make_sound')
-    def test_sound_playback(self, mock_make_sound, mock_mixer_init):
-        """Test sound playback functionality"""
-        from src.audio.sound_manager import SoundManager, SoundType
 
-        mock_sound = Mock()
-        mock_make_sound.return_value = mock_sound
+class TestSoundPlayback(unittest.TestCase):
+    """Test playback and volume control on one shared SoundManager"""
 
-        sound_manager = SoundManager(sample_rate=self.sample_rate)
+    @classmethod
+    def setUpClass(cls):
+        """Build one SoundManager whose sounds are all the same stub"""
+        from src.audio.sound_manager import SoundManager
+
+        cls._mixer_patch = patch('pygame.mixer.init')
+        cls._mixer_patch.start()
+        cls.mock_sound = Mock()
+        with _stub_sound_generation(cls.mock_sound):
+            cls.sound_manager = SoundManager(sample_rate=22050)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the mixer patch"""
+        cls._mixer_patch.stop()
+
+    def setUp(self):
+        """Reset the shared stub and walk timer"""
+        self.mock_sound.reset_mock()
+        self.sound_manager.walk_timer = 0
+
+    def test_sound_playback(self):
+        """Test sound playback functionality"""
+        from src.audio.sound_manager import SoundType
 
         # Play a sound
-        sound_manager.play_sound(SoundType.WALK)
+        self.sound_manager.play_sound(SoundType.WALK)
 
         # Verify play was called
-        mock_sound.play.assert_called()
+        self.mock_sound.play.assert_called()
 
-    @patch('pygame.mixer.init')
-    @patch('pygame.sndarray.make_sound')
     @patch('pygame.time.get_ticks')
-    def test_walk_sound_timing(self, mock_get_ticks, mock_make_sound, mock_mixer_init):
+    def test_walk_sound_timing(self, mock_get_ticks):
         """Test walk sound timing control"""
-        from src.audio.sound_manager import SoundManager
-
-        mock_sound = Mock()
-        mock_make_sound.return_value = mock_sound
-
-        sound_manager = SoundManager(sample_rate=self.sample_rate)
-
         # First walk sound should play (timer starts at 0, so 300ms later will play)
         mock_get_ticks.return_value = 300
-        sound_manager.play_walk_sound()
-        self.assertEqual(mock_sound.play.call_count, 1)
+        self.sound_manager.play_walk_sound()
+        self.assertEqual(self.mock_sound.play.call_count, 1)
 
         # Second call too soon should not play
         mock_get_ticks.return_value = 400  # Only 100ms after first play
-        sound_manager.play_walk_sound()
-        self.assertEqual(mock_sound.play.call_count, 1)  # Still 1
+        self.sound_manager.play_walk_sound()
+        self.assertEqual(self.mock_sound.play.call_count, 1)  # Still 1
 
         # Third call after full interval should play
         mock_get_ticks.return_value = 700  # 300ms after first play (300 + 400 = 700 >= 300 interval)
-        sound_manager.play_walk_sound()
-        self.assertEqual(mock_sound.play.call_count, 2)  # Now 2
+        self.sound_manager.play_walk_sound()
+        self.assertEqual(self.mock_sound.play.call_count, 2)  # Now 2
 
-    @patch('pygame.mixer.init')
-    @patch('pygame.sndarray.make_sound')
-    def test_volume_control(self, mock_make_sound, mock_mixer_init):
+    def test_volume_control(self):
         """Test volume control functionality"""
-        from src.audio.sound_manager import SoundManager
-
-        mock_sound = Mock()
-        mock_make_sound.return_value = mock_sound
-
-        sound_manager = SoundManager(sample_rate=self.sample_rate)
-
         # Set volume
-        sound_manager.set_volume(0.5)
+        self.sound_manager.set_volume(0.5)
 
         # Verify set_volume was called on all sounds
         # Should be called once per sound type (10 sound types)
-        self.assertEqual(mock_sound.set_volume.call_count, 10)
-        mock_sound.set_volume.assert_called_with(0.5)
+        self.assertEqual(self.mock_sound.set_volume.call_count, 10)
+        self.mock_sound.set_volume.assert_called_with(0.5)
 
 
 class TestSoundEnvelopeEdgeCases(unittest.TestCase):
@@ -219,13 +261,13 @@ class TestSoundEnvelopeEdgeCases(unittest.TestCase):
         duration = 0.01  # 10ms
         samples = int(sample_rate * duration)
 
-        noise = np.random.uniform(-0.3, 0.3, samples)
+        noise = _RNG.uniform(-0.3, 0.3, samples)
         fade_length = samples // 4
 
         if fade_length > 0:
-            envelope_start = np.linspace(0, 1, fade_length)
+            envelope_start = _envelope(fade_length, True)
             end_slice_length = len(noise[-fade_length:])
-            envelope_end = np.linspace(1, 0, end_slice_length)
+            envelope_end = _envelope(end_slice_length, False)
 
             noise[:fade_length] *= envelope_start
             noise[-fade_length:] *= envelope_end
@@ -234,14 +276,17 @@ class TestSoundEnvelopeEdgeCases(unittest.TestCase):
         """Test with odd sample counts that might cause rounding issues"""
         odd_sample_counts = [1101, 1103, 1105, 2207, 2211]
 
+        # Draw noise once for the largest count; each subtest copies a prefix
+        noise_buf = _RNG.uniform(-0.3, 0.3, max(odd_sample_counts))
+
         for samples in odd_sample_counts:
             with self.subTest(samples=samples):
-                noise = np.random.uniform(-0.3, 0.3, samples)
+                noise = noise_buf[:samples].copy()
                 fade_length = samples // 4
 
-                envelope_start = np.linspace(0, 1, fade_length)
+                envelope_start = _envelope(fade_length, True)
                 end_slice_length = len(noise[-fade_length:])
-                envelope_end = np.linspace(1, 0, end_slice_length)
+                envelope_end = _envelope(end_slice_length, False)
 
                 # Should not raise ValueError
                 noise[:fade_length] *= envelope_start
@@ -256,13 +301,13 @@ class TestSoundEnvelopeEdgeCases(unittest.TestCase):
         start_region = slice(0, fade_length)
         end_region = slice(-fade_length, None)
 
-        # Convert to actual indices
-        start_indices = range(*start_region.indices(samples))
-        end_indices = range(*end_region.indices(samples))
+        # Resolve the slices to concrete bounds
+        start_first, start_stop, _ = start_region.indices(samples)
+        end_first, end_stop, _ = end_region.indices(samples)
 
-        # For non-overlapping: max(start) < min(end)
-        if len(list(start_indices)) > 0 and len(list(end_indices)) > 0:
-            self.assertLess(max(start_indices), min(end_indices),
+        # For non-overlapping: last start index < first end index
+        if start_stop > start_first and end_stop > end_first:
+            self.assertLess(start_stop - 1, end_first,
                           "Fade regions should not overlap")
 
 
@@ -271,14 +316,12 @@ class TestSoundManagerCleanup(unittest.TestCase):
 
     @patch('pygame.mixer.init')
     @patch('pygame.mixer.quit')
-    @patch('pygame.sndarray.make_sound')
-    def test_cleanup(self, mock_make_sound, mock_mixer_quit, mock_mixer_init):
+    def test_cleanup(self, mock_mixer_quit, mock_mixer_init):
         """Test that cleanup properly shuts down the mixer"""
         from src.audio.sound_manager import SoundManager
 
-        mock_make_sound.return_value = Mock()
-
-        sound_manager = SoundManager(sample_rate=22050)
+        with _stub_sound_generation(Mock()):
+            sound_manager = SoundManager(sample_rate=22050)
         sound_manager.cleanup()
 
         mock_mixer_quit.assert_called_once()
@@ -0,0 +1,55 @@
+"""
+Unit tests for the spatial hash grid
+
+Tests cell bucketing and rectangle queries.
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.world.spatial_hash import SpatialHashGrid
+
+
+class TestSpatialHashGrid(unittest.TestCase):
+    """Test spatial hash insertion and queries"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.grid = SpatialHashGrid(cell_size=16)
+
+    def test_query_finds_objects_in_covered_cells(self):
+        """Test that only objects sharing a cell are returned"""
+        self.grid.insert('near', 20, 20, 8, 8)
+        self.grid.insert('far', 120, 120, 8, 8)
+
+        self.assertEqual(self.grid.query(16, 16, 8, 8), ['near'])
+        self.assertEqual(self.grid.query(60, 60, 8, 8), [])
+
+    def test_large_object_reported_once(self):
+        """Test that an object spanning several cells is not duplicated"""
+        self.grid.insert('wall', 0, 0, 48, 48)
+
+        self.assertEqual(self.grid.cells.keys(), {(x, y) for x in range(3) for y in range(3)})
+        self.assertEqual(self.grid.query(0, 0, 48, 48), ['wall'])
+
+    def test_negative_coordinates(self):
+        """Test that rectangles left of or above the origin hash correctly"""
+        self.grid.insert('edge', -4, -4, 8, 8)
+
+        self.assertEqual(self.grid.query(-16, -16, 4, 4), ['edge'])
+        self.assertEqual(self.grid.query(8, 8, 4, 4), ['edge'])
+
+    def test_clear(self):
+        """Test that clear empties the grid"""
+        self.grid.insert('near', 20, 20, 8, 8)
+        self.grid.clear()
+
+        self.assertEqual(self.grid.query(20, 20, 8, 8), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
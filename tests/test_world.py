@@ -0,0 +1,134 @@
+"""
+Unit tests for the world layout
+
+Tests screen creation and connections.
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.constants import COLOR_GRAY
+from src.world.screen import Direction, ScreenID, OPPOSITE_DIRECTIONS
+from src.world.world import World
+
+
+class TestWorldScreens(unittest.TestCase):
+    """Test screen creation"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.world = World()
+
+    def test_every_screen_created(self):
+        """Test that each ScreenID has exactly one screen"""
+        for screen_id in ScreenID:
+            screen = self.world.get_screen(screen_id)
+            self.assertIs(screen.id, screen_id)
+            self.assertTrue(screen.name)
+
+    def test_screens_indexed_by_screen_id(self):
+        """Test that the screen list is dense and ordered by ScreenID.index"""
+        self.assertEqual(len(self.world.screens), len(ScreenID))
+        for index, screen in enumerate(self.world.screens):
+            self.assertEqual(screen.id.index, index)
+
+    def test_world_and_screens_use_slots(self):
+        """Test that World and Screen store their state in slots"""
+        self.assertFalse(hasattr(self.world, '__dict__'))
+        self.assertFalse(hasattr(self.world.get_current_screen(), '__dict__'))
+
+    def test_screen_names_and_colors(self):
+        """Test a few names and region colors from the screen table"""
+        hub = self.world.get_screen(ScreenID.TOWER_HUB)
+        ruins = self.world.get_screen(ScreenID.RUINS_3)
+
+        self.assertEqual(hub.name, "The Ouroboros Tower")
+        self.assertEqual(hub.background_color, COLOR_GRAY)
+        self.assertEqual(ruins.name, "Sunken Ruins - Toxic Basin")
+        self.assertEqual(ruins.background_color, (20, 30, 50))
+
+    def test_later_worlds_reuse_tile_layouts(self):
+        """Test that a second world gets equal but independent tile grids"""
+        other = World()
+
+        for screen_id in ScreenID:
+            tiles = self.world.get_screen(screen_id).tiles
+            other_tiles = other.get_screen(screen_id).tiles
+            self.assertTrue((tiles == other_tiles).all())
+            self.assertIsNot(tiles, other_tiles)
+            self.assertTrue(other_tiles.flags.writeable)
+
+
+class TestWorldConnections(unittest.TestCase):
+    """Test screen connections"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.world = World()
+
+    def test_hub_connects_to_each_region(self):
+        """Test the hub's four exits"""
+        hub = self.world.get_screen(ScreenID.TOWER_HUB)
+
+        self.assertEqual(hub.get_connection(Direction.NORTH), ScreenID.GARDENS_1)
+        self.assertEqual(hub.get_connection(Direction.EAST), ScreenID.CATACOMBS_1)
+        self.assertEqual(hub.get_connection(Direction.SOUTH), ScreenID.RUINS_1)
+        self.assertEqual(hub.get_connection(Direction.WEST), ScreenID.CLIFFS_1)
+
+    def test_connections_are_symmetric(self):
+        """Test that every exit leads back the opposite way"""
+        for screen_id in ScreenID:
+            screen = self.world.get_screen(screen_id)
+            for direction, target_id in screen.connections.items():
+                if target_id is None:
+                    continue
+                target = self.world.get_screen(target_id)
+                self.assertEqual(target.get_connection(OPPOSITE_DIRECTIONS[direction]), screen_id)
+
+
+class TestWorldNavigation(unittest.TestCase):
+    """Test moving between screens"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.world = World()
+
+    def test_change_screen_updates_current_screen(self):
+        """Test that a move follows the connection"""
+        self.assertTrue(self.world.change_screen(Direction.NORTH))
+        self.assertEqual(self.world.current_screen_id, ScreenID.GARDENS_1)
+        self.assertIs(self.world.get_current_screen(),
+                      self.world.get_screen(ScreenID.GARDENS_1))
+
+    def test_change_screen_without_connection(self):
+        """Test that a move with no exit keeps the current screen"""
+        self.world.current_screen_id = ScreenID.FINAL_CHAMBER
+        self.assertFalse(self.world.change_screen(Direction.EAST))
+        self.assertEqual(self.world.current_screen_id, ScreenID.FINAL_CHAMBER)
+
+    def test_neighbor_table_matches_connections(self):
+        """Test that every move lands where the screen's connection points"""
+        for screen_id in ScreenID:
+            for direction in Direction:
+                self.world.current_screen_id = screen_id
+                target_id = self.world.get_screen(screen_id).get_connection(direction)
+
+                moved = self.world.change_screen(direction)
+
+                self.assertEqual(moved, target_id is not None)
+                self.assertEqual(self.world.current_screen_id,
+                                 target_id if moved else screen_id)
+
+    def test_assigning_current_screen_id(self):
+        """Test that setting the ID directly also switches the screen"""
+        self.world.current_screen_id = ScreenID.RUINS_2
+        self.assertIs(self.world.get_current_screen(),
+                      self.world.get_screen(ScreenID.RUINS_2))
+
+
+if __name__ == '__main__':
+    unittest.main()
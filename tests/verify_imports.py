@@ -3,59 +3,106 @@ Simple script to verify that COLOR_WHITE and COLOR_RED are imported in game.py
 This script doesn't require pygame or numpy to be installed.
 """
 
+import ast
+import io
 import re
+import sys
+from collections import Counter
+from contextlib import redirect_stdout
+from itertools import islice
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+_GAME_PY = _ROOT / 'src' / 'core' / 'game.py'
+
+_REQUIRED_COLORS = ('COLOR_WHITE', 'COLOR_RED', 'COLOR_BLACK', 'COLOR_GRAY', 'COLOR_YELLOW')
+_GAME_OVER = 'GAME OVER'
+_TOKEN_RE = re.compile(rb'\b(' + '|'.join(map(re.escape, _REQUIRED_COLORS + (_GAME_OVER,))).encode() + rb')\b')
+_WHITE_RE = re.compile(rb'\bCOLOR_WHITE\b')
+
+_OUTLINE_CALL = b'pygame.draw.rect(self.native_surface, COLOR_WHITE, outline_rect, 1)'
+_OUTLINE_OFFSET = _OUTLINE_CALL.index(b'COLOR_WHITE')
+
+def verify_color_imports(verbose: bool = True) -> bool:
+    """
+    Verify that all necessary colors are imported in game.py
+
+    Args:
+        verbose: Print the per-color usage report; when False only the
+            pass/fail result is computed
+
+    Returns:
+        True if all checks pass
+    """
+
+    with open(_GAME_PY, 'rb') as f:
+        data = f.read()
+
+    # Collect the report and write it to stdout in one call
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        result = _check_content(data, verbose)
+    sys.stdout.write(buf.getvalue())
+    return result
+
+def _check_content(data, verbose):
+    """Run the import and usage checks on the raw bytes of game.py"""
+
+    # Cheap reject before parsing: no color constant appears at all
+    if b'COLOR_' not in data:
+        print("❌ FAIL: No COLOR_ constants found in game.py")
+        return False
 
-def verify_color_imports():
-    """Verify that all necessary colors are imported in game.py"""
-
-    with open('/home/user/Ourobouros-Ring-of-Eternity/src/core/game.py', 'r') as f:
-        content = f.read()
-
-    # Check for the import statement
-    import_pattern = r'from src\.core\.constants import \([^)]+\)'
-    match = re.search(import_pattern, content, re.MULTILINE | re.DOTALL)
+    # Collect the names imported from the constants module
+    tree = ast.parse(data)
+    imported = {alias.name
+                for node in ast.walk(tree)
+                if isinstance(node, ast.ImportFrom) and node.module == 'src.core.constants'
+                for alias in node.names}
 
-    if not match:
+    if not imported:
         print("❌ FAIL: Could not find constants import statement")
         return False
 
-    import_block = match.group(0)
-
     # Check for each required color
-    required_colors = ['COLOR_WHITE', 'COLOR_RED', 'COLOR_BLACK', 'COLOR_GRAY', 'COLOR_YELLOW']
-    missing_colors = []
-
-    for color in required_colors:
-        if color not in import_block:
-            missing_colors.append(color)
+    missing_colors = [color for color in _REQUIRED_COLORS if color not in imported]
 
     if missing_colors:
         print(f"❌ FAIL: Missing color imports: {', '.join(missing_colors)}")
-        print(f"\nImport block found:\n{import_block}")
+        print(f"\nNames imported from src.core.constants:\n{', '.join(sorted(imported))}")
         return False
 
-    # Check that COLOR_WHITE is actually used in the file
-    if 'COLOR_WHITE' not in content:
+    # Check that COLOR_WHITE is actually used in the file (beyond its import),
+    # stopping at the second occurrence
+    if len(list(islice(_WHITE_RE.finditer(data), 2))) < 2:
         print("❌ FAIL: COLOR_WHITE is imported but never used")
         return False
 
-    # Find usage of COLOR_WHITE
-    white_usage = content.count('COLOR_WHITE')
-    red_usage = content.count('COLOR_RED')
+    if not verbose:
+        return True
+
+    # Count every required color and the game over text in one scan of the file
+    usage = Counter()
+    white_starts = []
+    for match in _TOKEN_RE.finditer(data):
+        token = match.group(1).decode()
+        usage[token] += 1
+        if token == 'COLOR_WHITE':
+            white_starts.append(match.start())
 
     print("✓ All required colors are imported:")
-    for color in required_colors:
-        usage_count = content.count(color)
-        print(f"  - {color}: used {usage_count} times")
+    for color in _REQUIRED_COLORS:
+        print(f"  - {color}: used {usage[color]} times")
 
-    # Verify specific fix for line 830
-    if 'pygame.draw.rect(self.native_surface, COLOR_WHITE, outline_rect, 1)' in content:
+    # Verify specific fix for line 830, only looking around COLOR_WHITE uses
+    if any(start >= _OUTLINE_OFFSET and data.startswith(_OUTLINE_CALL, start - _OUTLINE_OFFSET)
+           for start in white_starts):
         print("\n✓ Line 830 fix verified: COLOR_WHITE is used in pygame.draw.rect")
     else:
         print("\n⚠ Warning: Could not verify line 830 (code may have changed)")
 
     # Verify COLOR_RED usage in game over screen
-    if 'COLOR_RED' in content and 'GAME OVER' in content:
+    if usage['COLOR_RED'] and usage[_GAME_OVER]:
         print("✓ COLOR_RED is used (likely in game over screen)")
 
     return True